@@ -1,3 +1,6 @@
 # -*- coding: utf-8 -*-
 
+from . import controllers
 from . import models
+from . import wizard
+from .hooks import pre_init_hook, post_init_hook
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 {
     'name': 'Dayflow HRMS',
-    'version': '17.0.1.0.0',
+    'version': '17.0.1.1.0',
     'category': 'Human Resources',
     'summary': 'Complete Human Resource Management System',
     'description': """
@@ -26,10 +26,12 @@
         'hr',
         'hr_attendance',
         'hr_holidays',
+        'bus',
     ],
     'data': [
         # Security
         'security/ir.model.access.csv',
+        'security/dayflow_security.xml',
         
         # Views
         'views/employee_views.xml',
@@ -38,14 +40,30 @@
         # 'views/payroll_views.xml',  # Requires hr_payroll module (Enterprise)
         'views/performance_views.xml',
         'views/menu_views.xml',
+        'views/job_views.xml',
+        'views/perf_stat_views.xml',
+        'views/attendance_report_templates.xml',
+        'views/analytics_views.xml',
+        
+        # Wizards
+        'wizard/performance_review_cycle_views.xml',
+        'wizard/attendance_report_batch_views.xml',
         
         # Data
         'data/performance_data.xml',
+        'data/notification_data.xml',
+        'data/attendance_status_data.xml',
+        'data/job_data.xml',
+        'data/instrumentation_data.xml',
+        'data/report_refresh_data.xml',
+        'data/analytics_data.xml',
     ],
     'demo': [
         'data/demo_data.xml',
     ],
     'images': ['static/description/banner.png'],
+    'pre_init_hook': 'pre_init_hook',
+    'post_init_hook': 'post_init_hook',
     'installable': True,
     'application': True,
     'auto_install': False,
@@ -0,0 +1,5 @@
+# -*- coding: utf-8 -*-
+
+from . import api
+from . import dashboard
+from . import notification
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+
+from odoo import api, fields, http, _
+from odoo.api import call_kw
+from odoo.exceptions import AccessDenied, UserError
+from odoo.http import content_disposition, request
+from odoo.models import check_method_name
+from odoo.modules.registry import Registry
+
+from ..models.dayflow_export import EXPORT_FORMATS
+from ..models.dayflow_perf_stat import instrument_route
+
+MAX_BATCH_CALLS = 50
+REFERENCE_KEY = '$ref'
+
+
+def _follow_path(value, keys):
+    """ Walk ``keys`` into a call result; ``*`` maps the rest of the path over a list. """
+    if not keys:
+        return value
+    key, rest = keys[0], keys[1:]
+    if key == '*':
+        return [_follow_path(item, rest) for item in value or []]
+    try:
+        value = value[int(key)] if isinstance(value, list) else value[key]
+    except (IndexError, KeyError, TypeError, ValueError):
+        # e.g. the employee lookup matched nothing: later domains simply match nothing too
+        return False
+    return _follow_path(value, rest)
+
+
+def resolve_references(value, results):
+    """ Replace every ``{"$ref": "<call index>.<path>"}`` in ``value`` by the referenced result. """
+    if isinstance(value, dict):
+        if set(value) == {REFERENCE_KEY}:
+            index, *keys = str(value[REFERENCE_KEY]).split('.')
+            if not index.isdigit() or int(index) >= len(results):
+                raise UserError(_('Batch calls can only reference the results of earlier calls.'))
+            return _follow_path(results[int(index)], keys)
+        return {key: resolve_references(item, results) for key, item in value.items()}
+    if isinstance(value, list):
+        return [resolve_references(item, results) for item in value]
+    return value
+
+
+class DayflowApiController(http.Controller):
+
+    def _authenticate_token(self):
+        """ Switch the request environment to the owner of the bearer token. """
+        header = request.httprequest.headers.get('Authorization', '')
+        scheme, _sep, token = header.partition(' ')
+        uid = token and scheme.lower() == 'bearer' and \
+            request.env['dayflow.api.token'].sudo()._check_token(token)
+        if not uid:
+            raise AccessDenied(_('Invalid or expired API token.'))
+        request.update_env(user=uid)
+        return token
+
+    @http.route('/dayflow/api/session', type='json', auth='none', csrf=False)
+    @instrument_route
+    def create_session(self, uid, password):
+        """ Exchange the password for a short-lived API token (one hash check per token). """
+        request.env['res.users'].check(request.db, uid, password)
+        token, expiration = request.env['dayflow.api.token'].sudo()._issue_token(uid)
+        return {'token': token, 'expires_at': fields.Datetime.to_string(expiration)}
+
+    @http.route('/dayflow/api/session/revoke', type='json', auth='none', csrf=False)
+    @instrument_route
+    def revoke_session(self):
+        token = self._authenticate_token()
+        request.env['dayflow.api.token'].sudo()._revoke_token(token)
+        return True
+
+    @http.route('/dayflow/api/call', type='json', auth='none', csrf=False)
+    @instrument_route
+    def call(self, model, method, args=None, kwargs=None):
+        """ Same contract as ``execute_kw``, authenticated by the bearer token. """
+        self._authenticate_token()
+        check_method_name(method)
+        return call_kw(request.env[model], method, args or [], kwargs or {})
+
+    @http.route('/dayflow/api/batch', type='json', auth='none', csrf=False)
+    @instrument_route
+    def batch(self, calls):
+        """ Run an ordered list of model calls in one request and one transaction.
+
+        Each call is ``{"model", "method", "args", "kwargs"}``; arguments may embed
+        ``{"$ref": "0.0.id"}`` to use the result of an earlier call. Any failure rolls
+        back the whole batch.
+        """
+        self._authenticate_token()
+        if len(calls) > MAX_BATCH_CALLS:
+            raise UserError(_('A batch is limited to %s calls.', MAX_BATCH_CALLS))
+        results = []
+        for call in calls:
+            check_method_name(call['method'])
+            args = resolve_references(call.get('args') or [], results)
+            kwargs = resolve_references(call.get('kwargs') or {}, results)
+            results.append(call_kw(request.env[call['model']], call['method'], args, kwargs))
+        return results
+
+    @http.route('/dayflow/api/history/<string:resource>', type='json', auth='none', csrf=False)
+    @instrument_route
+    def history(self, resource, domain=None, fields=None, cursor=None, limit=50):
+        """ Keyset-paginated attendance, leave or payslip history (see ``dayflow.history``). """
+        self._authenticate_token()
+        return request.env['dayflow.history'].get_page(
+            resource, domain=domain, fields=fields, cursor=cursor, limit=limit)
+
+    @http.route('/dayflow/api/jobs', type='json', auth='none', csrf=False)
+    @instrument_route
+    def jobs(self, job_ids):
+        """ Progress of background jobs; clients poll this instead of waiting on the request. """
+        self._authenticate_token()
+        return request.env['dayflow.job'].get_status(job_ids)
+
+    @http.route('/dayflow/api/hot_paths', type='json', auth='none', csrf=False)
+    def hot_paths(self, limit=20, kind=None):
+        """ Where the time goes, as recorded by the opt-in instrumentation (administrators only). """
+        self._authenticate_token()
+        return request.env['dayflow.perf.stat'].get_hot_paths(limit=limit, kind=kind)
+
+    @http.route('/dayflow/api/catalog/<string:name>', type='http', auth='none', methods=['GET'], csrf=False)
+    @instrument_route
+    def catalog(self, name):
+        """ Rarely changing reference data with ETag revalidation: unchanged data costs a 304. """
+        self._authenticate_token()
+        etag, payload = request.env['dayflow.catalog']._get_catalog_response(name)
+        headers = [('ETag', f'"{etag}"'), ('Cache-Control', 'private, no-cache')]
+        if request.httprequest.if_none_match.contains(etag):
+            return request.make_response('', headers=headers, status=304)
+        return request.make_response(payload, headers=headers + [('Content-Type', 'application/json')])
+
+    @http.route('/dayflow/api/export/<string:resource>', type='http', auth='none', methods=['GET'], csrf=False)
+    @instrument_route
+    def export(self, resource, date_from, date_to, format='csv'):
+        """ Stream attendance or payslip history between two dates as gzipped CSV or Parquet.
+
+        The body is produced while it is sent, from a dedicated cursor, since the request's
+        own cursor is closed once this method returns.
+        """
+        self._authenticate_token()
+        request.env['dayflow.export']._check_export_request(resource, format, date_from, date_to)
+        dbname, uid, context = request.env.cr.dbname, request.env.uid, dict(request.env.context)
+
+        def stream():
+            with Registry(dbname).cursor() as cr:
+                env = api.Environment(cr, uid, context)
+                yield from env['dayflow.export']._stream_export(resource, format, date_from, date_to)
+
+        content_type, extension = EXPORT_FORMATS[format]
+        return request.make_response(stream(), headers=[
+            ('Content-Type', content_type),
+            ('Content-Disposition', content_disposition(f'{resource}_{date_from}_{date_to}.{extension}')),
+        ])
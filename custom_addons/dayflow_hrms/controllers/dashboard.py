@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+
+from odoo import http
+from odoo.http import request
+
+from ..models.dayflow_perf_stat import instrument_route
+
+
+class DayflowDashboardController(http.Controller):
+
+    @http.route('/dayflow/api/dashboard', type='json', auth='user')
+    @instrument_route
+    def dashboard(self, days=7):
+        return request.env['dayflow.dashboard'].get_dashboard_data(days=days)
+
+    @http.route('/dayflow/api/analytics', type='json', auth='user')
+    @instrument_route
+    def analytics(self, months=6):
+        return request.env['dayflow.analytics.fact'].get_analytics(months=months)
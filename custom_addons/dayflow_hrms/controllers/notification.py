@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+
+from odoo import http
+from odoo.http import request
+
+from ..models.dayflow_perf_stat import instrument_route
+
+
+class DayflowNotificationController(http.Controller):
+
+    @http.route('/dayflow/api/notifications', type='json', auth='user')
+    @instrument_route
+    def feed(self, since=0, limit=50):
+        return request.env['dayflow.notification'].get_feed(since=since, limit=limit)
+
+    @http.route('/dayflow/api/notifications/read', type='json', auth='user')
+    @instrument_route
+    def mark_read(self, ids):
+        request.env['dayflow.notification'].browse(ids).action_mark_read()
+        return True
@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+
+import logging
+
+from odoo import SUPERUSER_ID
+from odoo.tools.sql import column_exists, create_column, table_exists
+
+_logger = logging.getLogger(__name__)
+
+REVIEW_TABLE = 'hr_performance_review'
+ATTENDANCE_TABLE = 'hr_attendance'
+
+# Stored computes added to hr.attendance; filled in SQL so the ORM does not recompute every row
+ATTENDANCE_COLUMNS = [
+    ('attendance_status', 'varchar'),
+    ('late_minutes', 'int4'),
+    ('overtime_hours', 'float8'),
+]
+# Rows updated per statement, by id range: bounds the size of each statement. The hooks run in the
+# install transaction, so every updated row stays locked until the install commits
+ATTENDANCE_BACKFILL_CHUNK = 50000
+
+# Columns of the consolidated hr.performance.review that legacy dayflow_performance rows need
+REVIEW_COLUMNS = [
+    ('date_from', 'date'),
+    ('date_to', 'date'),
+    ('review_date', 'date'),
+    ('review_period', 'varchar'),
+    ('reviewer_id', 'int4'),
+    ('reviewer_comments', 'text'),
+    ('quality_of_work', 'varchar'),
+    ('productivity', 'varchar'),
+    ('communication', 'varchar'),
+    ('teamwork', 'varchar'),
+    ('initiative', 'varchar'),
+    ('punctuality', 'varchar'),
+    ('overall_rating', 'numeric'),
+    ('rating_category', 'varchar'),
+]
+
+
+def merge_legacy_performance_reviews(cr):
+    """ Fold reviews written by the old dayflow_performance model into the dayflow_hrms columns.
+
+    dayflow_performance stored ``start_date``/``end_date``, a single ``manager_rating`` and the
+    ``ongoing``/``finalized`` states on the same table. Runs before the ORM sets up the table so
+    that required columns are already filled when their NOT NULL constraints are added.
+    """
+    if not table_exists(cr, REVIEW_TABLE) or not column_exists(cr, REVIEW_TABLE, 'start_date'):
+        return
+
+    for column, column_type in REVIEW_COLUMNS:
+        if not column_exists(cr, REVIEW_TABLE, column):
+            create_column(cr, REVIEW_TABLE, column, column_type)
+
+    cr.execute("""
+        UPDATE hr_performance_review
+           SET date_from = COALESCE(date_from, start_date, end_date, create_date::date),
+               date_to = COALESCE(date_to, end_date, start_date, create_date::date),
+               review_date = COALESCE(review_date, end_date, create_date::date),
+               review_period = COALESCE(review_period, 'quarterly'),
+               reviewer_id = COALESCE(reviewer_id, create_uid, %s)
+    """, [SUPERUSER_ID])
+
+    if column_exists(cr, REVIEW_TABLE, 'manager_feedback'):
+        cr.execute("""
+            UPDATE hr_performance_review
+               SET reviewer_comments = manager_feedback
+             WHERE reviewer_comments IS NULL
+               AND manager_feedback IS NOT NULL
+        """)
+
+    if column_exists(cr, REVIEW_TABLE, 'manager_rating'):
+        # A single manager rating becomes the same score on every axis, so the overall rating
+        # equals the legacy rating; both stored computes are filled here to avoid a recompute
+        cr.execute("""
+            UPDATE hr_performance_review
+               SET quality_of_work = manager_rating,
+                   productivity = manager_rating,
+                   communication = manager_rating,
+                   teamwork = manager_rating,
+                   initiative = manager_rating,
+                   punctuality = manager_rating,
+                   overall_rating = manager_rating::int,
+                   rating_category = CASE
+                       WHEN manager_rating::int < 2.5 THEN 'poor'
+                       WHEN manager_rating::int < 3.5 THEN 'average'
+                       WHEN manager_rating::int < 4.5 THEN 'good'
+                       ELSE 'excellent'
+                   END
+             WHERE manager_rating IN ('1', '2', '3', '4', '5')
+               AND quality_of_work IS NULL
+        """)
+
+    cr.execute("""
+        UPDATE hr_performance_review
+           SET overall_rating = COALESCE(overall_rating, 0),
+               rating_category = COALESCE(rating_category, 'poor'),
+               state = CASE state
+                   WHEN 'ongoing' THEN 'draft'
+                   WHEN 'finalized' THEN 'acknowledged'
+                   ELSE state
+               END
+    """)
+
+
+def backfill_attendance_columns(cr, tz, only_missing=False):
+    """ Fill the status, lateness and overtime of existing attendances, one id range at a time.
+
+    Same rules as the computes of hr.attendance: late after 9:15 in ``tz``, half day under
+    4 worked hours, lateness counted from 9:00, overtime beyond 8 hours. Chunking keeps each
+    statement small, not the transaction: run from the install hooks, all updated rows stay
+    locked, and their WAL is kept, until the module installation commits.
+    """
+    cr.execute(f"SELECT min(id), max(id) FROM {ATTENDANCE_TABLE}")
+    min_id, max_id = cr.fetchone()
+    if min_id is None:
+        return
+    missing_clause = 'AND attendance_status IS NULL' if only_missing else ''
+    updated = 0
+    for start in range(min_id, max_id + 1, ATTENDANCE_BACKFILL_CHUNK):
+        cr.execute(f"""
+            UPDATE {ATTENDANCE_TABLE} a
+               SET attendance_status = CASE
+                       WHEN a.check_in IS NULL THEN 'absent'
+                       WHEN local.check_in > date_trunc('day', local.check_in) + interval '9 hours 15 minutes'
+                           THEN 'late'
+                       WHEN COALESCE(a.worked_hours, 0) < 4 THEN 'half_day'
+                       ELSE 'present'
+                   END,
+                   late_minutes = CASE
+                       WHEN local.check_in > date_trunc('day', local.check_in) + interval '9 hours'
+                           THEN floor(extract(epoch FROM local.check_in - date_trunc('day', local.check_in)
+                                                         - interval '9 hours') / 60)::int
+                       ELSE 0
+                   END,
+                   overtime_hours = GREATEST(COALESCE(a.worked_hours, 0) - 8, 0)
+              FROM (SELECT id, check_in AT TIME ZONE 'UTC' AT TIME ZONE %(tz)s AS check_in
+                      FROM {ATTENDANCE_TABLE}
+                     WHERE id >= %(start)s AND id < %(stop)s) local
+             WHERE a.id = local.id {missing_clause}
+        """, {'tz': tz, 'start': start, 'stop': start + ATTENDANCE_BACKFILL_CHUNK})
+        updated += cr.rowcount
+    _logger.info('Backfilled the status of %s attendances', updated)
+
+
+def prepare_attendance_columns(cr, tz):
+    """ Create and fill the computed attendance columns before the ORM sees them missing. """
+    if not table_exists(cr, ATTENDANCE_TABLE):
+        return
+    created = False
+    for column, column_type in ATTENDANCE_COLUMNS:
+        if not column_exists(cr, ATTENDANCE_TABLE, column):
+            create_column(cr, ATTENDANCE_TABLE, column, column_type)
+            created = True
+    if created:
+        backfill_attendance_columns(cr, tz)
+
+
+def _get_install_tz(env):
+    # The computes convert check-ins with the timezone of the user installing the module
+    return env.context.get('tz') or env.user.tz or 'UTC'
+
+
+def pre_init_hook(env):
+    merge_legacy_performance_reviews(env.cr)
+    prepare_attendance_columns(env.cr, _get_install_tz(env))
+
+
+def post_init_hook(env):
+    # Rows punched while the module was being installed, if any
+    backfill_attendance_columns(env.cr, _get_install_tz(env), only_missing=True)
+    env['hr.attendance'].invalidate_model(['attendance_status', 'late_minutes', 'overtime_hours'])
+    env.cr.execute(f"ANALYZE {ATTENDANCE_TABLE}")
+    # The status board has today's rows right away instead of after the next cron run
+    env['dayflow.attendance.status']._build_snapshot()
+    # Charts have their history without waiting for the nightly rebuild
+    env['dayflow.analytics.fact']._cron_rebuild_facts()
@@ -0,0 +1,7 @@
+# -*- coding: utf-8 -*-
+
+from odoo.addons.dayflow_hrms.hooks import merge_legacy_performance_reviews
+
+
+def migrate(cr, version):
+    merge_legacy_performance_reviews(cr)
@@ -5,3 +5,15 @@ from . import hr_attendance_extended
 from . import hr_leave_extended
 # from . import hr_payroll_extended  # Requires hr_payroll module (Enterprise)
 from . import performance_review
+from . import performance_calibration
+from . import dayflow_dashboard
+from . import dayflow_notification
+from . import dayflow_api_token
+from . import dayflow_history
+from . import dayflow_catalog
+from . import dayflow_export
+from . import dayflow_attendance_status
+from . import dayflow_job
+from . import dayflow_perf_stat
+from . import dayflow_report_dirty
+from . import dayflow_analytics
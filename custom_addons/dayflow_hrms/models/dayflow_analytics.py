@@ -0,0 +1,347 @@
+# -*- coding: utf-8 -*-
+
+import logging
+from collections import defaultdict
+from datetime import timedelta
+
+from dateutil.relativedelta import relativedelta
+
+from odoo import models, fields, api, tools, _
+
+_logger = logging.getLogger(__name__)
+
+# Months recomputed by the nightly rebuild; older months only change through incremental patches
+REBUILD_MONTHS = 36
+MAX_ANALYTICS_MONTHS = 36
+# Summed measures of the fact table, in the order of the INSERT
+FACT_MEASURES = [
+    'headcount', 'expected_days', 'present_days', 'late_count', 'late_minutes', 'worked_hours',
+    'overtime_hours', 'leave_days', 'payslip_count', 'payroll_cost', 'review_count', 'rating_total',
+]
+
+
+class DayflowAnalyticsFact(models.Model):
+    """ HR figures aggregated per company, department and month, for the analytics charts.
+
+    Rows with a leave type only carry the leave days of that type; the other rows carry every
+    other measure. Every measure is a sum, so any grouping of ``_read_group`` is correct; rates
+    and averages are derived from their sums. Headcounts add up across departments, not months.
+    Employees are counted in their current department.
+    """
+    _name = 'dayflow.analytics.fact'
+    _description = 'Dayflow HR Analytics'
+    _order = 'month desc, department_id, leave_type_id'
+
+    company_id = fields.Many2one('res.company', string='Company', readonly=True)
+    department_id = fields.Many2one('hr.department', string='Department', readonly=True)
+    month = fields.Date(string='Month', required=True, readonly=True)
+    leave_type_id = fields.Many2one('hr.leave.type', string='Leave Type', readonly=True)
+
+    headcount = fields.Integer(string='Headcount', readonly=True)
+    expected_days = fields.Integer(string='Working Days', readonly=True)
+    present_days = fields.Integer(string='Days Present', readonly=True)
+    late_count = fields.Integer(string='Late Arrivals', readonly=True)
+    late_minutes = fields.Integer(string='Late Minutes', readonly=True)
+    worked_hours = fields.Float(string='Worked Hours', readonly=True)
+    overtime_hours = fields.Float(string='Overtime Hours', readonly=True)
+    leave_days = fields.Float(string='Leave Days', readonly=True)
+    payslip_count = fields.Integer(string='Payslips', readonly=True)
+    payroll_cost = fields.Float(string='Payroll Cost', readonly=True)
+    review_count = fields.Integer(string='Reviews', readonly=True)
+    rating_total = fields.Float(string='Rating Total', readonly=True)
+
+    attendance_rate = fields.Float(string='Attendance Rate (%)', compute='_compute_ratios', digits=(5, 1))
+    average_rating = fields.Float(string='Average Rating', compute='_compute_ratios', digits=(3, 2))
+
+    def init(self):
+        tools.create_index(self._cr, 'dayflow_analytics_fact_month_department_index',
+                           self._table, ['month', 'department_id'])
+
+    @api.depends('expected_days', 'present_days', 'review_count', 'rating_total')
+    def _compute_ratios(self):
+        for fact in self:
+            fact.attendance_rate = 100.0 * fact.present_days / fact.expected_days if fact.expected_days else 0.0
+            fact.average_rating = fact.rating_total / fact.review_count if fact.review_count else 0.0
+
+    # ------------------------------------------------------------
+    # Build
+    # ------------------------------------------------------------
+
+    def _get_tz(self):
+        # Same timezone as the attendance computes, so that days and months match theirs
+        return self.env.context.get('tz') or self.env.user.tz or 'UTC'
+
+    @api.model
+    def _refresh_facts(self, month_from, month_to, department_ids=None):
+        """ Recompute the rows of the months from ``month_from`` to ``month_to`` included.
+
+        ``department_ids`` restricts the refresh to these departments, ``None`` in it standing
+        for employees without department; all departments by default.
+        """
+        month_from, month_to = month_from.replace(day=1), month_to.replace(day=1)
+        if month_from > month_to:
+            return
+        self.env.flush_all()
+        cr = self.env.cr
+        # The nightly rebuild and the incremental patches may run at the same time; readers are not blocked
+        cr.execute("LOCK TABLE dayflow_analytics_fact IN EXCLUSIVE MODE")
+
+        params = {
+            'month_from': month_from,
+            'month_to': month_to,
+            'date_to': min(month_to + relativedelta(months=1, days=-1), fields.Date.context_today(self)),
+            'tz': self._get_tz(),
+            'all_departments': department_ids is None,
+            'department_ids': [department_id for department_id in department_ids or [] if department_id],
+            'no_department': department_ids is not None and None in department_ids,
+        }
+        cr.execute("""
+            DELETE FROM dayflow_analytics_fact
+             WHERE month BETWEEN %(month_from)s AND %(month_to)s
+               AND (%(all_departments)s OR department_id = ANY(%(department_ids)s)
+                    OR (%(no_department)s AND department_id IS NULL))
+        """, params)
+
+        facts = self._compute_facts(params)
+        if facts:
+            now = fields.Datetime.now()
+            cr.execute(f"""
+                INSERT INTO dayflow_analytics_fact (company_id, department_id, month, leave_type_id,
+                                                    {', '.join(FACT_MEASURES)},
+                                                    create_uid, create_date, write_uid, write_date)
+                     VALUES {', '.join(['%s'] * len(facts))}
+            """, [(*key, *(values[measure] for measure in FACT_MEASURES), self.env.uid, now, self.env.uid, now)
+                  for key, values in facts.items()])
+        self.invalidate_model()
+        return len(facts)
+
+    def _compute_facts(self, params):
+        """ One aggregate query per source, merged into {(company, department, month, leave type): measures}. """
+        cr = self.env.cr
+        employee_filter = """
+            e.active AND (%(all_departments)s OR e.department_id = ANY(%(department_ids)s)
+                          OR (%(no_department)s AND e.department_id IS NULL))
+        """
+        facts = {}
+
+        def merge(rows, measures):
+            for company_id, department_id, month, leave_type_id, *values in rows:
+                fact = facts.setdefault((company_id, department_id, month, leave_type_id),
+                                        dict.fromkeys(FACT_MEASURES, 0))
+                fact.update(zip(measures, values))
+
+        # Employees that had joined by the end of the month; working days are weekdays from the joining date
+        cr.execute(f"""
+            SELECT e.company_id, e.department_id, m.month::date, NULL, count(*)
+              FROM hr_employee e
+              JOIN generate_series(%(month_from)s::date, %(month_to)s::date, interval '1 month') m(month)
+                ON COALESCE(e.date_of_joining, e.create_date::date) < m.month + interval '1 month'
+             WHERE {employee_filter}
+          GROUP BY 1, 2, 3
+        """, params)
+        merge(cr.fetchall(), ['headcount'])
+        cr.execute(f"""
+            SELECT e.company_id, e.department_id, date_trunc('month', d.day)::date, NULL, count(*)
+              FROM hr_employee e
+              JOIN generate_series(%(month_from)s::date, %(date_to)s::date, interval '1 day') d(day)
+                ON d.day >= COALESCE(e.date_of_joining, e.create_date::date)
+             WHERE {employee_filter} AND extract(isodow FROM d.day) < 6
+          GROUP BY 1, 2, 3
+        """, params)
+        merge(cr.fetchall(), ['expected_days'])
+
+        # Check-ins are stored in UTC: select a day more on each side, then filter on the local day
+        cr.execute(f"""
+            SELECT e.company_id, e.department_id, date_trunc('month', a.day)::date, NULL,
+                   count(DISTINCT (a.employee_id, a.day)) FILTER (WHERE a.attendance_status IN ('present', 'late')),
+                   count(*) FILTER (WHERE a.attendance_status = 'late'),
+                   COALESCE(sum(a.late_minutes), 0),
+                   COALESCE(sum(a.worked_hours), 0),
+                   COALESCE(sum(a.overtime_hours), 0)
+              FROM (SELECT employee_id, attendance_status, late_minutes, worked_hours, overtime_hours,
+                           (check_in AT TIME ZONE 'UTC' AT TIME ZONE %(tz)s)::date AS day
+                      FROM hr_attendance
+                     WHERE check_in >= %(month_from)s::date - 1
+                       AND check_in < %(date_to)s::date + 2) a
+              JOIN hr_employee e ON e.id = a.employee_id
+             WHERE a.day BETWEEN %(month_from)s AND %(date_to)s AND {employee_filter}
+          GROUP BY 1, 2, 3
+        """, params)
+        merge(cr.fetchall(), ['present_days', 'late_count', 'late_minutes', 'worked_hours', 'overtime_hours'])
+
+        # Approved leaves count in the month they start
+        cr.execute(f"""
+            SELECT e.company_id, e.department_id, date_trunc('month', l.request_date_from)::date,
+                   l.holiday_status_id, sum(l.number_of_days)
+              FROM hr_leave l
+              JOIN hr_employee e ON e.id = l.employee_id
+             WHERE l.state = 'validate' AND l.active
+               AND l.request_date_from >= %(month_from)s
+               AND l.request_date_from < %(month_to)s::date + interval '1 month'
+               AND {employee_filter}
+          GROUP BY 1, 2, 3, 4
+        """, params)
+        merge(cr.fetchall(), ['leave_days'])
+
+        cr.execute(f"""
+            SELECT e.company_id, e.department_id, date_trunc('month', r.review_date)::date, NULL,
+                   count(*), COALESCE(sum(r.overall_rating), 0)
+              FROM hr_performance_review r
+              JOIN hr_employee e ON e.id = r.employee_id
+             WHERE r.state IN ('reviewed', 'acknowledged')
+               AND r.review_date >= %(month_from)s
+               AND r.review_date < %(month_to)s::date + interval '1 month'
+               AND {employee_filter}
+          GROUP BY 1, 2, 3
+        """, params)
+        merge(cr.fetchall(), ['review_count', 'rating_total'])
+
+        # hr.payroll.slip comes from the optional dayflow_payroll module; the cost is the gross pay
+        if 'hr.payroll.slip' in self.env:
+            cr.execute(f"""
+                SELECT e.company_id, e.department_id, date_trunc('month', p.date)::date, NULL,
+                       count(*), COALESCE(sum(COALESCE(p.basic_wage, 0) + COALESCE(p.allowances, 0)), 0)
+                  FROM hr_payroll_slip p
+                  JOIN hr_employee e ON e.id = p.employee_id
+                 WHERE p.state = 'paid'
+                   AND p.date >= %(month_from)s
+                   AND p.date < %(month_to)s::date + interval '1 month'
+                   AND {employee_filter}
+              GROUP BY 1, 2, 3
+            """, params)
+            merge(cr.fetchall(), ['payslip_count', 'payroll_cost'])
+        return facts
+
+    @api.model
+    def _cron_rebuild_facts(self):
+        """ Nightly: recompute the last ``REBUILD_MONTHS`` months of every department.
+
+        Catches what the incremental patches do not see: new employees, department moves,
+        payslips and the passing days of the current month.
+        """
+        today = fields.Date.context_today(self)
+        count = self._refresh_facts(today - relativedelta(months=REBUILD_MONTHS - 1), today)
+        _logger.info('Rebuilt %s analytics facts', count)
+
+    @api.model
+    def _patch_facts(self, periods):
+        """ Recompute the months and departments touched by dirty ``(date_from, date_to, department_id)`` periods. """
+        # Only the (month, department) cells a period touches: a backdated correction must not
+        # rebuild every month since then, nor every department active today
+        departments_by_month = defaultdict(set)
+        for date_from, date_to, department_id in periods:
+            # Dirty dates of punches are UTC dates: one day more on each side covers their local month
+            month = (date_from - timedelta(days=1)).replace(day=1)
+            while month <= date_to + timedelta(days=1):
+                departments_by_month[month].add(department_id)
+                month += relativedelta(months=1)
+
+        # Consecutive months with the same departments are refreshed together
+        runs = []
+        for month in sorted(departments_by_month):
+            departments = departments_by_month[month]
+            if runs and runs[-1][2] == departments and runs[-1][1] + relativedelta(months=1) == month:
+                runs[-1][1] = month
+            else:
+                runs.append([month, month, departments])
+        for month_from, month_to, departments in runs:
+            self._refresh_facts(month_from, month_to, departments)
+
+    # ------------------------------------------------------------
+    # API
+    # ------------------------------------------------------------
+
+    @api.model
+    def get_analytics(self, months=6):
+        """ Every analytics chart of the last ``months`` months, read from the fact table.
+
+        Payroll and ratings are only returned to HR officers, as on the dashboard.
+        """
+        months = max(1, min(int(months), MAX_ANALYTICS_MONTHS))
+        today = fields.Date.context_today(self)
+        last_month = today.replace(day=1)
+        first_month = last_month - relativedelta(months=months - 1)
+        Fact = self.sudo()
+        domain = [('month', '>=', first_month), ('month', '<=', last_month),
+                  ('company_id', 'in', self.env.companies.ids)]
+        sums = [f'{measure}:sum' for measure in FACT_MEASURES]
+
+        def as_dict(values):
+            totals = dict(zip(FACT_MEASURES, values))
+            totals['attendance_rate'] = round(100.0 * totals['present_days'] / totals['expected_days'], 1) \
+                if totals['expected_days'] else 0.0
+            return totals
+
+        by_month = {month: as_dict(values) for month, *values in Fact._read_group(domain, ['month:month'], sums)}
+        trend = []
+        month = first_month
+        while month <= last_month:
+            values = by_month.get(month) or as_dict([0] * len(FACT_MEASURES))
+            trend.append({
+                'month': fields.Date.to_string(month),
+                'headcount': values['headcount'],
+                'attendance_rate': values['attendance_rate'],
+                'late_count': values['late_count'],
+                'late_minutes': values['late_minutes'],
+                'overtime_hours': values['overtime_hours'],
+                'leave_days': values['leave_days'],
+            })
+            month += relativedelta(months=1)
+
+        # Headcount of the current month; the other figures over the whole range
+        headcounts = dict(Fact._read_group(domain + [('month', '=', last_month)], ['department_id'], ['headcount:sum']))
+        departments = []
+        for department, *values in Fact._read_group(domain, ['department_id'], sums):
+            values = as_dict(values)
+            departments.append({
+                'id': department.id,
+                'name': department.name or _('No Department'),
+                'headcount': headcounts.get(department, 0),
+                'attendance_rate': values['attendance_rate'],
+                'late_count': values['late_count'],
+                'overtime_hours': values['overtime_hours'],
+                'leave_days': values['leave_days'],
+            })
+
+        [totals] = Fact._read_group(domain, [], sums)
+        totals = as_dict(totals)
+        data = {
+            'date_from': fields.Date.to_string(first_month),
+            'date_to': fields.Date.to_string(today),
+            'headcount': sum(headcounts.values()),
+            'attendance_rate': totals['attendance_rate'],
+            'late_count': totals['late_count'],
+            'overtime_hours': totals['overtime_hours'],
+            'trend': trend,
+            'departments': departments,
+            'leaves_by_type': [{
+                'id': leave_type.id,
+                'name': leave_type.name,
+                'days': days,
+            } for leave_type, days in Fact._read_group(
+                domain + [('leave_type_id', '!=', False)], ['leave_type_id'], ['leave_days:sum'])],
+        }
+        if self.env.user.has_group('hr.group_hr_user'):
+            data['payroll'] = {
+                'payslip_count': totals['payslip_count'],
+                'total_cost': totals['payroll_cost'],
+                'average_cost': totals['payroll_cost'] / totals['payslip_count'] if totals['payslip_count'] else 0.0,
+            }
+            data['ratings'] = {
+                'review_count': totals['review_count'],
+                'average_rating': round(totals['rating_total'] / totals['review_count'], 2)
+                if totals['review_count'] else 0.0,
+                'top_performers': self._get_top_performers(first_month),
+            }
+        return data
+
+    def _get_top_performers(self, date_from, limit=5):
+        # Per employee, so not in the cube; a range scan on the review date index
+        reviews = self.env['hr.performance.review'].search_read(
+            [('state', 'in', ['reviewed', 'acknowledged']), ('review_date', '>=', date_from)],
+            ['employee_id', 'overall_rating'], order='overall_rating desc', limit=limit)
+        return [{
+            'employee_id': review['employee_id'][0],
+            'name': review['employee_id'][1],
+            'rating': review['overall_rating'],
+        } for review in reviews]
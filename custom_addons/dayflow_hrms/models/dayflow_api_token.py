@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+
+import hashlib
+import secrets
+import time
+from datetime import timedelta
+
+from odoo import models, fields, api, _
+from odoo.tools.lru import LRU
+
+# Tokens are short-lived; clients request a new one with their password when it expires
+TOKEN_LIFETIME = timedelta(hours=1)
+# Per-worker cache of validated tokens, so that most calls never reach the database
+TOKEN_CACHE_TTL = 60  # seconds
+
+# (dbname, token hash) -> (uid, cache expiry)
+_token_cache = LRU(4096)
+
+
+class DayflowApiToken(models.Model):
+    _name = 'dayflow.api.token'
+    _description = 'Dayflow API Token'
+    _order = 'id desc'
+
+    user_id = fields.Many2one('res.users', string='User', required=True, index=True, ondelete='cascade')
+    token_hash = fields.Char(string='Token Hash', required=True, index=True, copy=False)
+    expiration = fields.Datetime(string='Expires On', required=True)
+
+    _sql_constraints = [
+        ('token_hash_uniq', 'unique(token_hash)', 'API token hashes must be unique.'),
+    ]
+
+    @api.model
+    def _hash_token(self, token):
+        # Only the digest is stored and used as lookup key: comparing digests leaks nothing
+        # about the token itself, unlike a character by character comparison of the secret
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    @api.model
+    def _issue_token(self, uid):
+        """ Create a token for ``uid``; the plain token is only ever returned here. """
+        token = secrets.token_urlsafe(32)
+        expiration = fields.Datetime.now() + TOKEN_LIFETIME
+        self.sudo().create({
+            'user_id': uid,
+            'token_hash': self._hash_token(token),
+            'expiration': expiration,
+        })
+        return token, expiration
+
+    @api.model
+    def _check_token(self, token):
+        """ Return the uid owning a valid ``token``, or None. """
+        token_hash = self._hash_token(token)
+        key = (self.env.cr.dbname, token_hash)
+        now = time.time()
+        cached = _token_cache.get(key)
+        if cached and cached[1] > now:
+            return cached[0]
+
+        self.env.cr.execute("""
+            SELECT t.user_id, t.expiration
+              FROM dayflow_api_token t
+              JOIN res_users u ON u.id = t.user_id
+             WHERE t.token_hash = %s
+               AND t.expiration > (now() AT TIME ZONE 'UTC')
+               AND u.active
+        """, [token_hash])
+        row = self.env.cr.fetchone()
+        if not row:
+            return None
+        uid, expiration = row
+        seconds_left = (expiration - fields.Datetime.now()).total_seconds()
+        _token_cache[key] = (uid, now + min(TOKEN_CACHE_TTL, seconds_left))
+        return uid
+
+    @api.model
+    def _revoke_token(self, token):
+        token_hash = self._hash_token(token)
+        self.sudo().search([('token_hash', '=', token_hash)]).unlink()
+        # Other workers drop it when their cache entry expires
+        _token_cache[(self.env.cr.dbname, token_hash)] = (None, 0)
+
+    @api.autovacuum
+    def _gc_expired_tokens(self):
+        self.sudo().search([('expiration', '<', fields.Datetime.now())]).unlink()
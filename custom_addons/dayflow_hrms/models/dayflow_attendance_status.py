@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+
+import time
+from datetime import datetime, time as dt_time, timedelta
+
+import pytz
+
+from odoo import models, fields, api
+from odoo.tools.lru import LRU
+
+# Employees without a punch are "not yet in" until this local hour, then "absent"
+ABSENT_AFTER_HOUR = 12
+# The board is polled by every viewer; the snapshot rows are kept current by hooks
+BOARD_CACHE_TTL = 30  # seconds
+
+# (dbname, date, company ids) -> (expiry, board)
+_board_cache = LRU(256)
+
+
+class DayflowAttendanceStatus(models.Model):
+    _name = 'dayflow.attendance.status'
+    _description = 'Daily Attendance Status'
+    _order = 'date desc, employee_id'
+
+    date = fields.Date(string='Date', required=True, index=True)
+    employee_id = fields.Many2one('hr.employee', string='Employee', required=True, ondelete='cascade')
+    department_id = fields.Many2one('hr.department', string='Department')
+    company_id = fields.Many2one('res.company', string='Company')
+    status = fields.Selection([
+        ('present', 'Present'),
+        ('late', 'Late'),
+        ('on_leave', 'On Leave'),
+        ('absent', 'Absent'),
+        ('not_yet_in', 'Not Yet In'),
+    ], string='Status', required=True, default='not_yet_in')
+    check_in = fields.Datetime(string='First Check In')
+    check_out = fields.Datetime(string='Last Check Out')
+    leave_type_id = fields.Many2one('hr.leave.type', string='Leave Type')
+
+    _sql_constraints = [
+        ('date_employee_uniq', 'unique(date, employee_id)', 'There is one status per employee and day.'),
+    ]
+
+    @api.model
+    def _get_local_today(self, employee):
+        """ The current date in the employee's timezone: the date of their snapshot row. """
+        tz = pytz.timezone(employee.tz or 'UTC')
+        return pytz.utc.localize(fields.Datetime.now()).astimezone(tz).date()
+
+    @api.model
+    def _get_day_bounds(self, employee, day):
+        """ UTC datetimes bounding ``day`` in the employee's timezone. """
+        tz = pytz.timezone(employee.tz or 'UTC')
+        start = tz.localize(datetime.combine(day, dt_time.min)).astimezone(pytz.utc).replace(tzinfo=None)
+        return start, start + timedelta(days=1)
+
+    @api.model
+    def _get_today_bounds(self, employee):
+        return self._get_day_bounds(employee, self._get_local_today(employee))
+
+    @api.model
+    def _is_past_absent_cutoff(self, employee, day):
+        tz = pytz.timezone(employee.tz or 'UTC')
+        now = pytz.utc.localize(fields.Datetime.now()).astimezone(tz)
+        return now.date() > day or now.hour >= ABSENT_AFTER_HOUR
+
+    @api.model
+    def _compute_status_values(self, employees, day=None):
+        """ Status values of ``employees`` for ``day``, by default each one's local today.
+
+        Days, punches and the absent cutoff are in each employee's timezone; one query for
+        punches and one for leaves cover all of them.
+        """
+        bounds = {employee: self._get_day_bounds(employee, day or self._get_local_today(employee))
+                  for employee in employees}
+        if not bounds:
+            return {}
+        window_start = min(start for start, _end in bounds.values())
+        window_end = max(end for _start, end in bounds.values())
+        attendances = self.env['hr.attendance'].sudo().search_read(
+            [('employee_id', 'in', employees.ids), ('check_in', '>=', window_start), ('check_in', '<', window_end)],
+            ['employee_id', 'check_in', 'check_out', 'attendance_status'], order='check_in')
+        leaves = self.env['hr.leave'].sudo().search_read([
+            ('employee_id', 'in', employees.ids),
+            ('state', '=', 'validate'),
+            ('date_from', '<', window_end),
+            ('date_to', '>=', window_start),
+        ], ['employee_id', 'holiday_status_id', 'date_from', 'date_to'])
+        punches, leave_types = {}, {}
+        for attendance in attendances:
+            punches.setdefault(attendance['employee_id'][0], []).append(attendance)
+        for leave in leaves:
+            leave_types.setdefault(leave['employee_id'][0], []).append(leave)
+
+        values = {}
+        for employee, (start, end) in bounds.items():
+            employee_day = day or self._get_local_today(employee)
+            day_punches = [punch for punch in punches.get(employee.id, []) if start <= punch['check_in'] < end]
+            leave_type = next((leave['holiday_status_id'][0] for leave in leave_types.get(employee.id, [])
+                               if leave['date_from'] < end and leave['date_to'] >= start), False)
+            first, last = (day_punches[0], day_punches[-1]) if day_punches else (None, None)
+            if first:
+                status = 'late' if first['attendance_status'] == 'late' else 'present'
+            elif leave_type:
+                status = 'on_leave'
+            else:
+                status = 'absent' if self._is_past_absent_cutoff(employee, employee_day) else 'not_yet_in'
+            values[employee.id] = {
+                'date': employee_day,
+                'employee_id': employee.id,
+                'department_id': employee.department_id.id,
+                'company_id': employee.company_id.id,
+                'status': status,
+                'check_in': first and first['check_in'],
+                'check_out': last and last['check_out'],
+                'leave_type_id': leave_type,
+            }
+        return values
+
+    def _store_rows(self, vals_list, overwrite):
+        """ Insert snapshot rows; on an existing (date, employee) row, overwrite it or keep it.
+
+        Hooks and the cron may store the same row concurrently: the conflict clause makes that
+        safe instead of failing on the unique constraint.
+        """
+        if not vals_list:
+            return
+        columns = ['date', 'employee_id', 'department_id', 'company_id', 'status', 'check_in', 'check_out',
+                   'leave_type_id']
+        conflict = 'DO UPDATE SET ' + ', '.join(
+            f'{column} = EXCLUDED.{column}' for column in columns[2:] + ['write_uid', 'write_date']
+        ) if overwrite else 'DO NOTHING'
+        now = fields.Datetime.now()
+        self.env.cr.execute(f"""
+            INSERT INTO dayflow_attendance_status ({', '.join(columns)}, create_uid, create_date, write_uid, write_date)
+                 VALUES {', '.join(['%s'] * len(vals_list))}
+            ON CONFLICT (date, employee_id) {conflict}
+        """, [tuple(vals[column] or None for column in columns) + (self.env.uid, now, self.env.uid, now)
+              for vals in vals_list])
+        self.invalidate_model()
+
+    @api.model
+    def _build_snapshot(self, day=None):
+        """ Create the rows of ``day``, by default each employee's local today, that do not exist yet. """
+        self.env.flush_all()
+        employees = self.env['hr.employee'].sudo().search([])
+        days = {employee: day or self._get_local_today(employee) for employee in employees}
+        existing = {(row['employee_id'][0], row['date']) for row in self.sudo().search_read(
+            [('date', 'in', list(set(days.values())))], ['employee_id', 'date'])}
+        missing = employees.filtered(lambda employee: (employee.id, days[employee]) not in existing)
+        self._store_rows(list(self._compute_status_values(missing, day).values()), overwrite=False)
+
+    @api.model
+    def _refresh_employees(self, employees, day=None):
+        """ Incremental update after punches or leave decisions of ``employees``. """
+        employees = employees.sudo().exists()
+        if employees:
+            self.env.flush_all()
+            self._store_rows(list(self._compute_status_values(employees, day).values()), overwrite=True)
+
+    @api.model
+    def _cron_update_snapshot(self):
+        """ Build each employee's today in the morning, later only flip "not yet in" to "absent". """
+        self._build_snapshot()
+        pending = self.sudo().search([('status', '=', 'not_yet_in')])
+        pending.filtered(
+            lambda row: self._is_past_absent_cutoff(row.employee_id, row.date)).write({'status': 'absent'})
+
+    @api.autovacuum
+    def _gc_old_snapshots(self):
+        limit_date = fields.Date.context_today(self) - timedelta(days=90)
+        self.sudo().search([('date', '<', limit_date)]).unlink()
+
+    @api.model
+    def get_board(self):
+        """ Today's status of every employee, grouped for "who's out today" and the team board.
+
+        Served from a per-worker cache; the snapshot rows behind it are kept up to date by
+        the attendance and leave hooks, so the board is at most ``BOARD_CACHE_TTL`` old.
+        """
+        today = fields.Date.context_today(self)
+        key = (self.env.cr.dbname, today, tuple(self.env.companies.ids))
+        cached = _board_cache.get(key)
+        now = time.monotonic()
+        if cached and cached[0] > now:
+            return cached[1]
+
+        # Only read: the rows are built by the cron and kept current by the hooks. Each employee's
+        # row is the one of their own local today, which may be a day off the viewer's
+        Snapshot = self.sudo()
+        rows = Snapshot.search_read(
+            [('date', '>=', today - timedelta(days=1)), ('date', '<=', today + timedelta(days=1)),
+             ('company_id', 'in', self.env.companies.ids)],
+            ['date', 'employee_id', 'department_id', 'status', 'check_in', 'check_out', 'leave_type_id'],
+            order='status, check_in')
+        local_todays = {employee.id: self._get_local_today(employee) for employee in
+                        self.env['hr.employee'].sudo().browse({row['employee_id'][0] for row in rows})}
+        rows = [row for row in rows if row.pop('date') == local_todays[row['employee_id'][0]]]
+        counts = dict.fromkeys(dict(self._fields['status'].selection), 0)
+        for row in rows:
+            counts[row['status']] += 1
+        board = {
+            'date': fields.Date.to_string(today),
+            'counts': counts,
+            'employees': rows,
+        }
+        _board_cache[key] = (now + BOARD_CACHE_TTL, board)
+        return board
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+
+import hashlib
+import json
+
+from odoo import models, fields, api, tools, _
+from odoo.exceptions import UserError
+from odoo.tools import date_utils
+
+# name -> (model, domain, fields, order); read on nearly every page but rarely changed
+CATALOGS = {
+    'leave_types': ('hr.leave.type', [('active', '=', True)],
+                    ['name', 'requires_allocation', 'request_unit'], 'sequence, id'),
+    'leave_type_rules': ('hr.leave.type', [('active', '=', True)],
+                         ['name', 'requires_attachment', 'max_consecutive_days', 'min_days_notice',
+                          'allow_half_day', 'carry_forward', 'max_carry_forward'], 'sequence, id'),
+    'departments': ('hr.department', [],
+                    ['name', 'complete_name', 'parent_id', 'manager_id'], 'complete_name'),
+    'employee_directory': ('hr.employee.public', [],
+                           ['name', 'job_title', 'department_id', 'parent_id', 'work_email',
+                            'mobile_phone', 'user_id'], 'name'),
+}
+
+# hr.employee.public is a view on hr.employee: writes happen on the latter
+CATALOG_SOURCE_MODELS = {'hr.employee.public': 'hr.employee'}
+PRECOMMIT_KEY = 'dayflow.catalog.version'
+
+
+class DayflowCatalogVersion(models.Model):
+    """ Change counter of a catalog source model; part of the cache key of its catalogs. """
+    _name = 'dayflow.catalog.version'
+    _description = 'Dayflow Catalog Version'
+
+    model = fields.Char(string='Model', required=True, readonly=True)
+    version = fields.Integer(string='Version', readonly=True)
+
+    _sql_constraints = [
+        ('model_unique', 'unique(model)', 'There is one version per model.'),
+    ]
+
+
+class DayflowCatalog(models.AbstractModel):
+    _name = 'dayflow.catalog'
+    _description = 'Dayflow Cached Reference Data'
+
+    def _get_access_key(self):
+        """ Users with the same groups and companies see the same rows (rules on these models
+        only depend on groups and companies), so they share cache entries; the language is
+        part of the key as names and selections are translated. """
+        return (tuple(self.env.user.groups_id.ids), tuple(self.env.companies.ids), self.env.lang)
+
+    @api.model
+    def get_catalog(self, name):
+        """ Return ``{'etag', 'records'}`` for the catalog ``name``. """
+        if name not in CATALOGS:
+            raise UserError(_('Unknown catalog "%s".', name))
+        etag, payload = self._get_catalog_payload(name, self._get_access_key(), self._get_version(name))
+        return {'etag': etag, 'records': json.loads(payload)}
+
+    def _get_version(self, name):
+        model_name = CATALOGS[name][0]
+        self.env.cr.execute("SELECT version FROM dayflow_catalog_version WHERE model = %s",
+                            [CATALOG_SOURCE_MODELS.get(model_name, model_name)])
+        row = self.env.cr.fetchone()
+        return row[0] if row else 0
+
+    @tools.ormcache('name', 'access_key', 'version')
+    def _get_catalog_payload(self, name, access_key, version):
+        model_name, domain, fields, order = CATALOGS[name]
+        records = self.env[model_name].search_read(domain, fields, order=order)
+        payload = json.dumps(records, default=date_utils.json_default, sort_keys=True)
+        return f'{version}-{hashlib.sha1(payload.encode()).hexdigest()}', payload
+
+    @api.model
+    def _get_catalog_response(self, name):
+        """ Serialized catalog and its ETag, for controllers answering conditional requests. """
+        if name not in CATALOGS:
+            raise UserError(_('Unknown catalog "%s".', name))
+        return self._get_catalog_payload(name, self._get_access_key(), self._get_version(name))
+
+    @api.model
+    def _invalidate(self, model_name, fields=None):
+        """ Called from create/write/unlink of catalog models; ``fields`` limits writes to
+        the columns that some catalog actually exposes.
+
+        Only the version of ``model_name`` is bumped, once per transaction when it commits:
+        the next request of every worker misses the cache of that model's catalogs alone.
+        """
+        for catalog_model, _domain, catalog_fields, _order in CATALOGS.values():
+            if CATALOG_SOURCE_MODELS.get(catalog_model, catalog_model) != model_name:
+                continue
+            if fields is None or set(fields) & set(catalog_fields + ['active', 'company_id']):
+                precommit = self.env.cr.precommit
+                if PRECOMMIT_KEY not in precommit.data:
+                    precommit.data[PRECOMMIT_KEY] = set()
+                    precommit.add(self._flush_versions)
+                precommit.data[PRECOMMIT_KEY].add(model_name)
+                return
+
+    def _flush_versions(self):
+        model_names = self.env.cr.precommit.data.pop(PRECOMMIT_KEY, set())
+        if not model_names:
+            return
+        now = fields.Datetime.now()
+        # Right before the commit, so the row lock is only held for the commit itself
+        self.env.cr.execute(f"""
+            INSERT INTO dayflow_catalog_version (model, version, create_uid, create_date, write_uid, write_date)
+                 VALUES {', '.join(['%s'] * len(model_names))}
+            ON CONFLICT (model) DO UPDATE
+                    SET version = dayflow_catalog_version.version + 1,
+                        write_date = EXCLUDED.write_date
+        """, [(model_name, 1, self.env.uid, now, self.env.uid, now) for model_name in sorted(model_names)])
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+
+import time
+from datetime import datetime, time as dt_time, timedelta
+
+import pytz
+
+from odoo import models, fields, api
+from odoo.tools.lru import LRU
+
+# Dashboard KPIs are shared by every page load and poll; a short TTL keeps them fresh enough
+DASHBOARD_CACHE_TTL = 60  # seconds
+MAX_TREND_DAYS = 366
+
+# (dbname, uid, company ids, days) -> (expiry, data)
+_dashboard_cache = LRU(1024)
+
+
+class DayflowDashboard(models.AbstractModel):
+    _name = 'dayflow.dashboard'
+    _description = 'Dayflow Dashboard KPIs'
+
+    @api.model
+    def get_dashboard_data(self, days=7):
+        """ Return every dashboard KPI for the current user in one payload.
+
+        Results are cached per user and company selection for ``DASHBOARD_CACHE_TTL`` seconds.
+        """
+        days = max(1, min(int(days), MAX_TREND_DAYS))
+        key = (self.env.cr.dbname, self.env.uid, tuple(self.env.companies.ids), days)
+        cached = _dashboard_cache.get(key)
+        now = time.monotonic()
+        if cached and cached[0] > now:
+            return cached[1]
+        data = self._compute_dashboard_data(days)
+        _dashboard_cache[key] = (now + DASHBOARD_CACHE_TTL, data)
+        return data
+
+    def _get_day_bounds(self, day):
+        """ UTC datetimes bounding ``day`` in the user's timezone. """
+        tz = pytz.timezone(self.env.user.tz or 'UTC')
+        start = tz.localize(datetime.combine(day, dt_time.min)).astimezone(pytz.utc).replace(tzinfo=None)
+        return start, start + timedelta(days=1)
+
+    def _compute_dashboard_data(self, days):
+        today = fields.Date.context_today(self)
+        is_hr_user = self.env.user.has_group('hr.group_hr_user')
+        data = {
+            'generated_at': fields.Datetime.to_string(fields.Datetime.now()),
+            'headcount': self._get_headcount_kpis(),
+            'attendance': self._get_attendance_kpis(today, days),
+            'leaves': self._get_leave_kpis(),
+        }
+        if is_hr_user:
+            data['payroll'] = self._get_payroll_kpis()
+            data['ratings'] = self._get_rating_kpis()
+        return data
+
+    def _get_headcount_kpis(self):
+        # Headcounts are organisation-wide figures shown to every employee
+        groups = self.env['hr.employee'].sudo()._read_group(
+            [('company_id', 'in', self.env.companies.ids)], ['department_id'], ['__count'])
+        return {
+            'total': sum(count for _department, count in groups),
+            'by_department': [{
+                'id': department.id,
+                'name': department.name,
+                'count': count,
+            } for department, count in groups if department],
+        }
+
+    def _get_attendance_kpis(self, today, days):
+        Attendance = self.env['hr.attendance'].sudo()
+        company_domain = [('employee_id.company_id', 'in', self.env.companies.ids)]
+        day_start, day_end = self._get_day_bounds(today)
+        today_domain = company_domain + [('check_in', '>=', day_start), ('check_in', '<', day_end)]
+
+        [(present,)] = Attendance._read_group(today_domain, [], ['employee_id:count_distinct'])
+        [(late,)] = Attendance._read_group(today_domain + [('attendance_status', '=', 'late')], [],
+                                           ['employee_id:count_distinct'])
+        checked_in = Attendance.search_count(company_domain + [('check_out', '=', False)])
+
+        trend_start, _trend_end = self._get_day_bounds(today - timedelta(days=days - 1))
+        trend = Attendance.with_context(tz=self.env.user.tz or 'UTC')._read_group(
+            company_domain + [('check_in', '>=', trend_start), ('check_in', '<', day_end)],
+            ['check_in:day'], ['__count'])
+        counts_by_day = {check_in.date(): count for check_in, count in trend}
+        return {
+            'present_today': present,
+            'late_today': late,
+            'checked_in_now': checked_in,
+            'trend': [{
+                'date': fields.Date.to_string(today - timedelta(days=offset)),
+                'count': counts_by_day.get(today - timedelta(days=offset), 0),
+            } for offset in range(days - 1, -1, -1)],
+        }
+
+    def _get_leave_kpis(self):
+        Leave = self.env['hr.leave'].sudo()
+        company_domain = [('employee_id.company_id', 'in', self.env.companies.ids)]
+        now = fields.Datetime.now()
+        by_state = dict(Leave._read_group(
+            company_domain + [('state', 'in', ['confirm', 'validate1'])], ['state'], ['__count']))
+        by_type = Leave._read_group(company_domain + [('state', '=', 'validate')],
+                                    ['holiday_status_id'], ['__count'])
+        return {
+            'pending': sum(by_state.values()),
+            'pending_second_approval': by_state.get('validate1', 0),
+            'on_leave_today': Leave.search_count(company_domain + [
+                ('state', '=', 'validate'), ('date_from', '<=', now), ('date_to', '>=', now)]),
+            'my_pending': self.env['hr.leave'].search_count([
+                ('state', '=', 'confirm'), ('employee_id.user_id', '=', self.env.uid)]),
+            'by_type': [{
+                'id': leave_type.id,
+                'name': leave_type.name,
+                'count': count,
+            } for leave_type, count in by_type],
+        }
+
+    def _get_payroll_kpis(self):
+        # hr.payroll.slip comes from the optional dayflow_payroll module
+        if 'hr.payroll.slip' not in self.env:
+            return {}
+        Payslip = self.env['hr.payroll.slip']
+        [(count, total_net, total_basic)] = Payslip._read_group(
+            [('state', '=', 'paid'), ('employee_id.company_id', 'in', self.env.companies.ids)],
+            [], ['__count', 'net_wage:sum', 'basic_wage:sum'])
+        return {
+            'paid_count': count,
+            'total_net': total_net or 0.0,
+            'total_basic': total_basic or 0.0,
+            'average_net': (total_net or 0.0) / count if count else 0.0,
+        }
+
+    def _get_rating_kpis(self):
+        Review = self.env['hr.performance.review']
+        domain = [('state', 'in', ['reviewed', 'acknowledged'])]
+        distribution = dict(Review._read_group(domain, ['rating_category'], ['__count']))
+        top = Review.search_read(domain, ['employee_id', 'overall_rating'],
+                                 order='overall_rating desc', limit=5)
+        return {
+            'distribution': {category: distribution.get(category, 0)
+                             for category in ['poor', 'average', 'good', 'excellent']},
+            'top_performers': [{
+                'employee_id': review['employee_id'][0],
+                'name': review['employee_id'][1],
+                'rating': review['overall_rating'],
+            } for review in top],
+        }
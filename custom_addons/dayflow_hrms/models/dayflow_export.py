@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+
+import csv
+import io
+import zlib
+
+from odoo import models, fields, api, _
+from odoo.exceptions import AccessError, UserError
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+# Rows fetched from the server-side cursor per round trip; bounds the memory of an export
+EXPORT_BATCH_SIZE = 5000
+
+EXPORT_FORMATS = {
+    'csv': ('text/csv', 'csv.gz'),
+    'parquet': ('application/vnd.apache.parquet', 'parquet'),
+}
+
+# resource -> (model, [(column, type)], query); rows are ordered so that date ranges
+# exported separately concatenate into the same data set
+EXPORT_RESOURCES = {
+    'attendance': ('hr.attendance', [
+        ('id', 'int'),
+        ('employee_id', 'int'),
+        ('employee', 'str'),
+        ('department', 'str'),
+        ('check_in', 'datetime'),
+        ('check_out', 'datetime'),
+        ('worked_hours', 'float'),
+        ('attendance_status', 'str'),
+        ('late_minutes', 'int'),
+        ('overtime_hours', 'float'),
+    ], """
+        SELECT a.id, a.employee_id, e.name, d.complete_name, a.check_in, a.check_out,
+               a.worked_hours, a.attendance_status, a.late_minutes, a.overtime_hours
+          FROM hr_attendance a
+          JOIN hr_employee e ON e.id = a.employee_id
+     LEFT JOIN hr_department d ON d.id = e.department_id
+         WHERE a.check_in >= %(date_from)s
+           AND a.check_in < %(date_to)s::date + 1
+           AND e.company_id IN %(company_ids)s
+      ORDER BY a.check_in, a.id
+    """),
+    'payslip': ('hr.payroll.slip', [
+        ('id', 'int'),
+        ('employee_id', 'int'),
+        ('employee', 'str'),
+        ('department', 'str'),
+        ('reference', 'str'),
+        ('date', 'date'),
+        ('basic_wage', 'float'),
+        ('allowances', 'float'),
+        ('deductions', 'float'),
+        ('net_wage', 'float'),
+        ('state', 'str'),
+    ], """
+        SELECT p.id, p.employee_id, e.name, d.complete_name, p.name, p.date,
+               p.basic_wage, p.allowances, p.deductions, p.net_wage, p.state
+          FROM hr_payroll_slip p
+          JOIN hr_employee e ON e.id = p.employee_id
+     LEFT JOIN hr_department d ON d.id = e.department_id
+         WHERE p.date BETWEEN %(date_from)s AND %(date_to)s
+           AND e.company_id IN %(company_ids)s
+      ORDER BY p.date, p.id
+    """),
+}
+
+
+class _StreamSink(io.RawIOBase):
+    """ Write-only file handing out what was written since the last drain (for Parquet). """
+
+    def __init__(self):
+        super().__init__()
+        self.chunks = []
+        self.position = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        self.position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self.position
+
+    def drain(self):
+        data, self.chunks = b''.join(self.chunks), []
+        return data
+
+
+class DayflowExport(models.AbstractModel):
+    _name = 'dayflow.export'
+    _description = 'Dayflow History Export'
+
+    @api.model
+    def _check_export_request(self, resource, export_format, date_from, date_to):
+        if resource not in EXPORT_RESOURCES:
+            raise UserError(_('Unknown export resource "%s".', resource))
+        if export_format not in EXPORT_FORMATS:
+            raise UserError(_('Unknown export format "%s".', export_format))
+        if export_format == 'parquet' and pyarrow is None:
+            raise UserError(_('Parquet exports require the pyarrow Python package.'))
+        model_name = EXPORT_RESOURCES[resource][0]
+        if model_name not in self.env:
+            raise UserError(_('The %s export is not available: its module is not installed.', resource))
+        # The export reads tables directly, so it is restricted to HR managers
+        if not self.env.user.has_group('hr.group_hr_manager'):
+            raise AccessError(_('Only HR managers can export history.'))
+        self.env[model_name].check_access_rights('read')
+        if fields.Date.to_date(date_from) > fields.Date.to_date(date_to):
+            raise UserError(_('The export start date must be before its end date.'))
+
+    @api.model
+    def _iter_batches(self, resource, date_from, date_to):
+        """ Yield row batches from a server-side cursor, so memory does not grow with history size. """
+        query = EXPORT_RESOURCES[resource][2]
+        cursor_name = f'dayflow_export_{resource}'
+        self.env.cr.execute(f'DECLARE {cursor_name} NO SCROLL CURSOR FOR {query}', {
+            'date_from': fields.Date.to_date(date_from),
+            'date_to': fields.Date.to_date(date_to),
+            'company_ids': tuple(self.env.companies.ids),
+        })
+        try:
+            while True:
+                self.env.cr.execute(f'FETCH FORWARD {EXPORT_BATCH_SIZE} FROM {cursor_name}')
+                rows = self.env.cr.fetchall()
+                if not rows:
+                    break
+                yield rows
+        finally:
+            self.env.cr.execute(f'CLOSE {cursor_name}')
+
+    @api.model
+    def _stream_export(self, resource, export_format, date_from, date_to):
+        """ Yield the encoded export file chunk by chunk. """
+        self._check_export_request(resource, export_format, date_from, date_to)
+        if export_format == 'parquet':
+            return self._stream_parquet(resource, date_from, date_to)
+        return self._stream_csv(resource, date_from, date_to)
+
+    def _stream_csv(self, resource, date_from, date_to):
+        compressor = zlib.compressobj(wbits=16 + zlib.MAX_WBITS)  # gzip container
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow([column for column, _type in EXPORT_RESOURCES[resource][1]])
+        for rows in self._iter_batches(resource, date_from, date_to):
+            writer.writerows(rows)
+            yield compressor.compress(buffer.getvalue().encode())
+            buffer.seek(0)
+            buffer.truncate()
+        yield compressor.compress(buffer.getvalue().encode()) + compressor.flush()
+
+    def _stream_parquet(self, resource, date_from, date_to):
+        arrow_types = {
+            'int': pyarrow.int64(),
+            'str': pyarrow.string(),
+            'float': pyarrow.float64(),
+            'date': pyarrow.date32(),
+            'datetime': pyarrow.timestamp('s'),
+        }
+        schema = pyarrow.schema([(column, arrow_types[column_type])
+                                 for column, column_type in EXPORT_RESOURCES[resource][1]])
+        sink = _StreamSink()
+        # One row group per fetched batch
+        writer = pyarrow.parquet.ParquetWriter(pyarrow.PythonFile(sink, mode='w'), schema, compression='zstd')
+        for rows in self._iter_batches(resource, date_from, date_to):
+            columns = list(zip(*rows))
+            writer.write_table(pyarrow.Table.from_arrays(
+                [pyarrow.array(values, type=field.type) for values, field in zip(columns, schema)],
+                schema=schema))
+            yield sink.drain()
+        writer.close()
+        yield sink.drain()
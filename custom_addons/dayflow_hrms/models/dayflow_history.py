@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+
+import base64
+import json
+
+from odoo import models, api, _
+from odoo.exceptions import UserError
+
+# resource -> (model, date field); pages are ordered by (date, id) descending
+HISTORY_RESOURCES = {
+    'attendance': ('hr.attendance', 'check_in'),
+    'leave': ('hr.leave', 'date_from'),
+    'payslip': ('hr.payroll.slip', 'date'),
+}
+MAX_PAGE_SIZE = 200
+
+
+def encode_cursor(date, record_id):
+    payload = json.dumps([date, record_id]).encode()
+    return base64.urlsafe_b64encode(payload).decode()
+
+
+def decode_cursor(cursor):
+    try:
+        date, record_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return date, int(record_id)
+    except (ValueError, TypeError):
+        raise UserError(_('Invalid pagination cursor.'))
+
+
+class DayflowHistory(models.AbstractModel):
+    _name = 'dayflow.history'
+    _description = 'Dayflow History Pagination'
+
+    @api.model
+    def get_page(self, resource, domain=None, fields=None, cursor=None, limit=50):
+        """ Return one page of attendance, leave or payslip history using keyset pagination.
+
+        Instead of an OFFSET, the opaque ``cursor`` holds the (date, id) of the last row of
+        the previous page and the next page starts strictly after it, so every page costs
+        one index range scan whatever its depth. ``fields`` restricts the columns read.
+        """
+        if resource not in HISTORY_RESOURCES:
+            raise UserError(_('Unknown history resource "%s".', resource))
+        model_name, date_field = HISTORY_RESOURCES[resource]
+        if model_name not in self.env:
+            raise UserError(_('The %s history is not available: its module is not installed.', resource))
+        Model = self.env[model_name]
+        limit = max(1, min(int(limit), MAX_PAGE_SIZE))
+
+        fields = [name for name in (fields or []) if name in Model._fields] or [date_field]
+        read_fields = list(dict.fromkeys(fields + [date_field]))
+
+        domain = list(domain or [])
+        if cursor:
+            date, record_id = decode_cursor(cursor)
+            # The redundant upper bound is what PostgreSQL can turn into an index range start;
+            # the OR alone only filters rows scanned from the newest one
+            domain += [(date_field, '<=', date),
+                       '|', (date_field, '<', date), '&', (date_field, '=', date), ('id', '<', record_id)]
+
+        records = Model.search_read(domain, read_fields, order=f'{date_field} desc, id desc', limit=limit + 1)
+        has_more = len(records) > limit
+        records = records[:limit]
+        next_cursor = False
+        if has_more:
+            last = records[-1]
+            next_cursor = encode_cursor(Model._fields[date_field].to_string(last[date_field]), last['id'])
+        return {
+            'records': records,
+            'next_cursor': next_cursor,
+        }
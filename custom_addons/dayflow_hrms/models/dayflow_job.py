@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+
+import json
+import logging
+import time
+
+from odoo import models, fields, api, _
+from odoo.exceptions import UserError
+from odoo.tools import date_utils
+
+_logger = logging.getLogger(__name__)
+
+# A worker cron run stops picking chunks after this long, well below the cron time limit
+JOB_TIME_BUDGET = 240  # seconds
+JOB_STATUS_FIELDS = ['name', 'state', 'progress', 'done_count', 'total_count', 'attempts',
+                     'error', 'date_started', 'date_finished']
+# One cron can only run in one worker at a time: each of these processes jobs in parallel
+# (up to the server's max_cron_threads)
+JOB_WORKER_CRONS = ['dayflow_hrms.ir_cron_dayflow_job_worker', 'dayflow_hrms.ir_cron_dayflow_job_worker_2']
+
+
+class DayflowJob(models.Model):
+    _name = 'dayflow.job'
+    _description = 'Dayflow Background Job'
+    _order = 'id desc'
+
+    name = fields.Char(string='Job', required=True)
+    user_id = fields.Many2one('res.users', string='Requested By', required=True, index=True,
+                              default=lambda self: self.env.user, ondelete='cascade')
+    company_id = fields.Many2one('res.company', string='Company', required=True,
+                                 default=lambda self: self.env.company)
+    state = fields.Selection([
+        ('pending', 'Pending'),
+        ('running', 'Running'),
+        ('done', 'Done'),
+        ('failed', 'Failed'),
+        ('cancelled', 'Cancelled'),
+    ], string='Status', required=True, default='pending', index=True)
+
+    # What to run: ``method`` is called on the records (call_mode "records") or on the
+    # model with the chunk of items as first argument (call_mode "items")
+    model_name = fields.Char(string='Model', required=True)
+    method_name = fields.Char(string='Method', required=True)
+    call_mode = fields.Selection([
+        ('records', 'On Records'),
+        ('items', 'On Items'),
+    ], string='Call Mode', required=True, default='records')
+    items = fields.Json(string='Items')
+    kwargs = fields.Json(string='Arguments')
+    chunk_size = fields.Integer(string='Chunk Size', default=100)
+
+    done_count = fields.Integer(string='Processed', readonly=True)
+    total_count = fields.Integer(string='Total', readonly=True)
+    progress = fields.Float(string='Progress', compute='_compute_progress')
+    attempts = fields.Integer(string='Failed Attempts', readonly=True,
+                              help='Consecutive failures of the current chunk.')
+    max_retries = fields.Integer(string='Max Retries', default=3)
+    error = fields.Text(string='Last Error', readonly=True)
+    date_started = fields.Datetime(string='Started', readonly=True)
+    date_finished = fields.Datetime(string='Finished', readonly=True)
+
+    @api.depends('done_count', 'total_count')
+    def _compute_progress(self):
+        for job in self:
+            job.progress = 100.0 * job.done_count / job.total_count if job.total_count else 0.0
+
+    @api.model
+    def _enqueue(self, records, method, name, kwargs=None, chunk_size=100):
+        """ Run ``records.method(**kwargs)`` in the background, ``chunk_size`` records at a time. """
+        return self._create_job(records._name, method, 'records', records.ids, name, kwargs, chunk_size)
+
+    @api.model
+    def _enqueue_items(self, model_name, method, items, name, kwargs=None, chunk_size=100):
+        """ Run ``env[model_name].method(chunk, **kwargs)`` over JSON-serializable ``items``. """
+        return self._create_job(model_name, method, 'items', items, name, kwargs, chunk_size)
+
+    def _create_job(self, model_name, method, call_mode, items, name, kwargs, chunk_size):
+        if method.startswith('__') or not hasattr(self.env[model_name], method):
+            raise UserError(_('%(model)s has no method %(method)s.', model=model_name, method=method))
+        # Round-trip through JSON now, so dates and the like fail at enqueue time, not in the worker
+        items, kwargs = json.loads(json.dumps([items, kwargs or {}], default=date_utils.json_default))
+        job = self.sudo().create({
+            'name': name,
+            'user_id': self.env.uid,
+            'company_id': self.env.company.id,
+            'model_name': model_name,
+            'method_name': method,
+            'call_mode': call_mode,
+            'items': items,
+            'kwargs': kwargs,
+            'chunk_size': max(chunk_size, 1),
+            'total_count': len(items),
+        })
+        self._trigger_workers()
+        return job.with_env(self.env)
+
+    @api.model
+    def _trigger_workers(self):
+        for xmlid in JOB_WORKER_CRONS:
+            worker = self.env.ref(xmlid, raise_if_not_found=False)
+            if worker:
+                worker.sudo()._trigger()
+
+    def _check_job_access(self):
+        # Job definitions are not writable through RPC (they name the method to run), so
+        # state changes go through sudo once the user is known to see the jobs
+        self.check_access_rights('read')
+        self.check_access_rule('read')
+
+    def action_cancel(self):
+        """ Stop the jobs before their next chunk; chunks already committed are kept. """
+        self._check_job_access()
+        self.sudo().filtered(lambda j: j.state in ['pending', 'running']).write({
+            'state': 'cancelled',
+            'date_finished': fields.Datetime.now(),
+        })
+        return True
+
+    def action_retry(self):
+        self._check_job_access()
+        self.sudo().filtered(lambda j: j.state == 'failed').write({
+            'state': 'pending',
+            'attempts': 0,
+            'error': False,
+            'date_finished': False,
+        })
+        self._trigger_workers()
+        return True
+
+    @api.model
+    def get_status(self, job_ids):
+        """ Progress of the given jobs, for clients polling instead of waiting on a request. """
+        return self.browse(job_ids).exists().read(JOB_STATUS_FIELDS)
+
+    def _acquire_next_job(self):
+        """ Lock the least recently touched runnable job; parallel workers skip it until our commit. """
+        self.env.cr.execute("""
+            SELECT id FROM dayflow_job
+             WHERE state IN ('pending', 'running')
+          ORDER BY write_date, id
+             LIMIT 1
+               FOR UPDATE SKIP LOCKED
+        """)
+        row = self.env.cr.fetchone()
+        return self.browse(row[0]) if row else self.browse()
+
+    def _run_next_chunk(self):
+        self.ensure_one()
+        if self.state == 'pending':
+            self.write({'state': 'running', 'date_started': fields.Datetime.now()})
+        chunk = self.items[self.done_count:self.done_count + self.chunk_size]
+        # Run with the rights and company of the requester, as the synchronous action would
+        env = self.env(user=self.user_id.id, context=dict(
+            self.env.context, allowed_company_ids=[self.company_id.id]))
+        target = env[self.model_name]
+        try:
+            with self.env.cr.savepoint():
+                if self.call_mode == 'records':
+                    getattr(target.browse(chunk).exists(), self.method_name)(**self.kwargs)
+                else:
+                    getattr(target, self.method_name)(chunk, **self.kwargs)
+                env.flush_all()
+        except Exception as e:
+            self.env.invalidate_all()
+            _logger.warning('Job %s (%s) failed on items %s-%s', self.id, self.name,
+                            self.done_count, self.done_count + len(chunk), exc_info=True)
+            vals = {'attempts': self.attempts + 1, 'error': str(e)}
+            if vals['attempts'] > self.max_retries:
+                vals.update(state='failed', date_finished=fields.Datetime.now())
+            self.write(vals)
+            return
+        done_count = self.done_count + len(chunk)
+        vals = {'done_count': done_count, 'attempts': 0}
+        if done_count >= self.total_count:
+            vals.update(state='done', error=False, date_finished=fields.Datetime.now())
+        self.write(vals)
+
+    @api.model
+    def _cron_process_jobs(self):
+        """ Work through queued jobs one chunk per transaction until the time budget is spent.
+
+        Each processed chunk updates the job's write_date, which sends it to the back of the
+        line: a large job does not hold back the ones queued after it for more than one chunk.
+        """
+        deadline = time.monotonic() + JOB_TIME_BUDGET
+        Job = self.sudo()
+        while time.monotonic() < deadline:
+            job = Job._acquire_next_job()
+            if not job:
+                return
+            job._run_next_chunk()
+            self.env.cr.commit()
+        # Out of time with work left: run again as soon as a cron worker is free
+        self._trigger_workers()
+
+    @api.autovacuum
+    def _gc_finished_jobs(self):
+        limit_date = fields.Datetime.subtract(fields.Datetime.now(), days=30)
+        self.sudo().search([
+            ('state', 'in', ['done', 'cancelled']),
+            ('date_finished', '<', limit_date),
+        ]).unlink()
@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+
+from datetime import timedelta
+
+import pytz
+
+from odoo import models, fields, api, tools, _
+
+# Employees who have not checked in by this local hour get a reminder (until the end of the work day)
+ATTENDANCE_REMINDER_HOUR = 10
+ATTENDANCE_REMINDER_END_HOUR = 18
+
+# Read notifications older than this are removed by the autovacuum
+NOTIFICATION_RETENTION_DAYS = 30
+
+FEED_FIELDS = ['notification_type', 'title', 'message', 'priority', 'res_model', 'res_id', 'is_read',
+               'create_date']
+
+
+class DayflowNotification(models.Model):
+    _name = 'dayflow.notification'
+    _description = 'Dayflow Notification'
+    _order = 'id desc'
+
+    user_id = fields.Many2one('res.users', string='Recipient', required=True, index=True, ondelete='cascade')
+    notification_type = fields.Selection([
+        ('leave_request', 'Leave Request'),
+        ('leave_approved', 'Leave Approved'),
+        ('leave_rejected', 'Leave Rejected'),
+        ('review_due', 'Review Due'),
+        ('review_update', 'Review Update'),
+        ('attendance_alert', 'Attendance Alert'),
+        ('system', 'System'),
+    ], string='Type', required=True, default='system')
+    title = fields.Char(string='Title', required=True)
+    message = fields.Text(string='Message')
+    priority = fields.Selection([
+        ('low', 'Low'),
+        ('medium', 'Medium'),
+        ('high', 'High'),
+    ], string='Priority', default='medium')
+    res_model = fields.Char(string='Related Model')
+    res_id = fields.Many2oneReference(string='Related Record', model_field='res_model')
+    key = fields.Char(string='Key', help='Identifies reminders so that they are only generated once per recipient.')
+    is_read = fields.Boolean(string='Read', default=False)
+
+    def init(self):
+        # Feed queries are always "this user's notifications after cursor id"
+        tools.create_index(self._cr, 'dayflow_notification_user_id_id_index',
+                           self._table, ['user_id', 'id'])
+        tools.create_index(self._cr, 'dayflow_notification_user_id_key_index',
+                           self._table, ['user_id', 'key'], where='key IS NOT NULL')
+
+    @api.model
+    def _notify(self, vals_list):
+        """ Create notifications and wake up the recipients' bus channels.
+
+        Hooks call this from whatever user triggered the event, hence the sudo. Imports and
+        data generators set ``dayflow_skip_notifications`` in the context to notify nobody.
+        """
+        if self.env.context.get('dayflow_skip_notifications'):
+            return self.browse()
+        vals_list = [vals for vals in vals_list if vals.get('user_id')]
+        if not vals_list:
+            return self.browse()
+        notifications = self.sudo().create(vals_list)
+        cursors = {}
+        for notification in notifications:
+            cursors[notification.user_id] = max(cursors.get(notification.user_id, 0), notification.id)
+        self.env['bus.bus']._sendmany([
+            (user.partner_id, 'dayflow.notification/new', {'cursor': cursor})
+            for user, cursor in cursors.items()
+        ])
+        return notifications
+
+    @api.model
+    def _filter_new_keys(self, vals_list):
+        """ Drop reminder values whose (recipient, key) already exists. """
+        keys = {vals['key'] for vals in vals_list}
+        users = {vals['user_id'] for vals in vals_list}
+        existing = {
+            (notification['user_id'][0], notification['key'])
+            for notification in self.sudo().search_read(
+                [('key', 'in', list(keys)), ('user_id', 'in', list(users))], ['user_id', 'key'])
+        }
+        return [vals for vals in vals_list if (vals['user_id'], vals['key']) not in existing]
+
+    @api.model
+    def get_feed(self, since=0, limit=50):
+        """ Notifications of the current user created after the ``since`` cursor.
+
+        Pages forward from the cursor, oldest first, so that nothing is skipped when more than
+        ``limit`` notifications arrived: clients poll again while ``has_more`` is set.
+        """
+        since = int(since or 0)
+        notifications = self.search_read(
+            [('user_id', '=', self.env.uid), ('id', '>', since)],
+            FEED_FIELDS, order='id asc', limit=limit)
+        return {
+            'cursor': notifications[-1]['id'] if notifications else since,
+            'has_more': bool(limit) and len(notifications) == limit,
+            'notifications': notifications,
+        }
+
+    def action_mark_read(self):
+        self.write({'is_read': True})
+
+    @api.model
+    def _cron_generate_reminders(self):
+        self.env['dayflow.attendance.status']._build_snapshot()
+        self._generate_attendance_reminders()
+        self._generate_overdue_review_reminders()
+
+    @api.model
+    def _generate_attendance_reminders(self):
+        now = fields.Datetime.now()
+        candidates = {}
+        for employee in self.env['hr.employee'].search([('user_id', '!=', False)]):
+            tz = pytz.timezone(employee.tz or 'UTC')
+            local_now = pytz.utc.localize(now).astimezone(tz)
+            if local_now.weekday() >= 5 or \
+                    not ATTENDANCE_REMINDER_HOUR <= local_now.hour < ATTENDANCE_REMINDER_END_HOUR:
+                continue
+            candidates[employee] = local_now.date()
+        if not candidates:
+            return
+
+        # The status snapshot already knows who has neither punched in nor is on leave; its rows
+        # are dated with each employee's local day, like the candidates
+        rows = self.env['dayflow.attendance.status'].sudo().search_read([
+            ('date', 'in', list(set(candidates.values()))),
+            ('employee_id', 'in', [employee.id for employee in candidates]),
+            ('status', 'in', ['not_yet_in', 'absent']),
+        ], ['employee_id', 'date'])
+        missing = {(row['employee_id'][0], row['date']) for row in rows}
+
+        vals_list = []
+        for employee, day in candidates.items():
+            if (employee.id, day) not in missing:
+                continue
+            vals_list.append({
+                'user_id': employee.user_id.id,
+                'notification_type': 'attendance_alert',
+                'title': _('Attendance Reminder'),
+                'message': _("You haven't checked in today. Don't forget to mark your attendance!"),
+                'priority': 'medium',
+                'key': f'attendance-missing-{day}',
+            })
+        if vals_list:
+            self._notify(self._filter_new_keys(vals_list))
+
+    @api.model
+    def _generate_overdue_review_reminders(self):
+        reviews = self.env['hr.performance.review'].search([
+            ('state', 'in', ['draft', 'submitted']),
+            ('date_to', '<', fields.Date.context_today(self)),
+        ])
+        vals_list = [{
+            'user_id': review.reviewer_id.id,
+            'notification_type': 'review_due',
+            'title': _('Performance Review Overdue'),
+            'message': _('Review for %(employee)s was due on %(date)s',
+                         employee=review.employee_id.name, date=review.date_to),
+            'priority': 'high',
+            'res_model': review._name,
+            'res_id': review.id,
+            'key': f'review-due-{review.id}',
+        } for review in reviews]
+        if vals_list:
+            self._notify(self._filter_new_keys(vals_list))
+
+    @api.autovacuum
+    def _gc_read_notifications(self):
+        limit_date = fields.Datetime.now() - timedelta(days=NOTIFICATION_RETENTION_DAYS)
+        self.sudo().search([('is_read', '=', True), ('create_date', '<', limit_date)]).unlink()
@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+
+import functools
+import inspect
+import logging
+import time
+from collections import defaultdict, deque
+from datetime import datetime, timezone
+
+from odoo import models, fields, api, SUPERUSER_ID, _
+from odoo.modules.registry import Registry
+from odoo.tools import str2bool
+
+_logger = logging.getLogger(__name__)
+
+# Instrumentation is opt-in: set this system parameter to 1 and restart the server
+INSTRUMENTATION_PARAM = 'dayflow.instrumentation'
+INSTRUMENTED_MODULE_PREFIX = 'odoo.addons.dayflow_'
+# Calls kept in memory per database between two flushes; the oldest are dropped beyond that
+BUFFER_SIZE = 10000
+FLUSH_INTERVAL = 60  # seconds
+
+# Process-wide state, per database: each worker process buffers its own calls
+_enabled_dbs = set()
+_buffers = defaultdict(lambda: deque(maxlen=BUFFER_SIZE))
+_last_flush = defaultdict(float)
+_flush_scheduled = set()
+
+
+def record_call(cr, kind, name, records, seconds, queries):
+    """ Buffer one call; schedule a flush after the current transaction when one is due. """
+    dbname = cr.dbname
+    _buffers[dbname].append((kind, name, records, seconds, queries, time.time()))
+    if time.monotonic() - _last_flush[dbname] > FLUSH_INTERVAL and dbname not in _flush_scheduled:
+        _flush_scheduled.add(dbname)
+        # Once the transaction is over: the flush has its own and must not wait on our locks
+        cr.postcommit.add(functools.partial(_flush_buffer, dbname))
+        cr.postrollback.add(functools.partial(_flush_buffer, dbname))
+
+
+def _drain_buffer(dbname):
+    """ Pop the buffered calls of ``dbname``, aggregated per (kind, name). """
+    buffer = _buffers[dbname]
+    stats = {}
+    while buffer:
+        try:
+            kind, name, records, seconds, queries, called_at = buffer.popleft()
+        except IndexError:
+            break
+        stat = stats.setdefault((kind, name), [0, 0, 0.0, 0.0, 0, 0.0])
+        stat[0] += 1
+        stat[1] += records
+        stat[2] += 1000 * seconds
+        stat[3] = max(stat[3], 1000 * seconds)
+        stat[4] += queries
+        stat[5] = max(stat[5], called_at)
+    _last_flush[dbname] = time.monotonic()
+    _flush_scheduled.discard(dbname)
+    return stats
+
+
+def _flush_buffer(dbname):
+    stats = _drain_buffer(dbname)
+    if not stats:
+        return
+    try:
+        with Registry(dbname).cursor() as cr:
+            api.Environment(cr, SUPERUSER_ID, {})['dayflow.perf.stat']._merge_stats(stats)
+    except Exception:
+        _logger.warning('Could not flush the instrumentation buffer of %s', dbname, exc_info=True)
+
+
+def _instrument(kind, name, method):
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        cr = self.env.cr
+        queries = cr.sql_log_count
+        started = time.perf_counter()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            record_call(cr, kind, name, len(self), time.perf_counter() - started, cr.sql_log_count - queries)
+    wrapper.origin = method
+    wrapper._dayflow_instrumented = True
+    return wrapper
+
+
+def instrument_route(endpoint):
+    """ Record the calls of a controller handler when instrumentation is enabled.
+
+    Goes below ``@http.route``, so that the route sees the handler's own signature.
+    """
+    from odoo.http import request
+    name = endpoint.__qualname__
+
+    @functools.wraps(endpoint)
+    def wrapper(self, *args, **kwargs):
+        if request.db not in _enabled_dbs:
+            return endpoint(self, *args, **kwargs)
+        cr = request.env.cr
+        queries = cr.sql_log_count
+        started = time.perf_counter()
+        try:
+            return endpoint(self, *args, **kwargs)
+        finally:
+            # The handler may have switched users; the cursor stays the same
+            record_call(cr, 'route', name, 0, time.perf_counter() - started, cr.sql_log_count - queries)
+    return wrapper
+
+
+class DayflowPerfStat(models.Model):
+    """ Cumulative call statistics of the Dayflow computes, constraints and API routes. """
+    _name = 'dayflow.perf.stat'
+    _description = 'Dayflow Hot Path'
+    _order = 'total_time desc'
+
+    kind = fields.Selection([
+        ('compute', 'Compute'),
+        ('constraint', 'Constraint'),
+        ('route', 'Route'),
+    ], string='Kind', required=True, readonly=True)
+    name = fields.Char(string='Code Path', required=True, readonly=True)
+    call_count = fields.Integer(string='Calls', readonly=True)
+    record_count = fields.Integer(string='Records', readonly=True)
+    total_time = fields.Float(string='Total Time (ms)', readonly=True, digits=(16, 1))
+    max_time = fields.Float(string='Slowest Call (ms)', readonly=True, digits=(16, 1))
+    query_count = fields.Integer(string='SQL Queries', readonly=True)
+    avg_time = fields.Float(string='Average Time (ms)', compute='_compute_averages', digits=(16, 2))
+    avg_queries = fields.Float(string='Queries per Call', compute='_compute_averages', digits=(16, 1))
+    last_call = fields.Datetime(string='Last Call', readonly=True)
+
+    _sql_constraints = [
+        ('kind_name_unique', 'unique(kind, name)', 'Code paths are aggregated in a single row.'),
+    ]
+
+    @api.depends('call_count', 'total_time', 'query_count')
+    def _compute_averages(self):
+        for stat in self:
+            stat.avg_time = stat.total_time / stat.call_count if stat.call_count else 0.0
+            stat.avg_queries = stat.query_count / stat.call_count if stat.call_count else 0.0
+
+    def _register_hook(self):
+        super(DayflowPerfStat, self)._register_hook()
+        if not str2bool(self.env['ir.config_parameter'].sudo().get_param(INSTRUMENTATION_PARAM, 'False')):
+            _enabled_dbs.discard(self.env.cr.dbname)
+            return
+        _enabled_dbs.add(self.env.cr.dbname)
+        count = 0
+        for Model in self.env.registry.values():
+            for kind, method_name in self._get_instrumented_methods(Model):
+                method = getattr(Model, method_name)
+                if getattr(method, '_dayflow_instrumented', False) or \
+                        not method.__module__.startswith(INSTRUMENTED_MODULE_PREFIX):
+                    continue
+                setattr(Model, method_name, _instrument(kind, f'{Model._name}.{method_name}', method))
+                count += 1
+            # Constraint methods are collected once per model class: collect them again
+            if '_constraint_methods' in Model.__dict__:
+                del Model._constraint_methods
+        _logger.info('Dayflow instrumentation enabled on %s methods', count)
+
+    def _unregister_hook(self):
+        for Model in self.env.registry.values():
+            for _kind, method_name in self._get_instrumented_methods(Model):
+                method = Model.__dict__.get(method_name)
+                if getattr(method, '_dayflow_instrumented', False):
+                    setattr(Model, method_name, method.origin)
+            if '_constraint_methods' in Model.__dict__:
+                del Model._constraint_methods
+        super(DayflowPerfStat, self)._unregister_hook()
+
+    @api.model
+    def _get_instrumented_methods(self, Model):
+        methods = {('compute', field.compute) for field in Model._fields.values() if isinstance(field.compute, str)}
+        methods.update(('constraint', method_name) for method_name, _method in inspect.getmembers(
+            Model, lambda member: callable(member) and hasattr(member, '_constrains')))
+        return methods - {('compute', '_compute_averages')}
+
+    @api.model
+    def _merge_stats(self, stats):
+        """ Add aggregated calls to their rows in one statement, safe with concurrent flushes. """
+        now = fields.Datetime.now()
+        rows = [
+            (kind, name, calls, records, total, slowest, queries,
+             datetime.fromtimestamp(last_call, timezone.utc).replace(tzinfo=None),
+             self.env.uid, now, self.env.uid, now)
+            for (kind, name), (calls, records, total, slowest, queries, last_call) in stats.items()
+        ]
+        self.env.cr.execute(f"""
+            INSERT INTO dayflow_perf_stat (kind, name, call_count, record_count, total_time, max_time,
+                                           query_count, last_call, create_uid, create_date, write_uid, write_date)
+                 VALUES {', '.join(['%s'] * len(rows))}
+            ON CONFLICT (kind, name) DO UPDATE
+                    SET call_count = dayflow_perf_stat.call_count + EXCLUDED.call_count,
+                        record_count = dayflow_perf_stat.record_count + EXCLUDED.record_count,
+                        total_time = dayflow_perf_stat.total_time + EXCLUDED.total_time,
+                        max_time = GREATEST(dayflow_perf_stat.max_time, EXCLUDED.max_time),
+                        query_count = dayflow_perf_stat.query_count + EXCLUDED.query_count,
+                        last_call = GREATEST(dayflow_perf_stat.last_call, EXCLUDED.last_call),
+                        write_uid = EXCLUDED.write_uid,
+                        write_date = EXCLUDED.write_date
+        """, rows)
+        self.invalidate_model()
+
+    @api.model
+    def _cron_flush_stats(self):
+        """ Flush the calls buffered by the cron worker itself; HTTP workers flush after their requests. """
+        stats = _drain_buffer(self.env.cr.dbname)
+        if stats:
+            self._merge_stats(stats)
+
+    @api.model
+    def get_hot_paths(self, limit=20, kind=None):
+        """ The code paths that took the most time, for the JSON endpoint. """
+        self.check_access_rights('read')
+        self._cron_flush_stats()
+        return self.search_read(
+            [('kind', '=', kind)] if kind else [],
+            ['kind', 'name', 'call_count', 'record_count', 'total_time', 'max_time', 'query_count',
+             'avg_time', 'avg_queries', 'last_call'],
+            limit=limit)
+
+    @api.model
+    def action_reset_stats(self):
+        self.check_access_rights('unlink')
+        _drain_buffer(self.env.cr.dbname)
+        self.search([]).unlink()
+        return {'type': 'ir.actions.client', 'tag': 'reload'}
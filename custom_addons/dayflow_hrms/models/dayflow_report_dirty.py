@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+
+import logging
+from collections import defaultdict
+from datetime import timedelta
+
+from odoo import models, fields, api, _
+from odoo.osv import expression
+
+_logger = logging.getLogger(__name__)
+
+# Saved report models to recompute when records of a source change; missing models are skipped
+REPORT_SOURCES = {
+    'attendance': ['hr.attendance.report'],
+    'leave': ['hr.leave.analysis'],
+    'review': ['hr.performance.report', 'hr.performance.calibration'],
+}
+PRECOMMIT_KEY = 'dayflow.report.dirty'
+
+
+class DayflowReportDirty(models.Model):
+    """ A period whose source data changed since the saved reports covering it were computed. """
+    _name = 'dayflow.report.dirty'
+    _description = 'Dayflow Dirty Report Period'
+    _order = 'id'
+
+    source = fields.Selection([
+        ('attendance', 'Attendance'),
+        ('leave', 'Leave'),
+        ('review', 'Performance Review'),
+    ], string='Source', required=True)
+    date_from = fields.Date(string='From Date', required=True)
+    date_to = fields.Date(string='To Date', required=True)
+    department_id = fields.Many2one('hr.department', string='Department', ondelete='cascade',
+                                    help='Empty when the changed records have no department.')
+
+    @api.model
+    def _mark_dirty(self, source, periods):
+        """ Queue ``(date_from, date_to, department_id)`` periods of ``source`` for the next refresh.
+
+        Periods are collected for the whole transaction and inserted once, deduplicated, when it
+        commits; nothing is written if it rolls back.
+        """
+        periods = {(source, date_from, date_to, department_id or None)
+                   for date_from, date_to, department_id in periods}
+        if not periods:
+            return
+        precommit = self.env.cr.precommit
+        if PRECOMMIT_KEY not in precommit.data:
+            precommit.data[PRECOMMIT_KEY] = set()
+            precommit.add(self._flush_dirty_periods)
+        precommit.data[PRECOMMIT_KEY].update(periods)
+
+    def _flush_dirty_periods(self):
+        rows = self.env.cr.precommit.data.pop(PRECOMMIT_KEY, set())
+        if not rows:
+            return
+        now = fields.Datetime.now()
+        self.env.cr.execute(f"""
+            INSERT INTO dayflow_report_dirty (source, date_from, date_to, department_id,
+                                              create_uid, create_date, write_uid, write_date)
+                 VALUES {', '.join(['%s'] * len(rows))}
+        """, [(*row, self.env.uid, now, self.env.uid, now) for row in rows])
+
+    @api.model
+    def _cron_refresh_reports(self):
+        """ Recompute the saved reports overlapping a dirty period, and only those.
+
+        The dirty periods are consumed in the same transaction: if the refresh fails, they are
+        kept for the next run.
+        """
+        self.env.flush_all()
+        self.env.cr.execute("DELETE FROM dayflow_report_dirty RETURNING source, date_from, date_to, department_id")
+        rows = self.env.cr.fetchall()
+        if not rows:
+            return
+        self.invalidate_model()
+        self.env['dayflow.analytics.fact']._patch_facts([row[1:] for row in rows])
+
+        periods = defaultdict(set)
+        for source, date_from, date_to, department_id in rows:
+            for model in REPORT_SOURCES.get(source, ()):
+                if model in self.env:
+                    periods[model, department_id].add((date_from, date_to))
+
+        # One search per report model and department, matching any of its distinct periods
+        reports = defaultdict(list)
+        for (model, department_id), model_periods in periods.items():
+            domain = expression.OR([
+                [('date_from', '<=', date_to), ('date_to', '>=', date_from)]
+                for date_from, date_to in self._merge_periods(model_periods)
+            ])
+            # Records without department may belong to any report; company-wide reports see every department
+            if department_id:
+                domain = expression.AND([domain, ['|', ('department_id', '=', False),
+                                                  ('department_id', '=', department_id)]])
+            reports[model].extend(self.env[model].sudo().search(domain).ids)
+
+        for model, report_ids in reports.items():
+            self._recompute_reports(self.env[model].sudo().browse(set(report_ids)))
+        _logger.info('Refreshed %s saved reports from %s dirty periods',
+                     sum(len(set(ids)) for ids in reports.values()), len(rows))
+
+    @api.model
+    def _merge_periods(self, periods):
+        """ Merge overlapping or adjacent periods only: reports between two distinct periods
+        are not affected by either. """
+        merged = []
+        for date_from, date_to in sorted(periods):
+            if merged and date_from <= merged[-1][1] + timedelta(days=1):
+                merged[-1] = (merged[-1][0], max(merged[-1][1], date_to))
+            else:
+                merged.append((date_from, date_to))
+        return merged
+
+    @api.model
+    def _recompute_reports(self, reports):
+        if not reports:
+            return
+        for field in reports._fields.values():
+            if field.compute == '_compute_report_data':
+                self.env.add_to_compute(field, reports)
+        reports.flush_recordset()
@@ -1,9 +1,12 @@
 # -*- coding: utf-8 -*-
 
-from odoo import models, fields, api, _
+from odoo import models, fields, api, tools, _
 from odoo.exceptions import ValidationError
 from datetime import datetime, timedelta
 
+# Older punches are corrections or imports, not someone arriving late right now
+LATE_NOTIFICATION_MAX_AGE = timedelta(hours=12)
+
 
 class HrAttendanceExtended(models.Model):
     _inherit = 'hr.attendance'
@@ -27,6 +30,64 @@ class HrAttendanceExtended(models.Model):
     check_out_latitude = fields.Float(string='Check-out Latitude', digits=(10, 7))
     check_out_longitude = fields.Float(string='Check-out Longitude', digits=(10, 7))
 
+    def init(self):
+        super(HrAttendanceExtended, self).init()
+        # Keyset pagination of an employee's history seeks on (check_in, id)
+        tools.create_index(self._cr, 'hr_attendance_employee_check_in_id_index',
+                           self._table, ['employee_id', 'check_in', 'id'])
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        attendances = super(HrAttendanceExtended, self).create(vals_list)
+        recent = fields.Datetime.now() - LATE_NOTIFICATION_MAX_AGE
+        attendances.filtered(lambda a: a.attendance_status == 'late' and a.check_in >= recent)._notify_late_check_in()
+        attendances._refresh_status_snapshot()
+        attendances._mark_reports_dirty()
+        return attendances
+
+    def write(self, vals):
+        punches_changed = bool({'check_in', 'check_out', 'employee_id'} & set(vals))
+        if punches_changed:
+            self._mark_reports_dirty()
+        res = super(HrAttendanceExtended, self).write(vals)
+        if punches_changed:
+            self._refresh_status_snapshot()
+            self._mark_reports_dirty()
+        return res
+
+    def unlink(self):
+        self._mark_reports_dirty()
+        return super(HrAttendanceExtended, self).unlink()
+
+    def _mark_reports_dirty(self):
+        # check_in is UTC: its local date may be the day before or after
+        self.env['dayflow.report.dirty']._mark_dirty('attendance', [
+            (attendance.check_in.date() - timedelta(days=1), attendance.check_in.date() + timedelta(days=1),
+             attendance.employee_id.department_id.id)
+            for attendance in self if attendance.check_in
+        ])
+
+    def _refresh_status_snapshot(self):
+        # "Today" is the employee's, in their timezone
+        Status = self.env['dayflow.attendance.status']
+        punched_today = self.filtered(
+            lambda a: a.check_in and Status._get_today_bounds(a.employee_id)[0] <= a.check_in
+            < Status._get_today_bounds(a.employee_id)[1])
+        if punched_today:
+            Status._refresh_employees(punched_today.employee_id)
+
+    def _notify_late_check_in(self):
+        self.env['dayflow.notification']._notify([{
+            'user_id': attendance.employee_id.parent_id.user_id.id,
+            'notification_type': 'attendance_alert',
+            'title': _('Late Check-in'),
+            'message': _('%(employee)s checked in %(minutes)s minutes late',
+                         employee=attendance.employee_id.name, minutes=attendance.late_minutes),
+            'priority': 'low',
+            'res_model': attendance._name,
+            'res_id': attendance.id,
+        } for attendance in self])
+
     @api.depends('check_in', 'check_out')
     def _compute_attendance_status(self):
         for attendance in self:
@@ -91,6 +152,10 @@ class HrAttendanceReport(models.Model):
     
     date = fields.Date(string='Report Date', default=fields.Date.today)
 
+    # Bulk generation
+    batch_ref = fields.Char(string='Batch', index=True, readonly=True, copy=False)
+    pdf_attachment_id = fields.Many2one('ir.attachment', string='PDF', readonly=True, copy=False)
+
     @api.depends('date_from', 'date_to', 'employee_id', 'department_id')
     def _compute_report_data(self):
         for report in self:
@@ -118,4 +183,45 @@ class HrAttendanceReport(models.Model):
 
     def action_generate_report(self):
         self.ensure_one()
-        return self.env.ref('dayflow_hrms.action_attendance_report').report_action(self)
+        return self.env.ref('dayflow_hrms.report_attendance_report_pdf').report_action(self)
+
+    def _get_pdf_lines(self):
+        """ Rows of the PDF: the punches of an employee report, the totals per employee otherwise. """
+        self.ensure_one()
+        domain = [('check_in', '>=', self.date_from), ('check_in', '<=', self.date_to)]
+        if self.employee_id:
+            return self.env['hr.attendance'].search(domain + [('employee_id', '=', self.employee_id.id)],
+                                                    order='check_in')
+        if self.department_id:
+            domain.append(('employee_id.department_id', '=', self.department_id.id))
+        lines = {}
+        for employee, status, count, hours, overtime in self.env['hr.attendance']._read_group(
+                domain, ['employee_id', 'attendance_status'], ['__count', 'worked_hours:sum', 'overtime_hours:sum']):
+            line = lines.setdefault(employee, {'employee': employee, 'days': 0, 'late_days': 0,
+                                               'hours': 0.0, 'overtime': 0.0})
+            line['days'] += count if status in ['present', 'late'] else 0
+            line['late_days'] += count if status == 'late' else 0
+            line['hours'] += hours
+            line['overtime'] += overtime
+        return sorted(lines.values(), key=lambda line: line['employee'].name or '')
+
+    @api.model
+    def _generate_pdf_batch(self, vals_list):
+        """ Background job chunk: create the reports, then render all their PDFs in one go. """
+        self.create(vals_list)._render_pdf_attachments()
+
+    def _render_pdf_attachments(self):
+        """ Render the PDFs of the reports in a single wkhtmltopdf run, one attachment per report.
+
+        The report engine splits the document per record and stores the attachments; previous
+        PDFs of the reports are replaced.
+        """
+        previous = self.pdf_attachment_id
+        self.env['ir.actions.report']._render_qweb_pdf('dayflow_hrms.report_attendance_report_pdf', self.ids)
+        for attachment in self.env['ir.attachment'].search([
+            ('res_model', '=', self._name),
+            ('res_id', 'in', self.ids),
+            ('id', 'not in', previous.ids),
+        ], order='id'):
+            self.browse(attachment.res_id).pdf_attachment_id = attachment
+        previous.unlink()
@@ -1,7 +1,18 @@
 # -*- coding: utf-8 -*-
 
+from datetime import timedelta
+
 from odoo import models, fields, api
 
+PROFILE_FIELDS = [
+    'name', 'employee_code', 'job_title', 'department_id', 'parent_id', 'work_email', 'mobile_phone',
+    'work_location_id', 'image_1920', 'create_date', 'date_of_joining', 'employment_status', 'active',
+    'performance_goal_count', 'performance_goal_completed_count', 'performance_goal_progress',
+]
+# Attendance summaries cover this many days
+PROFILE_ATTENDANCE_DAYS = 30
+MAX_PROFILE_ITEMS = 50
+
 
 class HrEmployeeExtended(models.Model):
     _inherit = 'hr.employee'
@@ -40,6 +51,13 @@ class HrEmployeeExtended(models.Model):
                                              string='Performance Reviews')
     performance_count = fields.Integer(string='Performance Reviews', 
                                         compute='_compute_performance_count')
+    performance_goal_ids = fields.One2many('hr.performance.goal', 'employee_id', string='Goals')
+    performance_goal_count = fields.Integer(string='Goal Count', compute='_compute_performance_goal_stats', 
+                                            store=True)
+    performance_goal_completed_count = fields.Integer(string='Completed Goals', 
+                                                      compute='_compute_performance_goal_stats', store=True)
+    performance_goal_progress = fields.Float(string='Goal Progress (%)', compute='_compute_performance_goal_stats', 
+                                             store=True, digits=(5, 2))
     
     # Status
     employment_status = fields.Selection([
@@ -53,12 +71,130 @@ class HrEmployeeExtended(models.Model):
     def create(self, vals):
         if vals.get('employee_code', 'New') == 'New':
             vals['employee_code'] = self.env['ir.sequence'].next_by_code('hr.employee.code') or 'New'
-        return super(HrEmployeeExtended, self).create(vals)
+        employee = super(HrEmployeeExtended, self).create(vals)
+        self.env['dayflow.catalog']._invalidate(self._name)
+        return employee
+
+    def write(self, vals):
+        res = super(HrEmployeeExtended, self).write(vals)
+        self.env['dayflow.catalog']._invalidate(self._name, vals)
+        if 'name' in vals:
+            # The departments catalog shows managers by name
+            self.env['dayflow.catalog']._invalidate('hr.department', ['manager_id'])
+        return res
+
+    def unlink(self):
+        res = super(HrEmployeeExtended, self).unlink()
+        self.env['dayflow.catalog']._invalidate(self._name)
+        return res
 
     def _compute_performance_count(self):
         for employee in self:
             employee.performance_count = len(employee.performance_review_ids)
 
+    @api.depends('performance_goal_ids.progress', 'performance_goal_ids.status', 'performance_goal_ids.priority')
+    def _compute_performance_goal_stats(self):
+        saved = self.filtered(lambda e: not isinstance(e.id, models.NewId))
+        stats = self.env['hr.performance.goal']._read_progress_stats('employee_id', saved.ids)
+        for employee in self:
+            if employee in saved:
+                values = stats.get(employee.id, (0, 0, 0.0))
+            else:
+                values = employee.performance_goal_ids._get_progress_stats()
+            (employee.performance_goal_count, employee.performance_goal_completed_count,
+             employee.performance_goal_progress) = values
+
+    @api.model
+    def get_profile(self, employee_id=False, limit=5):
+        """ Everything the employee 360 view shows, in a fixed number of queries.
+
+        Each section reads its last ``limit`` rows and aggregates its summary in one grouped
+        query, so the cost does not grow with the employee's history. Without
+        ``employee_id`` the profile of the current user's employee is returned.
+        """
+        if employee_id:
+            employee = self.browse(employee_id)
+        else:
+            employee = self.search([('user_id', '=', self.env.uid)], limit=1)
+        if not employee:
+            return False
+        limit = max(1, min(int(limit), MAX_PROFILE_ITEMS))
+        today = fields.Date.context_today(self)
+        [values] = employee.read(PROFILE_FIELDS)
+        profile = {
+            'employee': values,
+            'attendance': employee._get_profile_attendance(limit, today),
+            'leaves': employee._get_profile_leaves(limit, today),
+            'reviews': employee._get_profile_reviews(limit),
+        }
+        # hr.payroll.slip comes from the optional dayflow_payroll module
+        if 'hr.payroll.slip' in self.env:
+            profile['payslips'] = employee._get_profile_payslips(limit, today)
+        return profile
+
+    def _get_profile_attendance(self, limit, today):
+        Attendance = self.env['hr.attendance']
+        domain = [('employee_id', '=', self.id)]
+        since = today - timedelta(days=PROFILE_ATTENDANCE_DAYS)
+        groups = Attendance._read_group(domain + [('check_in', '>=', since)], ['attendance_status'],
+                                        ['__count', 'worked_hours:sum', 'overtime_hours:sum'])
+        return {
+            'recent': Attendance.search_read(domain, ['check_in', 'check_out', 'worked_hours', 'attendance_status'],
+                                             order='check_in desc', limit=limit),
+            'summary': {
+                'days': PROFILE_ATTENDANCE_DAYS,
+                'attended': sum(count for _status, count, _hours, _overtime in groups),
+                'late': sum(count for status, count, _hours, _overtime in groups if status == 'late'),
+                'worked_hours': sum(hours or 0.0 for _status, _count, hours, _overtime in groups),
+                'overtime_hours': sum(overtime or 0.0 for _status, _count, _hours, overtime in groups),
+            },
+        }
+
+    def _get_profile_leaves(self, limit, today):
+        Leave = self.env['hr.leave']
+        domain = [('employee_id', '=', self.id)]
+        by_state = {state: (count, days or 0.0) for state, count, days in Leave._read_group(
+            domain + [('date_from', '>=', today.replace(month=1, day=1))], ['state'],
+            ['__count', 'number_of_days:sum'])}
+        return {
+            'recent': Leave.search_read(domain, ['holiday_status_id', 'date_from', 'date_to', 'number_of_days',
+                                                 'state'], order='date_from desc', limit=limit),
+            'summary': {
+                'days_taken': by_state.get('validate', (0, 0.0))[1],
+                'pending': by_state.get('confirm', (0, 0.0))[0] + by_state.get('validate1', (0, 0.0))[0],
+                'refused': by_state.get('refuse', (0, 0.0))[0],
+            },
+        }
+
+    def _get_profile_payslips(self, limit, today):
+        Payslip = self.env['hr.payroll.slip']
+        domain = [('employee_id', '=', self.id)]
+        [(count, total_net)] = Payslip._read_group(
+            domain + [('state', '=', 'paid'), ('date', '>=', today.replace(month=1, day=1))],
+            [], ['__count', 'net_wage:sum'])
+        return {
+            'recent': Payslip.search_read(domain, ['name', 'date', 'net_wage', 'state'], order='date desc',
+                                          limit=limit),
+            'summary': {
+                'paid_this_year': count,
+                'net_this_year': total_net or 0.0,
+            },
+        }
+
+    def _get_profile_reviews(self, limit):
+        Review = self.env['hr.performance.review']
+        domain = [('employee_id', '=', self.id)]
+        [(count, average)] = Review._read_group(domain + [('state', 'in', ['reviewed', 'acknowledged'])],
+                                                [], ['__count', 'overall_rating:avg'])
+        return {
+            'recent': Review.search_read(domain, ['name', 'review_date', 'overall_rating', 'rating_category',
+                                                  'state'], order='review_date desc', limit=limit),
+            'summary': {
+                'completed': count,
+                'average_rating': average or 0.0,
+            },
+        }
+
     def action_view_performance_reviews(self):
         self.ensure_one()
         return {
@@ -69,3 +205,26 @@ class HrEmployeeExtended(models.Model):
             'domain': [('employee_id', '=', self.id)],
             'context': {'default_employee_id': self.id},
         }
+
+
+class HrDepartment(models.Model):
+    _inherit = 'hr.department'
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        departments = super(HrDepartment, self).create(vals_list)
+        self.env['dayflow.catalog']._invalidate(self._name)
+        return departments
+
+    def write(self, vals):
+        res = super(HrDepartment, self).write(vals)
+        self.env['dayflow.catalog']._invalidate(self._name, vals)
+        if 'name' in vals:
+            # The employee directory shows departments by name
+            self.env['dayflow.catalog']._invalidate('hr.employee', ['department_id'])
+        return res
+
+    def unlink(self):
+        res = super(HrDepartment, self).unlink()
+        self.env['dayflow.catalog']._invalidate(self._name)
+        return res
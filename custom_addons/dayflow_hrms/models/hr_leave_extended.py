@@ -1,8 +1,12 @@
 # -*- coding: utf-8 -*-
 
-from odoo import models, fields, api, _
-from odoo.exceptions import ValidationError
-from datetime import datetime, timedelta
+from odoo import models, fields, api, tools, _
+from odoo.exceptions import AccessError, ValidationError
+from datetime import date, datetime, timedelta
+
+# Fields the leave analysis reports read, directly or through computes
+LEAVE_REPORT_FIELDS = {'date_from', 'date_to', 'request_date_from', 'request_date_to', 'state', 'active',
+                       'employee_id', 'holiday_status_id', 'number_of_days'}
 
 
 class HrLeaveExtended(models.Model):
@@ -41,6 +45,161 @@ class HrLeaveExtended(models.Model):
                 if overlapping:
                     raise ValidationError(_('You have overlapping leave requests!'))
 
+    def init(self):
+        super(HrLeaveExtended, self).init()
+        # Keyset pagination of an employee's history seeks on (date_from, id)
+        tools.create_index(self._cr, 'hr_leave_employee_date_from_id_index',
+                           self._table, ['employee_id', 'date_from', 'id'])
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        leaves = super(HrLeaveExtended, self).create(vals_list)
+        leaves.filtered(lambda l: l.state == 'confirm')._notify_leave_approvers()
+        leaves._mark_reports_dirty()
+        return leaves
+
+    def write(self, vals):
+        reports_changed = bool(LEAVE_REPORT_FIELDS & set(vals))
+        if reports_changed:
+            self._mark_reports_dirty()
+        previous_states = {leave.id: leave.state for leave in self} if 'state' in vals else None
+        res = super(HrLeaveExtended, self).write(vals)
+        if previous_states is not None:
+            changed = self.filtered(lambda l: previous_states[l.id] != l.state)
+            changed.filtered(lambda l: l.state == 'confirm')._notify_leave_approvers()
+            changed.filtered(lambda l: l.state in ['validate', 'refuse'])._notify_leave_decision()
+            changed._refresh_status_snapshot()
+        if reports_changed:
+            self._mark_reports_dirty()
+        return res
+
+    def unlink(self):
+        self._mark_reports_dirty()
+        return super(HrLeaveExtended, self).unlink()
+
+    def _mark_reports_dirty(self):
+        self.env['dayflow.report.dirty']._mark_dirty('leave', [
+            (leave.date_from.date(), leave.date_to.date(), leave.employee_id.department_id.id)
+            for leave in self if leave.date_from and leave.date_to
+        ])
+
+    def _refresh_status_snapshot(self):
+        """ Approvals, refusals and cancellations of leaves covering today change the status board. """
+        Status = self.env['dayflow.attendance.status']
+        current = self.filtered(lambda l: l.date_from < Status._get_today_bounds(l.employee_id)[1]
+                                and l.date_to >= Status._get_today_bounds(l.employee_id)[0])
+        if current:
+            Status._refresh_employees(current.employee_id)
+
+    def _notify_leave_approvers(self):
+        if not self:
+            return
+        officers = self.env.ref('hr_holidays.group_hr_holidays_user').users
+        vals_list = []
+        for leave in self:
+            approvers = leave.employee_id.leave_manager_id or officers
+            message = _('%(employee)s requested %(type)s from %(date_from)s to %(date_to)s',
+                        employee=leave.employee_id.name, type=leave.holiday_status_id.name,
+                        date_from=leave.request_date_from, date_to=leave.request_date_to)
+            vals_list.extend({
+                'user_id': approver.id,
+                'notification_type': 'leave_request',
+                'title': _('New Leave Request'),
+                'message': message,
+                'priority': 'high' if leave.is_emergency else 'medium',
+                'res_model': leave._name,
+                'res_id': leave.id,
+            } for approver in approvers)
+        self.env['dayflow.notification']._notify(vals_list)
+
+    def _notify_leave_decision(self):
+        vals_list = []
+        for leave in self:
+            approved = leave.state == 'validate'
+            message = _('Your %(type)s request from %(date_from)s has been %(decision)s',
+                        type=leave.holiday_status_id.name, date_from=leave.request_date_from,
+                        decision=_('approved') if approved else _('rejected'))
+            vals_list.append({
+                'user_id': leave.employee_id.user_id.id,
+                'notification_type': 'leave_approved' if approved else 'leave_rejected',
+                'title': _('Leave Approved') if approved else _('Leave Rejected'),
+                'message': message,
+                'priority': 'medium' if approved else 'high',
+                'res_model': leave._name,
+                'res_id': leave.id,
+            })
+        self.env['dayflow.notification']._notify(vals_list)
+
+    @api.model
+    def _check_bulk_access(self):
+        if not self.env.user.has_group('hr_holidays.group_hr_holidays_manager'):
+            raise AccessError(_('Only time off administrators can reset or purge leaves in bulk.'))
+
+    @api.model
+    def _count_by_state(self, leaves):
+        return {state: count for state, count in self._read_group(
+            [('id', 'in', leaves.ids)], ['state'], ['__count'])}
+
+    def _delete_leave_links(self):
+        """ Rows pointing at the leaves without a foreign key cascade: calendar leaves of validated
+        requests, chatter, activities and Dayflow notifications. """
+        ids = tuple(self.ids)
+        self.env.cr.execute('DELETE FROM resource_calendar_leaves WHERE holiday_id IN %s', [ids])
+        for table, model_column in [('mail_message', 'model'), ('mail_followers', 'res_model'),
+                                    ('mail_activity', 'res_model'), ('dayflow_notification', 'res_model')]:
+            self.env.cr.execute(f'DELETE FROM {table} WHERE {model_column} = %s AND res_id IN %s',
+                                [self._name, ids])
+
+    @api.model
+    def purge_leaves(self, domain):
+        """ Delete every leave matching ``domain``, whatever its state, in one transaction.
+
+        Maintenance tool: bypasses the state checks of ``unlink`` and works with a few set-based
+        statements instead of one unlink (and one RPC) per leave.
+        :return: ``{'deleted': count, 'by_state': {state: count}}``
+        """
+        self._check_bulk_access()
+        leaves = self.with_context(active_test=False).search(domain)
+        if not leaves:
+            return {'deleted': 0, 'by_state': {}}
+        by_state = self._count_by_state(leaves)
+        employees = leaves.employee_id
+        leaves._mark_reports_dirty()
+        self.env.flush_all()
+        leaves._delete_leave_links()
+        self.env.cr.execute('DELETE FROM hr_leave WHERE id IN %s', [tuple(leaves.ids)])
+        self.env.invalidate_all()
+        self.env['dayflow.attendance.status']._refresh_employees(employees)
+        return {'deleted': len(leaves), 'by_state': by_state}
+
+    @api.model
+    def reset_leaves(self, domain):
+        """ Put every leave matching ``domain`` back to "To Approve", dropping past decisions.
+
+        :return: ``{'reset': count, 'by_state': {previous state: count}}``
+        """
+        self._check_bulk_access()
+        leaves = self.with_context(active_test=False).search(domain + [('state', '!=', 'confirm')])
+        if not leaves:
+            return {'reset': 0, 'by_state': {}}
+        by_state = self._count_by_state(leaves)
+        employees = leaves.employee_id
+        leaves._mark_reports_dirty()
+        self.env.flush_all()
+        self.env.cr.execute('DELETE FROM resource_calendar_leaves WHERE holiday_id IN %s', [tuple(leaves.ids)])
+        self.env.cr.execute("""
+            UPDATE hr_leave
+               SET state = 'confirm', active = TRUE,
+                   first_approver_id = NULL, second_approver_id = NULL,
+                   approved_by = NULL, approved_date = NULL,
+                   rejected_by = NULL, rejected_date = NULL, rejection_reason = NULL,
+                   write_uid = %s, write_date = NOW() AT TIME ZONE 'UTC'
+             WHERE id IN %s
+        """, [self.env.uid, tuple(leaves.ids)])
+        self.env.invalidate_all()
+        self.env['dayflow.attendance.status']._refresh_employees(employees)
+        return {'reset': len(leaves), 'by_state': by_state}
+
     def action_approve(self):
         res = super(HrLeaveExtended, self).action_approve()
         for leave in self:
@@ -73,6 +232,22 @@ class HrLeaveType(models.Model):
     carry_forward = fields.Boolean(string='Carry Forward to Next Year', default=False)
     max_carry_forward = fields.Float(string='Max Carry Forward Days', default=0.0)
 
+    @api.model_create_multi
+    def create(self, vals_list):
+        leave_types = super(HrLeaveType, self).create(vals_list)
+        self.env['dayflow.catalog']._invalidate(self._name)
+        return leave_types
+
+    def write(self, vals):
+        res = super(HrLeaveType, self).write(vals)
+        self.env['dayflow.catalog']._invalidate(self._name, vals)
+        return res
+
+    def unlink(self):
+        res = super(HrLeaveType, self).unlink()
+        self.env['dayflow.catalog']._invalidate(self._name)
+        return res
+
 
 class HrLeaveAllocation(models.Model):
     _inherit = 'hr.leave.allocation'
@@ -81,6 +256,81 @@ class HrLeaveAllocation(models.Model):
     is_carry_forward = fields.Boolean(string='Carry Forward Allocation')
     previous_year = fields.Integer(string='Previous Year')
 
+    @api.model
+    def purge_allocations(self, domain):
+        """ Delete every allocation matching ``domain``, whatever its state, in one transaction.
+
+        :return: ``{'deleted': count, 'by_state': {state: count}}``
+        """
+        self.env['hr.leave']._check_bulk_access()
+        allocations = self.with_context(active_test=False).search(domain)
+        if not allocations:
+            return {'deleted': 0, 'by_state': {}}
+        by_state = {state: count for state, count in self._read_group(
+            [('id', 'in', allocations.ids)], ['state'], ['__count'])}
+        ids = tuple(allocations.ids)
+        self.env.flush_all()
+        for table, model_column in [('mail_message', 'model'), ('mail_followers', 'res_model'),
+                                    ('mail_activity', 'res_model')]:
+            self.env.cr.execute(f'DELETE FROM {table} WHERE {model_column} = %s AND res_id IN %s',
+                                [self._name, ids])
+        self.env.cr.execute('DELETE FROM hr_leave_allocation WHERE id IN %s', [ids])
+        self.env.invalidate_all()
+        return {'deleted': len(ids), 'by_state': by_state}
+
+    @api.model
+    def upsert_allocations(self, employee_domain, leave_type_ids=None, number_of_days=20.0,
+                           date_from=None, date_to=False, name=None):
+        """ Make sure every employee matching ``employee_domain`` has a validated allocation of
+        ``number_of_days`` for each leave type, valid on ``date_from`` (today by default).
+
+        Idempotent: existing allocations are updated, with one write per distinct change, and
+        the missing ones are created and validated in one batch.
+        :return: ``{'created': count, 'updated': count, 'unchanged': count}``
+        """
+        self.env['hr.leave']._check_bulk_access()
+        date_from = fields.Date.to_date(date_from) or date.today()
+        employees = self.env['hr.employee'].search(employee_domain)
+        leave_types = self.env['hr.leave.type'].browse(leave_type_ids) if leave_type_ids else \
+            self.env['hr.leave.type'].search([('requires_allocation', '=', 'yes')])
+        existing = {}
+        for allocation in self.search([
+            ('employee_id', 'in', employees.ids),
+            ('holiday_status_id', 'in', leave_types.ids),
+            ('state', '!=', 'refuse'),
+            ('date_from', '<=', date_from),
+            '|', ('date_to', '=', False), ('date_to', '>=', date_from),
+        ], order='date_from desc, id desc'):
+            existing.setdefault((allocation.employee_id.id, allocation.holiday_status_id.id), allocation)
+
+        to_create, to_update = [], self.browse()
+        for employee in employees:
+            for leave_type in leave_types:
+                allocation = existing.get((employee.id, leave_type.id))
+                if not allocation:
+                    to_create.append({
+                        'name': name or _('%s Allocation', leave_type.name),
+                        'employee_id': employee.id,
+                        'holiday_status_id': leave_type.id,
+                        'number_of_days': number_of_days,
+                        'date_from': date_from,
+                        'date_to': date_to,
+                    })
+                elif allocation.number_of_days != number_of_days or allocation.state != 'validate':
+                    to_update |= allocation
+
+        if to_update:
+            to_update.write({'number_of_days': number_of_days})
+            to_update.filtered(lambda a: a.state != 'validate').action_validate()
+        created = self.with_context(mail_create_nolog=True, mail_create_nosubscribe=True,
+                                    tracking_disable=True).create(to_create)
+        created.filtered(lambda a: a.state != 'validate').action_validate()
+        return {
+            'created': len(created),
+            'updated': len(to_update),
+            'unchanged': len(existing) - len(to_update),
+        }
+
 
 class HrLeaveAnalysis(models.Model):
     _name = 'hr.leave.analysis'
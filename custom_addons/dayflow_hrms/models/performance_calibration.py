@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+
+from odoo import models, fields, api, Command, _
+from odoo.exceptions import ValidationError
+
+from .performance_review import RATING_FIELDS
+
+PERCENTILES = [0.1, 0.25, 0.5, 0.75, 0.9]
+
+# Reviewers whose average sits this many standard deviations from the org mean are flagged
+TENDENCY_Z_SCORE = 1.0
+
+
+class HrPerformanceCalibration(models.Model):
+    _name = 'hr.performance.calibration'
+    _description = 'Performance Calibration Report'
+    _order = 'date desc'
+
+    name = fields.Char(string='Report Name', required=True)
+    date_from = fields.Date(string='From Date', required=True)
+    date_to = fields.Date(string='To Date', required=True)
+    department_id = fields.Many2one('hr.department', string='Department')
+
+    total_reviews = fields.Integer(string='Total Reviews', compute='_compute_report_data', store=True)
+    mean_rating = fields.Float(string='Mean Rating', compute='_compute_report_data', store=True, digits=(3, 2))
+    std_rating = fields.Float(string='Standard Deviation', compute='_compute_report_data', store=True, digits=(3, 2))
+    p10_rating = fields.Float(string='10th Percentile', compute='_compute_report_data', store=True, digits=(3, 2))
+    p25_rating = fields.Float(string='25th Percentile', compute='_compute_report_data', store=True, digits=(3, 2))
+    median_rating = fields.Float(string='Median', compute='_compute_report_data', store=True, digits=(3, 2))
+    p75_rating = fields.Float(string='75th Percentile', compute='_compute_report_data', store=True, digits=(3, 2))
+    p90_rating = fields.Float(string='90th Percentile', compute='_compute_report_data', store=True, digits=(3, 2))
+
+    # Per-dimension means
+    mean_quality_of_work = fields.Float(string='Quality of Work', compute='_compute_report_data',
+                                        store=True, digits=(3, 2))
+    mean_productivity = fields.Float(string='Productivity', compute='_compute_report_data',
+                                     store=True, digits=(3, 2))
+    mean_communication = fields.Float(string='Communication Skills', compute='_compute_report_data',
+                                      store=True, digits=(3, 2))
+    mean_teamwork = fields.Float(string='Teamwork', compute='_compute_report_data', store=True, digits=(3, 2))
+    mean_initiative = fields.Float(string='Initiative', compute='_compute_report_data', store=True, digits=(3, 2))
+    mean_punctuality = fields.Float(string='Punctuality', compute='_compute_report_data', store=True, digits=(3, 2))
+
+    reviewer_line_ids = fields.One2many('hr.performance.calibration.reviewer', 'calibration_id',
+                                        string='Reviewers', compute='_compute_report_data', store=True)
+    department_line_ids = fields.One2many('hr.performance.calibration.department', 'calibration_id',
+                                          string='Departments', compute='_compute_report_data', store=True)
+
+    date = fields.Date(string='Report Date', default=fields.Date.today)
+
+    @api.constrains('date_from', 'date_to')
+    def _check_dates(self):
+        for report in self:
+            if report.date_from > report.date_to:
+                raise ValidationError(_('From Date must be before To Date.'))
+
+    def _query_rating_statistics(self):
+        """ Aggregate the rating columns of every matching review in a single scan.
+
+        The grouping sets return one org-wide row, one row per reviewer and one row per
+        department; ``GROUPING()`` tells them apart. Only reviewed and acknowledged reviews
+        are calibrated.
+        """
+        self.ensure_one()
+        self.env['hr.performance.review'].flush_model(
+            ['employee_id', 'reviewer_id', 'review_date', 'state', 'overall_rating', 'rating_category']
+            + RATING_FIELDS)
+        self.env['hr.employee'].flush_model(['department_id', 'company_id'])
+
+        dimension_means = ', '.join(f'avg(r.{field}::int)::float8' for field in RATING_FIELDS)
+        department_clause = 'AND e.department_id = %(department_id)s' if self.department_id else ''
+        self.env.cr.execute(f"""
+            SELECT GROUPING(r.reviewer_id) AS all_reviewers,
+                   GROUPING(e.department_id) AS all_departments,
+                   r.reviewer_id,
+                   e.department_id,
+                   count(*),
+                   avg(r.overall_rating)::float8,
+                   stddev_pop(r.overall_rating)::float8,
+                   percentile_cont(%(percentiles)s::float8[]) WITHIN GROUP (ORDER BY r.overall_rating::float8),
+                   {dimension_means},
+                   count(*) FILTER (WHERE r.rating_category = 'poor'),
+                   count(*) FILTER (WHERE r.rating_category = 'average'),
+                   count(*) FILTER (WHERE r.rating_category = 'good'),
+                   count(*) FILTER (WHERE r.rating_category = 'excellent')
+              FROM hr_performance_review r
+              JOIN hr_employee e ON e.id = r.employee_id
+             WHERE r.review_date BETWEEN %(date_from)s AND %(date_to)s
+               AND r.state IN ('reviewed', 'acknowledged')
+               AND e.company_id IN %(company_ids)s
+               {department_clause}
+          GROUP BY GROUPING SETS ((), (r.reviewer_id), (e.department_id))
+        """, {
+            'percentiles': PERCENTILES,
+            'date_from': self.date_from,
+            'date_to': self.date_to,
+            'company_ids': tuple(self.env.companies.ids),
+            'department_id': self.department_id.id,
+        })
+        return self.env.cr.fetchall()
+
+    @api.depends('date_from', 'date_to', 'department_id')
+    def _compute_report_data(self):
+        for report in self:
+            if not report.date_from or not report.date_to:
+                continue
+
+            overall = None
+            reviewer_rows, department_rows = [], []
+            for row in report._query_rating_statistics():
+                all_reviewers, all_departments = row[0], row[1]
+                if all_reviewers and all_departments:
+                    overall = row
+                elif all_departments:
+                    reviewer_rows.append(row)
+                else:
+                    department_rows.append(row)
+
+            count, mean, std, percentiles = (overall[4], overall[5], overall[6], overall[7]) \
+                if overall else (0, 0.0, 0.0, [0.0] * len(PERCENTILES))
+            dimension_means = overall[8:8 + len(RATING_FIELDS)] if overall else [0.0] * len(RATING_FIELDS)
+
+            report.total_reviews = count
+            report.mean_rating = mean or 0.0
+            report.std_rating = std or 0.0
+            report.p10_rating, report.p25_rating, report.median_rating, report.p75_rating, report.p90_rating = \
+                [value or 0.0 for value in percentiles]
+            for field, value in zip(RATING_FIELDS, dimension_means):
+                report[f'mean_{field}'] = value or 0.0
+
+            report.reviewer_line_ids = [Command.delete(line.id) for line in report.reviewer_line_ids] + [
+                Command.create(report._prepare_reviewer_line(row)) for row in reviewer_rows
+            ]
+            report.department_line_ids = [Command.delete(line.id) for line in report.department_line_ids] + [
+                Command.create(report._prepare_department_line(row)) for row in department_rows
+            ]
+
+    def _prepare_reviewer_line(self, row):
+        reviewer_id, count, mean = row[2], row[4], row[5] or 0.0
+        z_score = (mean - self.mean_rating) / self.std_rating if self.std_rating else 0.0
+        if z_score >= TENDENCY_Z_SCORE:
+            tendency = 'lenient'
+        elif z_score <= -TENDENCY_Z_SCORE:
+            tendency = 'strict'
+        else:
+            tendency = 'calibrated'
+        return {
+            'reviewer_id': reviewer_id,
+            'review_count': count,
+            'mean_rating': mean,
+            'z_score': z_score,
+            'tendency': tendency,
+        }
+
+    def _prepare_department_line(self, row):
+        poor, average, good, excellent = row[-4:]
+        return {
+            'department_id': row[3],
+            'review_count': row[4],
+            'mean_rating': row[5] or 0.0,
+            'std_rating': row[6] or 0.0,
+            'median_rating': row[7][PERCENTILES.index(0.5)] or 0.0,
+            'poor_count': poor,
+            'average_count': average,
+            'good_count': good,
+            'excellent_count': excellent,
+        }
+
+
+class HrPerformanceCalibrationReviewer(models.Model):
+    _name = 'hr.performance.calibration.reviewer'
+    _description = 'Performance Calibration by Reviewer'
+    _order = 'z_score desc'
+
+    calibration_id = fields.Many2one('hr.performance.calibration', string='Calibration Report',
+                                     required=True, ondelete='cascade', index=True)
+    reviewer_id = fields.Many2one('res.users', string='Reviewer')
+    review_count = fields.Integer(string='Reviews')
+    mean_rating = fields.Float(string='Mean Rating', digits=(3, 2))
+    z_score = fields.Float(string='Z-Score', digits=(3, 2))
+    tendency = fields.Selection([
+        ('strict', 'Strict'),
+        ('calibrated', 'Calibrated'),
+        ('lenient', 'Lenient'),
+    ], string='Tendency')
+
+
+class HrPerformanceCalibrationDepartment(models.Model):
+    _name = 'hr.performance.calibration.department'
+    _description = 'Performance Calibration by Department'
+    _order = 'mean_rating desc'
+
+    calibration_id = fields.Many2one('hr.performance.calibration', string='Calibration Report',
+                                     required=True, ondelete='cascade', index=True)
+    department_id = fields.Many2one('hr.department', string='Department')
+    review_count = fields.Integer(string='Reviews')
+    mean_rating = fields.Float(string='Mean Rating', digits=(3, 2))
+    std_rating = fields.Float(string='Standard Deviation', digits=(3, 2))
+    median_rating = fields.Float(string='Median', digits=(3, 2))
+    excellent_count = fields.Integer(string='Outstanding')
+    good_count = fields.Integer(string='Exceeds Expectations')
+    average_count = fields.Integer(string='Meets Expectations')
+    poor_count = fields.Integer(string='Needs Improvement')
@@ -1,9 +1,39 @@
 # -*- coding: utf-8 -*-
 
-from odoo import models, fields, api, _
+from odoo import models, fields, api, tools, Command, _
 from odoo.exceptions import ValidationError
+from collections import defaultdict
 from datetime import datetime
 
+RATING_FIELDS = ['quality_of_work', 'productivity', 'communication', 'teamwork', 'initiative', 'punctuality']
+
+# Fields the performance and calibration reports read, directly or through computes
+REVIEW_REPORT_FIELDS = {'review_date', 'state', 'employee_id', 'reviewer_id', *RATING_FIELDS}
+
+# State changes on at least this many reviews are tracked in one batched insert
+BULK_TRACKING_THRESHOLD = 20
+
+# Weight of each goal priority in the weighted average goal progress
+GOAL_PRIORITY_WEIGHTS = {'low': 1, 'medium': 2, 'high': 3}
+
+
+def fold_goal_stats(rows):
+    """ Reduce (status, priority, count, progress_sum) rows to (count, completed, weighted progress).
+
+    Cancelled goals are ignored.
+    """
+    count = completed = weighted_progress = total_weight = 0
+    for status, priority, goal_count, progress_sum in rows:
+        if status == 'cancelled':
+            continue
+        weight = GOAL_PRIORITY_WEIGHTS.get(priority, 1)
+        count += goal_count
+        if status == 'completed':
+            completed += goal_count
+        weighted_progress += weight * progress_sum
+        total_weight += weight * goal_count
+    return count, completed, weighted_progress / total_weight if total_weight else 0.0
+
 
 class HrPerformanceReview(models.Model):
     _name = 'hr.performance.review'
@@ -22,7 +52,7 @@ class HrPerformanceReview(models.Model):
         ('annual', 'Annual'),
     ], string='Review Period', required=True, default='quarterly')
     
-    review_date = fields.Date(string='Review Date', required=True, default=fields.Date.today)
+    review_date = fields.Date(string='Review Date', required=True, default=fields.Date.today, index=True)
     date_from = fields.Date(string='Period From', required=True)
     date_to = fields.Date(string='Period To', required=True)
     
@@ -30,45 +60,49 @@ class HrPerformanceReview(models.Model):
     quality_of_work = fields.Selection([
         ('1', 'Poor'), ('2', 'Below Average'), ('3', 'Average'), 
         ('4', 'Good'), ('5', 'Excellent')
-    ], string='Quality of Work', required=True)
+    ], string='Quality of Work')
     
     productivity = fields.Selection([
         ('1', 'Poor'), ('2', 'Below Average'), ('3', 'Average'), 
         ('4', 'Good'), ('5', 'Excellent')
-    ], string='Productivity', required=True)
+    ], string='Productivity')
     
     communication = fields.Selection([
         ('1', 'Poor'), ('2', 'Below Average'), ('3', 'Average'), 
         ('4', 'Good'), ('5', 'Excellent')
-    ], string='Communication Skills', required=True)
+    ], string='Communication Skills')
     
     teamwork = fields.Selection([
         ('1', 'Poor'), ('2', 'Below Average'), ('3', 'Average'), 
         ('4', 'Good'), ('5', 'Excellent')
-    ], string='Teamwork', required=True)
+    ], string='Teamwork')
     
     initiative = fields.Selection([
         ('1', 'Poor'), ('2', 'Below Average'), ('3', 'Average'), 
         ('4', 'Good'), ('5', 'Excellent')
-    ], string='Initiative', required=True)
+    ], string='Initiative')
     
     punctuality = fields.Selection([
         ('1', 'Poor'), ('2', 'Below Average'), ('3', 'Average'), 
         ('4', 'Good'), ('5', 'Excellent')
-    ], string='Punctuality', required=True)
+    ], string='Punctuality')
     
     # Overall Rating
     overall_rating = fields.Float(string='Overall Rating', compute='_compute_overall_rating', 
-                                   store=True, digits=(3, 2))
+                                   store=True, index=True, digits=(3, 2))
     rating_category = fields.Selection([
         ('poor', 'Needs Improvement'),
         ('average', 'Meets Expectations'),
         ('good', 'Exceeds Expectations'),
         ('excellent', 'Outstanding'),
-    ], string='Rating Category', compute='_compute_rating_category', store=True)
+    ], string='Rating Category', compute='_compute_rating_category', store=True, index=True)
     
     # Goals and Feedback
     goals_ids = fields.One2many('hr.performance.goal', 'review_id', string='Goals')
+    goal_count = fields.Integer(string='Goal Count', compute='_compute_goal_stats', store=True)
+    goal_completed_count = fields.Integer(string='Completed Goals', compute='_compute_goal_stats', store=True)
+    goal_progress = fields.Float(string='Goal Progress (%)', compute='_compute_goal_stats', 
+                                 store=True, digits=(5, 2))
     achievements = fields.Text(string='Key Achievements')
     areas_of_improvement = fields.Text(string='Areas of Improvement')
     reviewer_comments = fields.Text(string='Reviewer Comments')
@@ -85,7 +119,36 @@ class HrPerformanceReview(models.Model):
         ('reviewed', 'Reviewed'),
         ('acknowledged', 'Acknowledged'),
         ('cancelled', 'Cancelled'),
-    ], string='Status', default='draft', tracking=True)
+    ], string='Status', default='draft', tracking=True, index=True)
+
+    def init(self):
+        tools.create_index(self._cr, 'hr_performance_review_employee_date_state_index',
+                           self._table, ['employee_id', 'review_date', 'state'])
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        reviews = super(HrPerformanceReview, self).create(vals_list)
+        reviews._mark_reports_dirty()
+        return reviews
+
+    def write(self, vals):
+        reports_changed = bool(REVIEW_REPORT_FIELDS & set(vals))
+        if reports_changed:
+            self._mark_reports_dirty()
+        res = super(HrPerformanceReview, self).write(vals)
+        if reports_changed:
+            self._mark_reports_dirty()
+        return res
+
+    def unlink(self):
+        self._mark_reports_dirty()
+        return super(HrPerformanceReview, self).unlink()
+
+    def _mark_reports_dirty(self):
+        self.env['dayflow.report.dirty']._mark_dirty('review', [
+            (review.review_date, review.review_date, review.employee_id.department_id.id)
+            for review in self if review.review_date
+        ])
 
     @api.depends('quality_of_work', 'productivity', 'communication', 'teamwork', 'initiative', 'punctuality')
     def _compute_overall_rating(self):
@@ -100,6 +163,17 @@ class HrPerformanceReview(models.Model):
             ]
             review.overall_rating = sum(ratings) / len(ratings) if ratings else 0
 
+    @api.depends('goals_ids.progress', 'goals_ids.status', 'goals_ids.priority')
+    def _compute_goal_stats(self):
+        saved = self.filtered(lambda r: not isinstance(r.id, models.NewId))
+        stats = self.env['hr.performance.goal']._read_progress_stats('review_id', saved.ids)
+        for review in self:
+            if review in saved:
+                values = stats.get(review.id, (0, 0, 0.0))
+            else:
+                values = review.goals_ids._get_progress_stats()
+            review.goal_count, review.goal_completed_count, review.goal_progress = values
+
     @api.depends('overall_rating')
     def _compute_rating_category(self):
         for review in self:
@@ -112,20 +186,109 @@ class HrPerformanceReview(models.Model):
             else:
                 review.rating_category = 'excellent'
 
+    @api.constrains('state', 'quality_of_work', 'productivity', 'communication', 'teamwork',
+                    'initiative', 'punctuality')
+    def _check_ratings(self):
+        for review in self:
+            if review.state in ['draft', 'cancelled']:
+                continue
+            if not all(review[field] for field in RATING_FIELDS):
+                raise ValidationError(_('All performance ratings must be filled in before the review is submitted.'))
+
+    def _set_state(self, state):
+        """ Write the new state, switching to batched tracking for bulk transitions.
+
+        Regular tracking posts one message (and its notifications) per record inside the
+        request. Large selections, or any call made with the ``bulk_transition`` context
+        key, skip it and record the tracking values of the whole batch in a single insert.
+        """
+        initial_states = {review.id: review.state for review in self}
+        if len(self) < BULK_TRACKING_THRESHOLD and not self.env.context.get('bulk_transition'):
+            self.write({'state': state})
+        else:
+            self.with_context(tracking_disable=True).write({'state': state})
+            self._log_state_tracking_batch(initial_states)
+        self.filtered(lambda r: initial_states[r.id] != r.state)._notify_state_change()
+        return True
+
+    def _notify_state_change(self):
+        """ Tell whoever has to act next: the reviewer once submitted, the employee once reviewed. """
+        vals_list = []
+        for review in self:
+            if review.state == 'submitted':
+                user, message = review.reviewer_id, _('%(employee)s submitted the self-assessment for "%(name)s"',
+                                                      employee=review.employee_id.name, name=review.name)
+            elif review.state == 'reviewed':
+                user, message = review.employee_id.user_id, _('Your review "%s" is ready to be acknowledged',
+                                                              review.name)
+            else:
+                continue
+            vals_list.append({
+                'user_id': user.id,
+                'notification_type': 'review_update',
+                'title': _('Performance Review'),
+                'message': message,
+                'res_model': review._name,
+                'res_id': review.id,
+            })
+        self.env['dayflow.notification']._notify(vals_list)
+
+    def _log_state_tracking_batch(self, initial_states):
+        changed = self.filtered(lambda r: initial_states.get(r.id) != r.state)
+        if not changed:
+            return
+        field = self.env['ir.model.fields']._get(self._name, 'state')
+        labels = dict(self._fields['state']._description_selection(self.env))
+        subtype_id = self.env['ir.model.data']._xmlid_to_res_id('mail.mt_note')
+        author_id = self.env.user.partner_id.id
+        self.env['mail.message'].sudo().create([{
+            'model': self._name,
+            'res_id': review.id,
+            'message_type': 'notification',
+            'subtype_id': subtype_id,
+            'author_id': author_id,
+            'tracking_value_ids': [Command.create({
+                'field_id': field.id,
+                'old_value_char': labels.get(initial_states[review.id], ''),
+                'new_value_char': labels.get(review.state, ''),
+            })],
+        } for review in changed])
+
+    @api.model
+    def _create_cycle_reviews(self, vals_list, goal_templates=(), log_body=False):
+        """ Create reviews of a review cycle with their default goals.
+
+        Called by the cycle wizard directly, or per chunk from a ``dayflow.job`` for large cycles.
+        """
+        # No per-record tracking or follower rows; creation notes are logged in one batch below
+        reviews = self.with_context(
+            tracking_disable=True,
+            mail_create_nolog=True,
+            mail_create_nosubscribe=True,
+            mail_notrack=True,
+        ).create(vals_list)
+        goal_vals = [dict(template, review_id=review.id, employee_id=review.employee_id.id)
+                     for review in reviews for template in goal_templates]
+        if goal_vals:
+            self.env['hr.performance.goal'].create(goal_vals)
+        if log_body:
+            reviews._message_log_batch(bodies={review.id: log_body for review in reviews})
+        return reviews
+
     def action_submit(self):
-        self.write({'state': 'submitted'})
+        return self._set_state('submitted')
 
     def action_review(self):
-        self.write({'state': 'reviewed'})
+        return self._set_state('reviewed')
 
     def action_acknowledge(self):
-        self.write({'state': 'acknowledged'})
+        return self._set_state('acknowledged')
 
     def action_cancel(self):
-        self.write({'state': 'cancelled'})
+        return self._set_state('cancelled')
 
     def action_reset_to_draft(self):
-        self.write({'state': 'draft'})
+        return self._set_state('draft')
 
 
 class HrPerformanceGoal(models.Model):
@@ -162,6 +325,19 @@ class HrPerformanceGoal(models.Model):
             if goal.progress < 0 or goal.progress > 100:
                 raise ValidationError(_('Progress must be between 0 and 100.'))
 
+    @api.model
+    def _read_progress_stats(self, group_field, ids):
+        """ Goal rollup per ``group_field`` value for ``ids``, in a single grouped query. """
+        rows = defaultdict(list)
+        for record, status, priority, count, progress_sum in self._read_group(
+                [(group_field, 'in', ids), ('status', '!=', 'cancelled')],
+                [group_field, 'status', 'priority'], ['__count', 'progress:sum']):
+            rows[record.id].append((status, priority, count, progress_sum))
+        return {record_id: fold_goal_stats(record_rows) for record_id, record_rows in rows.items()}
+
+    def _get_progress_stats(self):
+        return fold_goal_stats((goal.status, goal.priority, 1, goal.progress) for goal in self)
+
     def action_mark_completed(self):
         self.write({
             'status': 'completed',
@@ -205,11 +381,14 @@ class HrPerformanceReport(models.Model):
             if report.department_id:
                 domain.append(('employee_id.department_id', '=', report.department_id.id))
             
-            reviews = self.env['hr.performance.review'].search(domain)
+            groups = self.env['hr.performance.review']._read_group(
+                domain, ['rating_category'], ['__count', 'overall_rating:sum'])
+            counts = {category: count for category, count, _rating_sum in groups}
+            total_reviews = sum(counts.values())
             
-            report.total_reviews = len(reviews)
-            report.average_rating = sum(reviews.mapped('overall_rating')) / len(reviews) if reviews else 0
-            report.excellent_count = len(reviews.filtered(lambda r: r.rating_category == 'excellent'))
-            report.good_count = len(reviews.filtered(lambda r: r.rating_category == 'good'))
-            report.average_count = len(reviews.filtered(lambda r: r.rating_category == 'average'))
-            report.poor_count = len(reviews.filtered(lambda r: r.rating_category == 'poor'))
+            report.total_reviews = total_reviews
+            report.average_rating = sum(rating_sum for *_, rating_sum in groups) / total_reviews if total_reviews else 0
+            report.excellent_count = counts.get('excellent', 0)
+            report.good_count = counts.get('good', 0)
+            report.average_count = counts.get('average', 0)
+            report.poor_count = counts.get('poor', 0)
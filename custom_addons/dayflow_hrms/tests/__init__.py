@@ -0,0 +1,5 @@
+# -*- coding: utf-8 -*-
+
+from . import test_benchmark_computes
+from . import test_employee_profile
+from . import test_notification_feed
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+""" Micro-benchmarks of the Dayflow computed fields.
+
+Not part of the standard test run; run them on a throwaway database with::
+
+    odoo-bin -d bench_db -i dayflow_hrms,dayflow_payroll --test-tags dayflow_benchmark --stop-after-init
+
+Environment variables:
+
+* ``DAYFLOW_BENCHMARK_RECORDS``: records seeded per model (default 1000)
+* ``DAYFLOW_BENCHMARK_BASELINE``: baseline file (default ``benchmark_baseline.json`` next to this file)
+* ``DAYFLOW_BENCHMARK_UPDATE=1``: write the measurements as the new baseline instead of comparing
+* ``DAYFLOW_BENCHMARK_TIME_TOLERANCE``: allowed wall time increase over the baseline (default 0.5, i.e. +50%)
+
+More SQL queries than the baseline fails the benchmark: query counts do not depend on the
+machine. Slower wall times are only logged, unless ``DAYFLOW_BENCHMARK_STRICT=1``.
+Baselines recorded with another record count are not compared.
+"""
+
+import json
+import logging
+import os
+import time
+
+from odoo.tests.common import TransactionCase
+
+_logger = logging.getLogger(__name__)
+
+BENCHMARK_RECORDS = int(os.environ.get('DAYFLOW_BENCHMARK_RECORDS', 1000))
+BASELINE_PATH = os.environ.get('DAYFLOW_BENCHMARK_BASELINE') or \
+    os.path.join(os.path.dirname(__file__), 'benchmark_baseline.json')
+UPDATE_BASELINE = os.environ.get('DAYFLOW_BENCHMARK_UPDATE') == '1'
+STRICT_TIMING = os.environ.get('DAYFLOW_BENCHMARK_STRICT') == '1'
+TIME_TOLERANCE = float(os.environ.get('DAYFLOW_BENCHMARK_TIME_TOLERANCE', 0.5))
+
+
+class BenchmarkCase(TransactionCase):
+    """ Time the recomputation of stored fields and count its queries. """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.results = {}
+        cls.baseline = {}
+        if os.path.exists(BASELINE_PATH):
+            with open(BASELINE_PATH) as baseline:
+                cls.baseline = json.load(baseline)
+
+    @classmethod
+    def tearDownClass(cls):
+        if UPDATE_BASELINE and cls.results:
+            baseline = {}
+            if os.path.exists(BASELINE_PATH):
+                with open(BASELINE_PATH) as current:
+                    baseline = json.load(current)
+            baseline.update(cls.results)
+            with open(BASELINE_PATH, 'w') as output:
+                json.dump(baseline, output, indent=2, sort_keys=True)
+                output.write('\n')
+            _logger.info('Benchmark baseline written to %s', BASELINE_PATH)
+        super().tearDownClass()
+
+    def measure(self, name, records, fnames):
+        """ Recompute ``fnames`` on ``records`` from a cold cache, flush included.
+
+        Fields computed by the same method are recomputed together, as they would be in
+        production. Returns the measurement after checking it against the baseline.
+        """
+        fields_to_compute = {
+            field
+            for fname in fnames
+            for field in records._fields.values()
+            if field.compute and field.compute == records._fields[fname].compute
+        }
+        self.env.flush_all()
+        self.env.invalidate_all()
+        for field in fields_to_compute:
+            self.env.add_to_compute(field, records)
+
+        queries = self.cr.sql_log_count
+        started = time.perf_counter()
+        self.env.flush_all()
+        result = {
+            'records': len(records),
+            'ms': round(1000 * (time.perf_counter() - started), 1),
+            'queries': self.cr.sql_log_count - queries,
+        }
+        self.results[name] = result
+        _logger.info('Benchmark %s: %s records, %s ms, %s queries',
+                     name, result['records'], result['ms'], result['queries'])
+        self._check_regression(name, result)
+        return result
+
+    def _check_regression(self, name, result):
+        reference = self.baseline.get(name)
+        if UPDATE_BASELINE or not reference:
+            return
+        if reference['records'] != result['records']:
+            _logger.warning('Benchmark %s: baseline recorded on %s records, not compared',
+                            name, reference['records'])
+            return
+        self.assertLessEqual(
+            result['queries'], reference['queries'],
+            f"{name}: {result['queries']} queries, baseline {reference['queries']}")
+        limit = reference['ms'] * (1 + TIME_TOLERANCE)
+        if result['ms'] > limit:
+            message = f"{name}: {result['ms']} ms, baseline {reference['ms']} ms (limit {limit:.1f} ms)"
+            if STRICT_TIMING:
+                self.fail(message)
+            _logger.warning('Benchmark regression: %s', message)
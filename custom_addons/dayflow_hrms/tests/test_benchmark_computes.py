@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+
+import random
+from datetime import date, datetime, timedelta
+
+from odoo.tests import tagged
+
+from .common import BENCHMARK_RECORDS, BenchmarkCase
+
+BENCHMARK_SEED = 42
+DEPARTMENT_COUNT = 5
+PERIOD_START = date(2024, 1, 1)
+RATING_FIELDS = ['quality_of_work', 'productivity', 'communication', 'teamwork', 'initiative', 'punctuality']
+CREATE_CONTEXT = {
+    'tracking_disable': True,
+    'mail_create_nolog': True,
+    'mail_create_nosubscribe': True,
+    'mail_notrack': True,
+    'leave_fast_create': True,
+    'dayflow_skip_notifications': True,
+}
+
+
+def weekdays(start, count):
+    days, day = [], start
+    while len(days) < count:
+        if day.weekday() < 5:
+            days.append(day)
+        day += timedelta(days=1)
+    return days
+
+
+@tagged('dayflow_benchmark', '-standard', 'post_install', '-at_install')
+class TestBenchmarkComputes(BenchmarkCase):
+    """ ``BENCHMARK_RECORDS`` attendances, reviews and payslips, a quarter as many leaves,
+    spread over one employee per 20 records and ``DEPARTMENT_COUNT`` departments. """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.env = cls.env(context=dict(cls.env.context, tz='UTC', **CREATE_CONTEXT))
+        rng = random.Random(BENCHMARK_SEED)
+        count = BENCHMARK_RECORDS
+
+        cls.departments = cls.env['hr.department'].create([
+            {'name': f'Benchmark Department {number}'} for number in range(DEPARTMENT_COUNT)])
+        employee_count = max(count // 20, DEPARTMENT_COUNT)
+        cls.employees = cls.env['hr.employee'].create([{
+            'name': f'Benchmark Employee {number}',
+            'department_id': cls.departments[number % DEPARTMENT_COUNT].id,
+            'tz': 'UTC',
+        } for number in range(employee_count)])
+        # Record i belongs to employee i % employee_count, on its (i // employee_count)th working day
+        days = weekdays(PERIOD_START, -(-count // employee_count))
+        cls.date_from, cls.date_to = PERIOD_START, max(days[-1], date(PERIOD_START.year, 12, 31))
+
+        attendance_vals = []
+        for number in range(count):
+            day = days[number // employee_count]
+            check_in = datetime(day.year, day.month, day.day, 8, 30) + timedelta(minutes=rng.randint(0, 60))
+            attendance_vals.append({
+                'employee_id': cls.employees[number % employee_count].id,
+                'check_in': check_in,
+                'check_out': check_in + timedelta(hours=rng.uniform(3, 10)),
+            })
+        cls.attendances = cls.env['hr.attendance'].create(attendance_vals)
+
+        cls.reviews = cls.env['hr.performance.review'].create([{
+            'name': f'Benchmark Review {number}',
+            'employee_id': cls.employees[number % employee_count].id,
+            'review_date': day,
+            'date_from': day - timedelta(days=90),
+            'date_to': day,
+            'state': 'acknowledged',
+            **{field: rng.choice('12345') for field in RATING_FIELDS},
+        } for number, day in enumerate(rng.choice(days) for _i in range(count))])
+
+        leave_type = cls.env['hr.leave.type'].create({
+            'name': 'Benchmark Leave',
+            'requires_allocation': 'no',
+            'leave_validation_type': 'hr',
+        })
+        cls.leaves = cls.env['hr.leave'].create([{
+            'name': f'Benchmark Leave {number}',
+            'employee_id': cls.employees[number % employee_count].id,
+            'holiday_status_id': leave_type.id,
+            'request_date_from': days[number // employee_count],
+            'request_date_to': days[number // employee_count],
+        } for number in range(count // 4)])
+        cls.leaves[0::3].action_validate()
+        cls.leaves[1::3].action_refuse()
+
+        cls.payslips = cls.env['hr.payroll.slip'].create([{
+            'name': f'Benchmark Payslip {number}',
+            'employee_id': cls.employees[number % employee_count].id,
+            'date': days[number // employee_count],
+            'basic_wage': rng.uniform(30000, 150000),
+            'allowances': rng.uniform(0, 30000),
+            'deductions': rng.uniform(0, 20000),
+        } for number in range(count)]) if 'hr.payroll.slip' in cls.env else None
+
+        cls.reports = {
+            model: cls.env[model].create([{
+                'name': f'Benchmark {model}',
+                'date_from': cls.date_from,
+                'date_to': cls.date_to,
+                'department_id': department.id,
+            } for department in [cls.env['hr.department']] + list(cls.departments)])
+            for model in ['hr.attendance.report', 'hr.leave.analysis', 'hr.performance.report',
+                          'hr.performance.calibration']
+        }
+
+    def test_attendance_status(self):
+        self.measure('hr.attendance.attendance_status', self.attendances, ['attendance_status'])
+
+    def test_attendance_late_minutes(self):
+        self.measure('hr.attendance.late_minutes', self.attendances, ['late_minutes'])
+
+    def test_attendance_overtime_hours(self):
+        self.measure('hr.attendance.overtime_hours', self.attendances, ['overtime_hours'])
+
+    def test_payslip_net_wage(self):
+        if self.payslips is None:
+            self.skipTest('dayflow_payroll is not installed')
+        self.measure('hr.payroll.slip.net_wage', self.payslips, ['net_wage'])
+
+    def test_review_overall_rating(self):
+        self.measure('hr.performance.review.overall_rating', self.reviews, ['overall_rating'])
+
+    def test_review_rating_category(self):
+        self.measure('hr.performance.review.rating_category', self.reviews, ['rating_category'])
+
+    def test_report_attendance(self):
+        self.measure('hr.attendance.report.report_data', self.reports['hr.attendance.report'], ['total_days'])
+
+    def test_report_leave(self):
+        self.measure('hr.leave.analysis.report_data', self.reports['hr.leave.analysis'], ['total_leaves'])
+
+    def test_report_performance(self):
+        self.measure('hr.performance.report.report_data', self.reports['hr.performance.report'],
+                     ['total_reviews'])
+
+    def test_report_calibration(self):
+        self.measure('hr.performance.calibration.report_data', self.reports['hr.performance.calibration'],
+                     ['total_reviews'])
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+
+from datetime import date, datetime, timedelta
+
+from odoo.tests import tagged
+from odoo.tests.common import TransactionCase
+
+from ..models.performance_review import RATING_FIELDS
+from .test_benchmark_computes import CREATE_CONTEXT, weekdays
+
+HISTORY_START = date(2024, 1, 1)
+LEAVE_START = date(2025, 1, 1)
+
+
+@tagged('post_install', '-at_install')
+class TestEmployeeProfile(TransactionCase):
+    """ ``get_profile`` costs the same queries whatever the size of the employee's history. """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.env = cls.env(context=dict(cls.env.context, tz='UTC', **CREATE_CONTEXT))
+        cls.leave_type = cls.env['hr.leave.type'].create({
+            'name': 'Profile Leave',
+            'requires_allocation': 'no',
+            'leave_validation_type': 'hr',
+        })
+        cls.small = cls._create_employee_with_history('Short History', 1)
+        cls.large = cls._create_employee_with_history('Long History', 200)
+
+    @classmethod
+    def _create_employee_with_history(cls, name, count):
+        employee = cls.env['hr.employee'].create({'name': name, 'tz': 'UTC'})
+        days = weekdays(HISTORY_START, count)
+        cls.env['hr.attendance'].create([{
+            'employee_id': employee.id,
+            'check_in': datetime(day.year, day.month, day.day, 9, 0),
+            'check_out': datetime(day.year, day.month, day.day, 17, 0),
+        } for day in days])
+        leaves = cls.env['hr.leave'].create([{
+            'name': f'{name} Leave {number}',
+            'employee_id': employee.id,
+            'holiday_status_id': cls.leave_type.id,
+            'request_date_from': day,
+            'request_date_to': day,
+        } for number, day in enumerate(weekdays(LEAVE_START, max(count // 4, 1)))])
+        leaves[0::2].action_validate()
+        cls.env['hr.performance.review'].create([{
+            'name': f'{name} Review {number}',
+            'employee_id': employee.id,
+            'review_date': day,
+            'date_from': day - timedelta(days=90),
+            'date_to': day,
+            'state': 'acknowledged',
+            # Submitted reviews must carry every rating
+            **{field: str(number % 5 + 1) for field in RATING_FIELDS},
+        } for number, day in enumerate(days[:max(count // 10, 1)])])
+        if 'hr.payroll.slip' in cls.env:
+            cls.env['hr.payroll.slip'].create([{
+                'name': f'{name} Payslip {number}',
+                'employee_id': employee.id,
+                'date': day,
+                'basic_wage': 50000.0,
+                'state': 'paid',
+            } for number, day in enumerate(days[:max(count // 20, 1)])])
+        return employee
+
+    def _count_profile_queries(self, employee):
+        # Flushed like assertQueryCount does, so that pending precommit hooks are not counted
+        self.env.flush_all()
+        self.env.cr.flush()
+        self.env.invalidate_all()
+        queries = self.cr.sql_log_count
+        self.env['hr.employee'].get_profile(employee.id)
+        return self.cr.sql_log_count - queries
+
+    def test_profile_query_count(self):
+        Employee = self.env['hr.employee']
+        # Warm up the ormcache (rules, access rights) shared by both profiles
+        Employee.get_profile(self.small.id)
+        Employee.get_profile(self.large.id)
+
+        small_count = self._count_profile_queries(self.small)
+        self.env.invalidate_all()
+        with self.assertQueryCount(small_count):
+            profile = Employee.get_profile(self.large.id)
+        self.assertEqual(len(profile['attendance']['recent']), 5)
+        self.assertEqual(len(profile['reviews']['recent']), 5)
+        self.assertEqual(profile['reviews']['summary']['completed'], 20)
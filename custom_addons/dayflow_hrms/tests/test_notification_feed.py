@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+
+from odoo.tests import tagged
+from odoo.tests.common import TransactionCase
+
+FEED_LIMIT = 3
+
+
+@tagged('post_install', '-at_install')
+class TestNotificationFeed(TransactionCase):
+    """ Polling ``get_feed`` from its cursor returns every notification, even past ``limit``. """
+
+    def test_feed_pages_past_limit(self):
+        Notification = self.env['dayflow.notification']
+        since = Notification.search([('user_id', '=', self.env.uid)], order='id desc', limit=1).id or 0
+        created = Notification.create([{
+            'user_id': self.env.uid,
+            'title': f'Feed Notification {number}',
+        } for number in range(FEED_LIMIT + 1)])
+
+        first = Notification.get_feed(since=since, limit=FEED_LIMIT)
+        self.assertTrue(first['has_more'])
+        second = Notification.get_feed(since=first['cursor'], limit=FEED_LIMIT)
+        self.assertFalse(second['has_more'])
+
+        received = [notification['id'] for notification in first['notifications'] + second['notifications']]
+        self.assertEqual(received, sorted(created.ids))
+        self.assertEqual(second['cursor'], max(created.ids))
@@ -0,0 +1,4 @@
+# -*- coding: utf-8 -*-
+
+from . import performance_review_cycle
+from . import attendance_report_batch
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+
+import uuid
+
+from odoo import models, fields, api, _
+from odoo.exceptions import UserError, ValidationError
+
+from ..models.dayflow_job import JOB_WORKER_CRONS
+
+# Reports created and rendered per job chunk, i.e. per wkhtmltopdf run
+REPORT_CHUNK_SIZE = 50
+
+
+class HrAttendanceReportBatch(models.TransientModel):
+    _name = 'hr.attendance.report.batch'
+    _description = 'Bulk Attendance Report Generation'
+
+    name = fields.Char(string='Report Name', required=True, default='Attendance Report')
+    group_by = fields.Selection([
+        ('employee', 'One Report per Employee'),
+        ('department', 'One Report per Department'),
+    ], string='Reports', required=True, default='employee')
+    company_id = fields.Many2one('res.company', string='Company', required=True,
+                                 default=lambda self: self.env.company)
+    department_ids = fields.Many2many('hr.department', string='Departments',
+                                      help='Leave empty for every department of the company.')
+    include_sub_departments = fields.Boolean(string='Include Sub-Departments', default=True)
+    date_from = fields.Date(string='From Date', required=True)
+    date_to = fields.Date(string='To Date', required=True)
+
+    @api.constrains('date_from', 'date_to')
+    def _check_dates(self):
+        for batch in self:
+            if batch.date_from and batch.date_to and batch.date_from > batch.date_to:
+                raise ValidationError(_('From Date must be before To Date.'))
+
+    def _get_departments(self):
+        self.ensure_one()
+        if not self.department_ids:
+            return self.env['hr.department'].search([('company_id', 'in', [self.company_id.id, False])])
+        if self.include_sub_departments:
+            return self.env['hr.department'].search([('id', 'child_of', self.department_ids.ids)])
+        return self.department_ids
+
+    def _prepare_report_vals_list(self, batch_ref):
+        self.ensure_one()
+        common = {
+            'date_from': self.date_from,
+            'date_to': self.date_to,
+            'batch_ref': batch_ref,
+        }
+        departments = self._get_departments()
+        if self.group_by == 'department':
+            return [dict(common, name=f'{self.name} - {department.name}', department_id=department.id)
+                    for department in departments]
+        domain = [('company_id', '=', self.company_id.id)]
+        if self.department_ids:
+            domain.append(('department_id', 'in', departments.ids))
+        return [dict(common, name=f'{self.name} - {employee.name}', employee_id=employee.id,
+                     department_id=employee.department_id.id)
+                for employee in self.env['hr.employee'].search(domain, order='name')]
+
+    def action_generate_reports(self):
+        """ Queue the creation and rendering of the reports, split over the background workers. """
+        self.ensure_one()
+        batch_ref = uuid.uuid4().hex[:12]
+        vals_list = self._prepare_report_vals_list(batch_ref)
+        if not vals_list:
+            raise UserError(_('No employees or departments match these criteria.'))
+
+        # One job per worker, each with whole chunks, so the workers render in parallel
+        chunk_count = -(-len(vals_list) // REPORT_CHUNK_SIZE)
+        chunks_per_job = -(-chunk_count // min(len(JOB_WORKER_CRONS), chunk_count))
+        job_size = chunks_per_job * REPORT_CHUNK_SIZE
+        # Whole chunks may leave a worker without a job: count the slices actually created
+        slices = [vals_list[start:start + job_size] for start in range(0, len(vals_list), job_size)]
+        jobs = self.env['dayflow.job']
+        for number, items in enumerate(slices, start=1):
+            jobs |= jobs._enqueue_items(
+                'hr.attendance.report', '_generate_pdf_batch', items,
+                name=_('Attendance reports "%(name)s" (%(number)s/%(count)s)',
+                       name=self.name, number=number, count=len(slices)),
+                chunk_size=REPORT_CHUNK_SIZE)
+
+        return {
+            'name': _('Background Jobs'),
+            'type': 'ir.actions.act_window',
+            'view_mode': 'tree,form',
+            'res_model': 'dayflow.job',
+            'domain': [('id', 'in', jobs.ids)],
+        }
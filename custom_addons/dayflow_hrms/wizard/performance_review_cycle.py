@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+
+from odoo import models, fields, api, _
+from odoo.exceptions import UserError, ValidationError
+
+# Cycles with this many reviews are created by a background job, chunk by chunk
+BACKGROUND_CYCLE_SIZE = 500
+REVIEW_CHUNK_SIZE = 200
+
+
+class HrPerformanceReviewCycle(models.TransientModel):
+    _name = 'hr.performance.review.cycle'
+    _description = 'Performance Review Cycle'
+
+    name = fields.Char(string='Review Name', required=True, default='Quarterly Performance Review')
+    scope = fields.Selection([
+        ('company', 'Whole Company'),
+        ('department', 'Departments'),
+    ], string='Scope', required=True, default='department')
+    company_id = fields.Many2one('res.company', string='Company', required=True,
+                                 default=lambda self: self.env.company)
+    department_ids = fields.Many2many('hr.department', string='Departments')
+    include_sub_departments = fields.Boolean(string='Include Sub-Departments', default=True)
+
+    review_period = fields.Selection([
+        ('monthly', 'Monthly'),
+        ('quarterly', 'Quarterly'),
+        ('half_yearly', 'Half Yearly'),
+        ('annual', 'Annual'),
+    ], string='Review Period', required=True, default='quarterly')
+    review_date = fields.Date(string='Review Date', required=True, default=fields.Date.today)
+    date_from = fields.Date(string='Period From', required=True)
+    date_to = fields.Date(string='Period To', required=True)
+    next_review_date = fields.Date(string='Next Review Date')
+
+    # Reviewer assignment
+    use_manager_as_reviewer = fields.Boolean(string="Employee's Manager Reviews", default=True,
+                                             help="Assign the employee's manager as reviewer when the manager "
+                                                  "has a user account, otherwise fall back to the default reviewer.")
+    reviewer_id = fields.Many2one('res.users', string='Default Reviewer', required=True,
+                                  default=lambda self: self.env.user)
+
+    skip_existing = fields.Boolean(string='Skip Existing Reviews', default=True,
+                                   help='Do not create a review for employees who already have one for this period.')
+    log_in_chatter = fields.Boolean(string='Log Creation in Chatter', default=True,
+                                    help='Post a single creation note per review in one batch once all reviews exist.')
+
+    goal_line_ids = fields.One2many('hr.performance.review.cycle.goal', 'cycle_id', string='Default Goals')
+
+    @api.constrains('date_from', 'date_to')
+    def _check_dates(self):
+        for cycle in self:
+            if cycle.date_from and cycle.date_to and cycle.date_from > cycle.date_to:
+                raise ValidationError(_('Period From must be before Period To.'))
+
+    def _get_employees(self):
+        self.ensure_one()
+        domain = [('company_id', '=', self.company_id.id)]
+        if self.scope == 'department':
+            if not self.department_ids:
+                raise UserError(_('Select at least one department for the review cycle.'))
+            operator = 'child_of' if self.include_sub_departments else 'in'
+            domain.append(('department_id', operator, self.department_ids.ids))
+        return self.env['hr.employee'].search(domain)
+
+    def _get_reviewed_employee_ids(self, employees):
+        """ Employees that already have a non-cancelled review for this exact period. """
+        groups = self.env['hr.performance.review']._read_group([
+            ('employee_id', 'in', employees.ids),
+            ('date_from', '=', self.date_from),
+            ('date_to', '=', self.date_to),
+            ('state', '!=', 'cancelled'),
+        ], ['employee_id'])
+        return {employee.id for employee, in groups}
+
+    def _prepare_review_vals(self, employee):
+        reviewer = self.reviewer_id
+        if self.use_manager_as_reviewer and employee.parent_id.user_id:
+            reviewer = employee.parent_id.user_id
+        return {
+            'name': self.name,
+            'employee_id': employee.id,
+            'reviewer_id': reviewer.id,
+            'review_period': self.review_period,
+            'review_date': self.review_date,
+            'date_from': self.date_from,
+            'date_to': self.date_to,
+            'next_review_date': self.next_review_date,
+        }
+
+    def _prepare_goal_templates(self):
+        return [{
+            'name': line.name,
+            'description': line.description,
+            'priority': line.priority,
+            'target_date': line.target_date or self.date_to,
+        } for line in self.goal_line_ids]
+
+    def action_generate_reviews(self):
+        self.ensure_one()
+        employees = self._get_employees()
+        if self.skip_existing:
+            reviewed_ids = self._get_reviewed_employee_ids(employees)
+            employees = employees.filtered(lambda e: e.id not in reviewed_ids)
+        if not employees:
+            raise UserError(_('No employees left to review for this period.'))
+
+        vals_list = [self._prepare_review_vals(employee) for employee in employees]
+        kwargs = {
+            'goal_templates': self._prepare_goal_templates(),
+            'log_body': self.log_in_chatter and _('Review created by the "%s" review cycle.', self.name),
+        }
+        if len(vals_list) >= BACKGROUND_CYCLE_SIZE:
+            job = self.env['dayflow.job']._enqueue_items(
+                'hr.performance.review', '_create_cycle_reviews', vals_list,
+                name=_('Review cycle "%s"', self.name), kwargs=kwargs, chunk_size=REVIEW_CHUNK_SIZE)
+            return {
+                'name': _('Background Jobs'),
+                'type': 'ir.actions.act_window',
+                'view_mode': 'form',
+                'res_model': 'dayflow.job',
+                'res_id': job.id,
+            }
+        self.env['hr.performance.review']._create_cycle_reviews(vals_list, **kwargs)
+
+        return {
+            'name': _('Performance Reviews'),
+            'type': 'ir.actions.act_window',
+            'view_mode': 'tree,form',
+            'res_model': 'hr.performance.review',
+            'domain': [
+                ('name', '=', self.name),
+                ('date_from', '=', self.date_from),
+                ('date_to', '=', self.date_to),
+            ],
+        }
+
+
+class HrPerformanceReviewCycleGoal(models.TransientModel):
+    _name = 'hr.performance.review.cycle.goal'
+    _description = 'Performance Review Cycle Default Goal'
+
+    cycle_id = fields.Many2one('hr.performance.review.cycle', string='Review Cycle',
+                               required=True, ondelete='cascade')
+    name = fields.Char(string='Goal', required=True)
+    description = fields.Text(string='Description')
+    priority = fields.Selection([
+        ('low', 'Low'),
+        ('medium', 'Medium'),
+        ('high', 'High'),
+    ], string='Priority', default='medium')
+    target_date = fields.Date(string='Target Date', help='Defaults to the end of the review period.')
@@ -1,4 +1,4 @@
-from odoo import models, fields, api
+from odoo import models, fields, api, tools
 
 class Payslip(models.Model):
     _name = 'hr.payroll.slip'
@@ -20,6 +20,10 @@ class Payslip(models.Model):
         ('paid', 'Paid'),
     ], string='Status', default='draft')
 
+    def init(self):
+        tools.create_index(self._cr, 'hr_payroll_slip_employee_date_id_index',
+                           self._table, ['employee_id', 'date', 'id'])
+
     @api.depends('basic_wage', 'allowances', 'deductions')
     def _compute_net_wage(self):
         for record in self:
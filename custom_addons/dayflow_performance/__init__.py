@@ -1 +1 @@
-from . import models
+# Performance reviews (hr.performance.review) are defined in dayflow_hrms.
@@ -1,15 +1,13 @@
 {
     'name': 'Dayflow Performance',
-    'version': '1.0',
+    'version': '1.1',
     'summary': 'Performance Review Module for Dayflow HRMS',
-    'description': 'Handles employee performance reviews, ratings, and feedback.',
+    'description': 'Performance reviews now live in Dayflow HRMS. This module only depends on it so '
+                   'existing installations upgrade onto the consolidated hr.performance.review model.',
     'category': 'Human Resources',
     'author': 'Dayflow Team',
-    'depends': ['hr'],
-    'data': [
-        'security/ir.model.access.csv',
-        'views/performance_views.xml',
-    ],
+    'depends': ['dayflow_hrms'],
+    'data': [],
     'installable': True,
-    'application': True,
+    'application': False,
 }
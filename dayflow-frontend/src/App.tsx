@@ -2,6 +2,7 @@ import { useState } from 'react';
 import Login from './components/Login';
 import Dashboard from './components/Dashboard';
 import { ToastProvider } from './components/ui/Toast';
+import { clearApiToken } from './services/odoo';
 
 // Define the User Session type
 export interface UserSession {
@@ -20,6 +21,7 @@ function App() {
   };
 
   const handleLogout = () => {
+    clearApiToken();
     setSession(null);
   };
 
@@ -5,7 +5,7 @@ import {
     XAxis, YAxis, CartesianGrid, Tooltip, Legend, ResponsiveContainer
 } from 'recharts';
 import type { UserSession } from '../../App';
-import { executeKw } from '../../services/odoo';
+import { DashboardService } from '../../services/DashboardService';
 
 interface AnalyticsViewProps {
     session: UserSession;
@@ -13,7 +13,7 @@ interface AnalyticsViewProps {
 
 export default function AnalyticsView({ session }: AnalyticsViewProps) {
     const [loading, setLoading] = useState(true);
-    const [timeRange, setTimeRange] = useState<'7d' | '30d' | '90d'>('30d');
+    const [timeRange, setTimeRange] = useState<'3m' | '6m' | '12m'>('6m');
 
     // Analytics Data
     const [attendanceTrend, setAttendanceTrend] = useState<any[]>([]);
@@ -29,119 +29,32 @@ export default function AnalyticsView({ session }: AnalyticsViewProps) {
     const fetchAnalytics = async () => {
         setLoading(true);
         try {
-            // 1. Attendance Trend (Last N days)
-            const days = timeRange === '7d' ? 7 : timeRange === '30d' ? 30 : 90;
-            const attendanceData = [];
-            const now = new Date();
+            // Every chart comes from the precomputed department/month figures, in one call
+            const months = timeRange === '3m' ? 3 : timeRange === '6m' ? 6 : 12;
+            const data = await DashboardService.getAnalytics(session, months);
 
-            for (let i = days - 1; i >= 0; i--) {
-                const date = new Date(now);
-                date.setDate(date.getDate() - i);
-                const dateStr = date.toISOString().split('T')[0];
-
-                const count = await executeKw(
-                    session.uid,
-                    session.password,
-                    'hr.attendance',
-                    'search_count',
-                    [[
-                        ['check_in', '>=', `${dateStr} 00:00:00`],
-                        ['check_in', '<=', `${dateStr} 23:59:59`]
-                    ]]
-                );
-
-                attendanceData.push({
-                    date: date.toLocaleDateString('en-US', { month: 'short', day: 'numeric' }),
-                    checkIns: count
-                });
-            }
-            setAttendanceTrend(attendanceData);
-
-            // 2. Leave Distribution by Type
-            const leaveTypes = await executeKw(
-                session.uid,
-                session.password,
-                'hr.leave.type',
-                'search_read',
-                [[['active', '=', true]]],
-                { fields: ['id', 'name'] }
-            );
-
-            const leaveData = await Promise.all(
-                leaveTypes.map(async (type: any) => {
-                    const count = await executeKw(
-                        session.uid,
-                        session.password,
-                        'hr.leave',
-                        'search_count',
-                        [[['holiday_status_id', '=', type.id], ['state', '=', 'validate']]]
-                    );
-                    return { name: type.name, value: count };
-                })
-            );
-            setLeaveDistribution(leaveData.filter(d => d.value > 0));
-
-            // 3. Department Headcount
-            const departments = await executeKw(
-                session.uid,
-                session.password,
-                'hr.department',
-                'search_read',
-                [[]],
-                { fields: ['id', 'name'] }
-            );
-
-            const deptData = await Promise.all(
-                departments.map(async (dept: any) => {
-                    const count = await executeKw(
-                        session.uid,
-                        session.password,
-                        'hr.employee',
-                        'search_count',
-                        [[['department_id', '=', dept.id]]]
-                    );
-                    return { name: dept.name, employees: count };
-                })
-            );
-            setDepartmentStats(deptData.filter(d => d.employees > 0));
+            setAttendanceTrend(data.trend.map(month => ({
+                date: new Date(`${month.month}T00:00:00`).toLocaleDateString('en-US', { month: 'short', year: '2-digit' }),
+                attendanceRate: month.attendance_rate
+            })));
 
-            // 4. Payroll Summary
-            const payslips = await executeKw(
-                session.uid,
-                session.password,
-                'hr.payslip',
-                'search_read',
-                [[['state', '=', 'paid']]],
-                { fields: ['net_wage', 'basic_wage'], limit: 100 }
-            ).catch(() => []);
+            setLeaveDistribution(data.leaves_by_type
+                .map(type => ({ name: type.name, value: type.days }))
+                .filter(d => d.value > 0));
 
-            if (payslips.length > 0) {
-                const totalNet = payslips.reduce((sum: number, p: any) => sum + p.net_wage, 0);
-                const avgNet = totalNet / payslips.length;
-                setPayrollSummary({
-                    total: totalNet,
-                    average: avgNet,
-                    count: payslips.length
-                });
-            }
+            setDepartmentStats(data.departments
+                .map(dept => ({ name: dept.name, employees: dept.headcount }))
+                .filter(d => d.employees > 0));
 
-            // 5. Top Performers (based on performance reviews)
-            const reviews = await executeKw(
-                session.uid,
-                session.password,
-                'hr.performance.review',
-                'search_read',
-                [[['state', '=', 'finalized']]],
-                {
-                    fields: ['employee_id', 'manager_rating'],
-                    order: 'manager_rating desc',
-                    limit: 5
-                }
-            ).catch(() => []);
+            setPayrollSummary(data.payroll?.payslip_count ? {
+                total: data.payroll.total_cost,
+                average: data.payroll.average_cost,
+                count: data.payroll.payslip_count
+            } : {});
 
-            setTopPerformers(reviews.map((r: any) => ({
-                name: r.employee_id[1],
-                rating: parseFloat(r.manager_rating) || 0
+            setTopPerformers((data.ratings?.top_performers || []).map(performer => ({
+                name: performer.name,
+                rating: performer.rating || 0
             })));
 
         } catch (error) {
@@ -177,22 +90,22 @@ export default function AnalyticsView({ session }: AnalyticsViewProps) {
                 <div className="flex gap-3">
                     <div className="bg-slate-100 p-1.5 rounded-xl inline-flex shadow-inner">
                         <button
-                            onClick={() => setTimeRange('7d')}
-                            className={`px-4 py-2 rounded-lg text-sm font-bold transition-all ${timeRange === '7d' ? 'bg-white text-indigo-600 shadow-sm' : 'text-slate-500 hover:text-slate-700'}`}
+                            onClick={() => setTimeRange('3m')}
+                            className={`px-4 py-2 rounded-lg text-sm font-bold transition-all ${timeRange === '3m' ? 'bg-white text-indigo-600 shadow-sm' : 'text-slate-500 hover:text-slate-700'}`}
                         >
-                            7 Days
+                            3 Months
                         </button>
                         <button
-                            onClick={() => setTimeRange('30d')}
-                            className={`px-4 py-2 rounded-lg text-sm font-bold transition-all ${timeRange === '30d' ? 'bg-white text-indigo-600 shadow-sm' : 'text-slate-500 hover:text-slate-700'}`}
+                            onClick={() => setTimeRange('6m')}
+                            className={`px-4 py-2 rounded-lg text-sm font-bold transition-all ${timeRange === '6m' ? 'bg-white text-indigo-600 shadow-sm' : 'text-slate-500 hover:text-slate-700'}`}
                         >
-                            30 Days
+                            6 Months
                         </button>
                         <button
-                            onClick={() => setTimeRange('90d')}
-                            className={`px-4 py-2 rounded-lg text-sm font-bold transition-all ${timeRange === '90d' ? 'bg-white text-indigo-600 shadow-sm' : 'text-slate-500 hover:text-slate-700'}`}
+                            onClick={() => setTimeRange('12m')}
+                            className={`px-4 py-2 rounded-lg text-sm font-bold transition-all ${timeRange === '12m' ? 'bg-white text-indigo-600 shadow-sm' : 'text-slate-500 hover:text-slate-700'}`}
                         >
-                            90 Days
+                            12 Months
                         </button>
                     </div>
                     <button className="px-5 py-2.5 bg-indigo-600 text-white rounded-xl hover:bg-indigo-700 font-bold shadow-lg shadow-indigo-200 transition-all flex items-center gap-2">
@@ -219,7 +132,7 @@ export default function AnalyticsView({ session }: AnalyticsViewProps) {
                         <span className="text-xs font-bold bg-white/20 px-2 py-1 rounded-full">Active</span>
                     </div>
                     <h3 className="text-3xl font-bold">{leaveDistribution.reduce((sum, l) => sum + l.value, 0)}</h3>
-                    <p className="text-emerald-100 text-sm mt-1">Total Leaves</p>
+                    <p className="text-emerald-100 text-sm mt-1">Leave Days</p>
                 </div>
 
                 <div className="bg-gradient-to-br from-orange-500 to-orange-600 rounded-2xl p-6 text-white shadow-xl shadow-orange-200">
@@ -247,7 +160,7 @@ export default function AnalyticsView({ session }: AnalyticsViewProps) {
                 <div className="lg:col-span-2 bg-white p-8 rounded-2xl border border-slate-100 shadow-sm">
                     <h3 className="text-lg font-bold text-slate-900 mb-6 flex items-center gap-2">
                         <TrendingUp className="w-5 h-5 text-indigo-500" />
-                        Attendance Trend
+                        Attendance Rate
                     </h3>
                     <div className="h-64">
                         <ResponsiveContainer width="100%" height="100%">
@@ -260,9 +173,9 @@ export default function AnalyticsView({ session }: AnalyticsViewProps) {
                                 </defs>
                                 <CartesianGrid strokeDasharray="3 3" vertical={false} stroke="#f1f5f9" />
                                 <XAxis dataKey="date" axisLine={false} tickLine={false} tick={{ fill: '#94a3b8', fontSize: 12 }} />
-                                <YAxis axisLine={false} tickLine={false} tick={{ fill: '#94a3b8', fontSize: 12 }} />
+                                <YAxis domain={[0, 100]} unit="%" axisLine={false} tickLine={false} tick={{ fill: '#94a3b8', fontSize: 12 }} />
                                 <Tooltip contentStyle={{ borderRadius: '12px', border: 'none', boxShadow: '0 4px 6px -1px rgba(0, 0, 0, 0.1)' }} />
-                                <Area type="monotone" dataKey="checkIns" stroke="#6366f1" strokeWidth={3} fillOpacity={1} fill="url(#colorCheckIns)" />
+                                <Area type="monotone" dataKey="attendanceRate" name="Attendance rate (%)" stroke="#6366f1" strokeWidth={3} fillOpacity={1} fill="url(#colorCheckIns)" />
                             </AreaChart>
                         </ResponsiveContainer>
                     </div>
@@ -1,7 +1,7 @@
 import { useState, useEffect } from 'react';
 import { Clock, Play, Square, History, Users, Search, Smile, Meh, Frown, XCircle } from 'lucide-react';
 import { useToast } from '../ui/Toast';
-import { executeKw } from '../../services/odoo';
+import { executeKw, executeBatch, ref } from '../../services/odoo';
 import type { UserSession } from '../../App';
 
 interface AttendanceViewProps {
@@ -16,6 +16,27 @@ interface AttendanceRecord {
     worked_hours?: number;
 }
 
+type BoardStatus = 'present' | 'late' | 'on_leave' | 'absent' | 'not_yet_in';
+
+// One row of the server-side daily status snapshot (dayflow.attendance.status)
+interface BoardEntry {
+    id: number;
+    employee_id: [number, string];
+    department_id: [number, string] | false;
+    status: BoardStatus;
+    check_in: string | false;
+    check_out: string | false;
+    leave_type_id: [number, string] | false;
+}
+
+const BOARD_LABELS: Record<BoardStatus, string> = {
+    present: 'Present',
+    late: 'Late',
+    on_leave: 'On Leave',
+    absent: 'Absent',
+    not_yet_in: 'Not Yet In',
+};
+
 export default function AttendanceView({ session }: AttendanceViewProps) {
     const isManager = session.isAdmin;
     const [viewMode, setViewMode] = useState<'personal' | 'team'>(isManager ? 'team' : 'personal');
@@ -29,7 +50,8 @@ export default function AttendanceView({ session }: AttendanceViewProps) {
     const [duration, setDuration] = useState<string>('00:00:00');
 
     // Manager State
-    const [teamRecords, setTeamRecords] = useState<AttendanceRecord[]>([]);
+    const [teamRecords, setTeamRecords] = useState<BoardEntry[]>([]);
+    const [boardCounts, setBoardCounts] = useState<Record<BoardStatus, number> | null>(null);
 
     // Mood Tracking
     const [showMoodDialog, setShowMoodDialog] = useState(false);
@@ -78,10 +100,13 @@ export default function AttendanceView({ session }: AttendanceViewProps) {
         // Reuse logic from previous step, abbreviated here for clarity
         try {
             setLoading(true);
-            const employees = await executeKw(session.uid, session.password, 'hr.employee', 'search_read', [[['user_id', '=', session.uid]]], { fields: ['id'], limit: 1 });
+            const [employees, page] = await executeBatch(session.uid, session.password, [
+                { model: 'hr.employee', method: 'search_read', args: [[['user_id', '=', session.uid]]], kwargs: { fields: ['id'], limit: 1 } },
+                { model: 'dayflow.history', method: 'get_page', args: ['attendance'], kwargs: { domain: [['employee_id', '=', ref('0.0.id')]], fields: ['id', 'check_in', 'check_out', 'worked_hours'], limit: 5 } },
+            ]);
+            const records = page.records;
             if (employees.length) {
                 setEmployeeId(employees[0].id);
-                const records = await executeKw(session.uid, session.password, 'hr.attendance', 'search_read', [[['employee_id', '=', employees[0].id]]], { fields: ['id', 'check_in', 'check_out', 'worked_hours'], order: 'check_in desc', limit: 5 });
                 setRecentRecords(records);
                 if (records.length && !records[0].check_out) {
                     setIsCheckedIn(true);
@@ -97,18 +122,10 @@ export default function AttendanceView({ session }: AttendanceViewProps) {
     const fetchTeamData = async () => {
         try {
             setLoading(true);
-            // Fetch currently active attendance only? Or all recent?
-            // Let's get today's attendance for everyone
-            const records = await executeKw(
-                session.uid, session.password, 'hr.attendance', 'search_read',
-                [], // All records
-                {
-                    fields: ['id', 'employee_id', 'check_in', 'check_out', 'worked_hours'],
-                    order: 'check_in desc',
-                    limit: 20
-                }
-            );
-            setTeamRecords(records);
+            // Today's status of every employee, served from the server-side snapshot
+            const board = await executeKw(session.uid, session.password, 'dayflow.attendance.status', 'get_board', []);
+            setBoardCounts(board.counts);
+            setTeamRecords(board.employees);
         } catch (e) {
             console.error(e);
         } finally {
@@ -196,6 +213,16 @@ export default function AttendanceView({ session }: AttendanceViewProps) {
                         </div>
                     </div>
 
+                    {boardCounts && (
+                        <div className="px-8 py-4 border-b border-slate-100 flex flex-wrap gap-3">
+                            {(Object.keys(BOARD_LABELS) as BoardStatus[]).map(status => (
+                                <span key={status} className="px-3 py-1 rounded-full text-xs font-bold bg-slate-100 text-slate-600">
+                                    {BOARD_LABELS[status]}: {boardCounts[status]}
+                                </span>
+                            ))}
+                        </div>
+                    )}
+
                     <table className="w-full text-left text-sm">
                         <thead className="bg-slate-50/50 text-slate-500 border-b border-slate-100">
                             <tr>
@@ -208,7 +235,9 @@ export default function AttendanceView({ session }: AttendanceViewProps) {
                         </thead>
                         <tbody className="divide-y divide-slate-50">
                             {teamRecords.map(record => {
-                                const start = parseOdooDate(record.check_in);
+                                const start = record.check_in ? parseOdooDate(record.check_in) : null;
+                                const end = record.check_out ? parseOdooDate(record.check_out) : null;
+                                const isOnline = start && !record.check_out;
                                 return (
                                     <tr key={record.id} className="hover:bg-indigo-50/30 transition-colors group">
                                         <td className="px-8 py-5 font-bold text-slate-900 flex items-center gap-4">
@@ -218,28 +247,29 @@ export default function AttendanceView({ session }: AttendanceViewProps) {
                                             {record.employee_id[1]}
                                         </td>
                                         <td className="px-6 py-5">
-                                            {!record.check_out ? (
+                                            {isOnline ? (
                                                 <span className="inline-flex items-center px-3 py-1 rounded-full text-xs font-bold bg-emerald-100/80 text-emerald-700 border border-emerald-200">
                                                     <span className="relative flex h-2 w-2 mr-2">
                                                         <span className="animate-ping absolute inline-flex h-full w-full rounded-full bg-emerald-400 opacity-75"></span>
                                                         <span className="relative inline-flex rounded-full h-2 w-2 bg-emerald-500"></span>
                                                     </span>
-                                                    Online
+                                                    {record.status === 'late' ? 'Online (Late)' : 'Online'}
                                                 </span>
                                             ) : (
                                                 <span className="inline-flex items-center px-3 py-1 rounded-full text-xs font-bold bg-slate-100 text-slate-500 border border-slate-200">
-                                                    Offline
+                                                    {start ? 'Offline' : BOARD_LABELS[record.status]}
+                                                    {record.leave_type_id && !start ? ` · ${record.leave_type_id[1]}` : ''}
                                                 </span>
                                             )}
                                         </td>
                                         <td className="px-6 py-5 text-slate-600 font-medium font-mono">
-                                            {start.toLocaleTimeString([], { hour: '2-digit', minute: '2-digit' })}
+                                            {start ? start.toLocaleTimeString([], { hour: '2-digit', minute: '2-digit' }) : '-'}
                                         </td>
                                         <td className="px-6 py-5 text-slate-600 font-medium font-mono">
-                                            {record.check_out ? parseOdooDate(record.check_out).toLocaleTimeString([], { hour: '2-digit', minute: '2-digit' }) : '-'}
+                                            {end ? end.toLocaleTimeString([], { hour: '2-digit', minute: '2-digit' }) : '-'}
                                         </td>
                                         <td className="px-8 py-5 text-right font-bold text-indigo-900">
-                                            {record.worked_hours ? record.worked_hours.toFixed(2) + ' h' : '-'}
+                                            {start && end ? ((end.getTime() - start.getTime()) / 3600000).toFixed(2) + ' h' : '-'}
                                         </td>
                                     </tr>
                                 )
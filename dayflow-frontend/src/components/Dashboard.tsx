@@ -37,8 +37,9 @@ export default function Dashboard({ session, onLogout }: DashboardProps) {
     const [isSidebarOpen, setSidebarOpen] = useState(true);
     const [notifications, setNotifications] = useState<Notification[]>([]);
 
-    // Fetch notifications on mount and every 30 seconds
+    // Fetch notifications on mount, then poll the feed for deltas every 30 seconds
     useEffect(() => {
+        NotificationService.resetFeed();
         const fetchNotifications = async () => {
             const notifs = await NotificationService.fetchNotifications(session);
             setNotifications(notifs);
@@ -51,18 +52,18 @@ export default function Dashboard({ session, onLogout }: DashboardProps) {
     }, [session]);
 
     const handleMarkAsRead = (id: string) => {
-        setNotifications(NotificationService.markAsRead(id, notifications));
+        setNotifications(NotificationService.markAsRead(id, notifications, session));
     };
 
     const handleMarkAllAsRead = () => {
-        setNotifications(NotificationService.markAllAsRead(notifications));
+        setNotifications(NotificationService.markAllAsRead(notifications, session));
     };
 
     const handleNotificationClick = (notification: Notification) => {
         // Navigate based on notification type
         if (notification.type === 'leave_request' || notification.type === 'leave_approved' || notification.type === 'leave_rejected') {
             setActiveTab('leave');
-        } else if (notification.type === 'review_due') {
+        } else if (notification.type === 'review_due' || notification.type === 'review_update') {
             setActiveTab('performance');
         } else if (notification.type === 'attendance_alert') {
             setActiveTab('attendance');
@@ -216,7 +217,7 @@ export default function Dashboard({ session, onLogout }: DashboardProps) {
 }
 
 // Real Stats Component
-import { executeKw } from '../services/odoo';
+import { DashboardService } from '../services/DashboardService';
 import { AreaChart, Area, XAxis, Tooltip, ResponsiveContainer, CartesianGrid, PieChart, Pie, Cell } from 'recharts';
 
 function DashboardStats({ session, setActiveTab }: { session: UserSession; setActiveTab: (t: string) => void }) {
@@ -232,39 +233,18 @@ function DashboardStats({ session, setActiveTab }: { session: UserSession; setAc
     useEffect(() => {
         const fetchStats = async () => {
             try {
-                const totalEmp = await executeKw(session.uid, session.password, 'hr.employee', 'search_count', [[]]);
-                const present = await executeKw(session.uid, session.password, 'hr.attendance', 'search_count', [[['check_out', '=', false]]]);
-
-                const now = new Date();
-                const todayStr = now.toISOString().split('T')[0];
-                const onLeave = await executeKw(session.uid, session.password, 'hr.leave', 'search_count',
-                    [[['state', '=', 'validate'], ['date_from', '<=', todayStr], ['date_to', '>=', todayStr]]]
-                );
-                const myPending = await executeKw(session.uid, session.password, 'hr.leave', 'search_count',
-                    [[['state', '=', 'confirm'], ['user_id', '=', session.uid]]]
-                );
-
-                setStats({ employees: totalEmp, present, leave: onLeave, pending: myPending, loading: false });
-
-                const days = [];
-                for (let i = 6; i >= 0; i--) {
-                    const d = new Date();
-                    d.setDate(now.getDate() - i);
-                    days.push(d);
-                }
-                const chartPromises = days.map(async (date) => {
-                    const start = new Date(date);
-                    start.setHours(0, 0, 0, 0);
-                    const end = new Date(date);
-                    end.setHours(23, 59, 59, 999);
-                    const startStr = start.toISOString().replace('T', ' ').split('.')[0];
-                    const endStr = end.toISOString().replace('T', ' ').split('.')[0];
-                    const count = await executeKw(session.uid, session.password, 'hr.attendance', 'search_count',
-                        [[['check_in', '>=', startStr], ['check_in', '<=', endStr]]]
-                    );
-                    return { name: date.toLocaleDateString('en-US', { weekday: 'short' }), value: count };
+                const data = await DashboardService.getDashboardData(session, 7);
+                setStats({
+                    employees: data.headcount.total,
+                    present: data.attendance.checked_in_now,
+                    leave: data.leaves.on_leave_today,
+                    pending: data.leaves.my_pending,
+                    loading: false
                 });
-                setChartData(await Promise.all(chartPromises));
+                setChartData(data.attendance.trend.map(day => ({
+                    name: new Date(`${day.date}T00:00:00`).toLocaleDateString('en-US', { weekday: 'short' }),
+                    value: day.count
+                })));
 
             } catch (err) {
                 console.error(err);
@@ -2,6 +2,7 @@ import { useState, useEffect } from 'react';
 import { motion } from 'framer-motion';
 import { Search, Plus, Mail, Phone, RefreshCw, Key, User } from 'lucide-react';
 import { executeKw } from '../../services/odoo';
+import { CatalogService } from '../../services/CatalogService';
 import type { UserSession } from '../../App';
 import EmployeeForm from './EmployeeForm';
 import CreateUserModal from './CreateUserModal';
@@ -53,14 +54,17 @@ export default function EmployeeList({ session }: EmployeeListProps) {
                 domain = [['user_id', '=', session.uid]];
             }
 
-            const result = await executeKw(
-                session.uid,
-                session.password,
-                'hr.employee',
-                'search_read',
-                [domain],
-                { fields: fields, limit: 100 }
-            );
+            // Managers browse the cached directory; employees only load their own record
+            const result = isManager
+                ? await CatalogService.getCatalog(session, 'employee_directory')
+                : await executeKw(
+                    session.uid,
+                    session.password,
+                    'hr.employee',
+                    'search_read',
+                    [domain],
+                    { fields: fields, limit: 100 }
+                );
 
             setEmployees(result);
         } catch (err: any) {
@@ -2,9 +2,13 @@ import { useState, useEffect } from 'react';
 import { Plus, Calendar, CheckCircle, Clock, XCircle, FileText, CheckSquare, User } from 'lucide-react';
 import { useToast } from '../ui/Toast';
 import { PieChart, Pie, Cell, Tooltip as RechartsTooltip, Legend, ResponsiveContainer } from 'recharts';
-import { executeKw } from '../../services/odoo';
+import { executeKw, executeBatch, ref } from '../../services/odoo';
+import { HistoryService } from '../../services/HistoryService';
+import { CatalogService } from '../../services/CatalogService';
 import type { UserSession } from '../../App';
 
+const LEAVE_FIELDS = ['id', 'employee_id', 'holiday_status_id', 'date_from', 'date_to', 'duration_display', 'state', 'name'];
+
 interface LeaveViewProps {
     session: UserSession;
 }
@@ -56,23 +60,21 @@ export default function LeaveView({ session }: LeaveViewProps) {
         try {
             setLoading(true);
 
-            // A. Get Employee ID
-            const employees = await executeKw(session.uid, session.password, 'hr.employee', 'search_read', [[['user_id', '=', session.uid]]], { fields: ['id', 'name'], limit: 1 });
+            // Employee, own requests and approvals in a single round trip; leave types come from the cached catalog
+            const [[employees, myReqs, approvals], types] = await Promise.all([executeBatch(session.uid, session.password, [
+                { model: 'hr.employee', method: 'search_read', args: [[['user_id', '=', session.uid]]], kwargs: { fields: ['id', 'name'], limit: 1 } },
+                { model: 'dayflow.history', method: 'get_page', args: ['leave'], kwargs: { domain: [['employee_id', '=', ref('0.0.id')]], fields: LEAVE_FIELDS, limit: 20 } },
+                ...(isManager ? [{ model: 'hr.leave', method: 'search_read', args: [[['state', '=', 'confirm']]], kwargs: { fields: LEAVE_FIELDS, order: 'date_from asc' } }] : []),
+            ]), CatalogService.getCatalog(session, 'leave_types')]);
             if (!employees || employees.length === 0) {
                 setError('No employee profile found.');
                 setLoading(false);
                 return;
             }
-            const empId = employees[0].id;
-            setEmployeeId(empId);
-
-            // B. Get Leave Types
-            const types = await executeKw(session.uid, session.password, 'hr.leave.type', 'search_read', [[['active', '=', true]]], { fields: ['id', 'name'] });
+            setEmployeeId(employees[0].id);
             setLeaveTypes(types);
-
-            // C. Get Requests
-            await fetchRequests(empId);
-            if (isManager) await fetchApprovals();
+            setMyRequests(myReqs.records);
+            if (isManager) setPendingApprovals(approvals);
 
         } catch (err) {
             console.error(err);
@@ -83,12 +85,12 @@ export default function LeaveView({ session }: LeaveViewProps) {
     };
 
     const fetchRequests = async (empId: number) => {
-        const myReqs = await executeKw(
-            session.uid, session.password, 'hr.leave', 'search_read',
-            [[['employee_id', '=', empId]]],
-            { fields: ['id', 'employee_id', 'holiday_status_id', 'date_from', 'date_to', 'duration_display', 'state', 'name'], order: 'date_from desc', limit: 20 }
-        );
-        setMyRequests(myReqs);
+        const page = await HistoryService.getPage(session, 'leave', {
+            domain: [['employee_id', '=', empId]],
+            fields: LEAVE_FIELDS,
+            limit: 20
+        });
+        setMyRequests(page.records);
     };
 
     const fetchApprovals = async () => {
@@ -96,7 +98,7 @@ export default function LeaveView({ session }: LeaveViewProps) {
         const approvals = await executeKw(
             session.uid, session.password, 'hr.leave', 'search_read',
             [[['state', '=', 'confirm']]],
-            { fields: ['id', 'employee_id', 'holiday_status_id', 'date_from', 'date_to', 'duration_display', 'state', 'name'], order: 'date_from asc' }
+            { fields: LEAVE_FIELDS, order: 'date_from asc' }
         );
         setPendingApprovals(approvals);
     };
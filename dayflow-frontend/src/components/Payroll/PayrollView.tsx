@@ -5,6 +5,7 @@ import { BarChart, Bar, XAxis, YAxis, Tooltip, ResponsiveContainer } from 'recha
 import type { UserSession } from '../../App';
 import { PayrollService, type Payslip } from '../../services/PayrollService';
 import { executeKw } from '../../services/odoo';
+import { CatalogService } from '../../services/CatalogService';
 
 interface PayrollViewProps {
     session: UserSession;
@@ -13,6 +14,8 @@ interface PayrollViewProps {
 export default function PayrollView({ session }: PayrollViewProps) {
     const isManager = session.isAdmin;
     const [slips, setSlips] = useState<Payslip[]>([]);
+    const [slipDomain, setSlipDomain] = useState<any[]>([]);
+    const [nextCursor, setNextCursor] = useState<string | false>(false);
     const [showForm, setShowForm] = useState(false);
 
     // Form Data
@@ -44,11 +47,13 @@ export default function PayrollView({ session }: PayrollViewProps) {
                 }
             }
 
-            const data = await PayrollService.searchPayslips(session, domain);
-            setSlips(data);
+            const page = await PayrollService.searchPayslips(session, domain);
+            setSlips(page.records);
+            setSlipDomain(domain);
+            setNextCursor(page.next_cursor);
 
             if (isManager && employees.length === 0) {
-                const empList = await executeKw(session.uid, session.password, 'hr.employee', 'search_read', [[]], { fields: ['id', 'name'] });
+                const empList = await CatalogService.getCatalog(session, 'employee_directory');
                 setEmployees(empList);
             }
         } catch (error) {
@@ -56,6 +61,17 @@ export default function PayrollView({ session }: PayrollViewProps) {
         }
     };
 
+    const loadMore = async () => {
+        if (!nextCursor) return;
+        try {
+            const page = await PayrollService.searchPayslips(session, slipDomain, nextCursor);
+            setSlips([...slips, ...page.records]);
+            setNextCursor(page.next_cursor);
+        } catch (error) {
+            console.error(error);
+        }
+    };
+
     const handleCreate = async (e: React.FormEvent) => {
         e.preventDefault();
         try {
@@ -185,6 +201,13 @@ export default function PayrollView({ session }: PayrollViewProps) {
                         </tbody>
                     </table>
                 )}
+                {nextCursor && (
+                    <div className="p-6 text-center border-t border-slate-100">
+                        <button onClick={loadMore} className="text-sm font-bold text-indigo-600 hover:text-indigo-700">
+                            Load more
+                        </button>
+                    </div>
+                )}
             </div>
 
             {/* Create Modal */}
@@ -4,6 +4,7 @@ import { Radar, RadarChart, PolarGrid, PolarAngleAxis, ResponsiveContainer } fro
 import type { UserSession } from '../../App';
 import { PerformanceService, type PerformanceReview } from '../../services/PerformanceService';
 import { executeKw } from '../../services/odoo'; // Still needed for Employee fetch
+import { CatalogService } from '../../services/CatalogService';
 
 interface PerformanceViewProps {
     session: UserSession;
@@ -55,13 +56,13 @@ export default function PerformanceView({ session }: PerformanceViewProps) {
 
             if (isManager && employees.length === 0) {
                 // Fetch employees list for dropdown (Refactor to Service later)
-                const empList = await executeKw(session.uid, session.password, 'hr.employee', 'search_read', [[]], { fields: ['id', 'name'] });
+                const empList = await CatalogService.getCatalog(session, 'employee_directory');
                 setEmployees(empList);
             }
 
         } catch (err: any) {
             console.error(err);
-            setError("Failed to load reviews. Ensure 'Dayflow Performance' module is installed in Odoo.");
+            setError("Failed to load reviews. Ensure 'Dayflow HRMS' module is installed in Odoo.");
         } finally {
             setLoading(false);
         }
@@ -77,18 +78,18 @@ export default function PerformanceView({ session }: PerformanceViewProps) {
             if (selectedReview) {
                 // Update
                 await PerformanceService.updateReview(session, selectedReview.id, {
-                    manager_rating: formData.rating,
-                    manager_feedback: formData.feedback,
-                    state: formData.rating !== '0' ? 'finalized' : 'ongoing'
+                    ...PerformanceService.uniformRatings(formData.rating),
+                    reviewer_comments: formData.feedback,
+                    state: formData.rating !== '0' ? 'reviewed' : 'draft'
                 });
             } else {
                 // Create
                 await PerformanceService.createReview(session, {
                     name: formData.title,
                     employee_id: parseInt(formData.employeeId),
-                    start_date: formData.startDate,
-                    end_date: formData.endDate,
-                    state: 'ongoing'
+                    date_from: formData.startDate,
+                    date_to: formData.endDate,
+                    state: 'draft'
                 });
             }
             setShowForm(false);
@@ -105,10 +106,10 @@ export default function PerformanceView({ session }: PerformanceViewProps) {
         setFormData({
             title: review.name,
             employeeId: review.employee_id[0].toString(),
-            startDate: review.start_date,
-            endDate: review.end_date,
-            rating: review.manager_rating || '0',
-            feedback: typeof review.manager_feedback === 'string' ? review.manager_feedback : ''
+            startDate: review.date_from,
+            endDate: review.date_to,
+            rating: Math.round(review.overall_rating || 0).toString(),
+            feedback: typeof review.reviewer_comments === 'string' ? review.reviewer_comments : ''
         });
         setShowForm(true);
     };
@@ -126,8 +127,10 @@ export default function PerformanceView({ session }: PerformanceViewProps) {
         setShowForm(true);
     };
 
-    const renderStars = (ratingStr: string) => {
-        const rating = parseInt(ratingStr || '0');
+    const isGraded = (review: PerformanceReview) => review.state === 'reviewed' || review.state === 'acknowledged';
+
+    const renderStars = (overallRating: number) => {
+        const rating = Math.round(overallRating || 0);
         return (
             <div className="flex">
                 {[1, 2, 3, 4, 5].map((star) => (
@@ -175,10 +178,10 @@ export default function PerformanceView({ session }: PerformanceViewProps) {
                         <div key={review.id} className="bg-white rounded-[2rem] p-6 shadow-lg shadow-indigo-900/5 border border-slate-100 flex flex-col h-full hover:shadow-xl hover:shadow-indigo-900/10 transition-all duration-300 transform hover:-translate-y-1 animate-in slide-in-from-bottom-4" style={{ animationDelay: `${i * 100}ms` }}>
 
                             <div className="flex justify-between items-start mb-6">
-                                <span className={`px-3 py-1.5 rounded-lg text-[10px] font-bold uppercase tracking-wider ${review.state === 'finalized' ? 'bg-emerald-100 text-emerald-700 border border-emerald-200' : 'bg-indigo-100 text-indigo-700 border border-indigo-200'}`}>
+                                <span className={`px-3 py-1.5 rounded-lg text-[10px] font-bold uppercase tracking-wider ${isGraded(review) ? 'bg-emerald-100 text-emerald-700 border border-emerald-200' : 'bg-indigo-100 text-indigo-700 border border-indigo-200'}`}>
                                     {review.state}
                                 </span>
-                                {review.state === 'finalized' && <div className="scale-90 origin-top-right">{renderStars(review.manager_rating)}</div>}
+                                {isGraded(review) && <div className="scale-90 origin-top-right">{renderStars(review.overall_rating)}</div>}
                             </div>
 
                             <div className="mb-6">
@@ -193,10 +196,10 @@ export default function PerformanceView({ session }: PerformanceViewProps) {
 
                             <div className="flex items-center gap-2 text-xs font-medium text-slate-500 bg-slate-50 border border-slate-100 px-3 py-2 rounded-xl mb-6 w-fit">
                                 <Calendar className="w-3.5 h-3.5 text-slate-400" />
-                                {review.start_date} <span className="text-slate-300">→</span> {review.end_date}
+                                {review.date_from} <span className="text-slate-300">→</span> {review.date_to}
                             </div>
 
-                            {review.manager_feedback && (
+                            {review.reviewer_comments && (
                                 <div className="bg-amber-50/50 p-4 rounded-xl border border-amber-100 mb-6 flex-1 relative overflow-hidden group">
                                     <div className="absolute top-0 right-0 p-2 opacity-10 group-hover:opacity-20 transition-opacity">
                                         <MessageSquare className="w-16 h-16 text-amber-500" />
@@ -204,19 +207,19 @@ export default function PerformanceView({ session }: PerformanceViewProps) {
                                     <p className="text-xs font-bold text-amber-800 mb-1 flex items-center gap-1 uppercase tracking-wide">
                                         Manager Feedback
                                     </p>
-                                    <p className="text-sm text-amber-900/80 italic leading-relaxed relative z-10">"{review.manager_feedback}"</p>
+                                    <p className="text-sm text-amber-900/80 italic leading-relaxed relative z-10">"{review.reviewer_comments}"</p>
                                 </div>
                             )}
 
                             {isManager && (
                                 <button
                                     onClick={() => openEdit(review)}
-                                    className={`w-full mt-auto py-3 rounded-xl font-bold text-sm transition-all ${review.state === 'finalized'
+                                    className={`w-full mt-auto py-3 rounded-xl font-bold text-sm transition-all ${isGraded(review)
                                         ? 'border border-slate-200 text-slate-600 hover:bg-slate-50 hover:border-slate-300'
                                         : 'bg-indigo-600 text-white hover:bg-indigo-700 shadow-md shadow-indigo-500/20'
                                         }`}
                                 >
-                                    {review.state === 'finalized' ? 'Edit Rating' : 'Grade Review'}
+                                    {isGraded(review) ? 'Edit Rating' : 'Grade Review'}
                                 </button>
                             )}
                         </div>
@@ -27,9 +27,24 @@ interface EmployeeProfile {
     active?: boolean;
 }
 
+interface ProfileSection<T, S> {
+    recent: T[];
+    summary: S;
+}
+
+// Returned by hr.employee.get_profile in a fixed number of queries
+interface Employee360 {
+    employee: EmployeeProfile;
+    attendance: ProfileSection<{ id: number; check_in: string; check_out: string | false; worked_hours: number; attendance_status: string }, { days: number; attended: number; late: number; worked_hours: number; overtime_hours: number }>;
+    leaves: ProfileSection<{ id: number; holiday_status_id: [number, string]; date_from: string; date_to: string; number_of_days: number; state: string }, { days_taken: number; pending: number; refused: number }>;
+    reviews: ProfileSection<{ id: number; name: string; review_date: string; overall_rating: number; state: string }, { completed: number; average_rating: number }>;
+    payslips?: ProfileSection<{ id: number; name: string; date: string; net_wage: number; state: string }, { paid_this_year: number; net_this_year: number }>;
+}
+
 export default function ProfileView({ session, employeeId }: ProfileViewProps) {
     const [loading, setLoading] = useState(true);
     const [profile, setProfile] = useState<EmployeeProfile | null>(null);
+    const [activity, setActivity] = useState<Employee360 | null>(null);
     const [activeTab, setActiveTab] = useState<'overview' | 'activity' | 'settings'>('overview');
     const { toast } = useToast();
 
@@ -40,27 +55,18 @@ export default function ProfileView({ session, employeeId }: ProfileViewProps) {
     const fetchProfile = async () => {
         try {
             setLoading(true);
-            const domain = employeeId
-                ? [['id', '=', employeeId]]
-                : [['user_id', '=', session.uid]];
-
-            const fields = [
-                'name', 'job_title', 'department_id', 'work_email',
-                'mobile_phone', 'work_location_id', 'parent_id',
-                'image_1920', 'create_date', 'active'
-            ];
-
-            const result = await executeKw(
+            const result: Employee360 | false = await executeKw(
                 session.uid,
                 session.password,
                 'hr.employee',
-                'search_read',
-                [domain],
-                { fields, limit: 1 }
+                'get_profile',
+                [],
+                { employee_id: employeeId || false, limit: 5 }
             );
 
-            if (result && result.length > 0) {
-                setProfile(result[0]);
+            if (result) {
+                setProfile(result.employee);
+                setActivity(result);
             } else {
                 toast({ title: 'Profile Not Found', description: 'Could not load employee data.', variant: 'error' });
             }
@@ -228,12 +234,53 @@ export default function ProfileView({ session, employeeId }: ProfileViewProps) {
                         </motion.div>
                     )}
 
-                    {activeTab === 'activity' && (
-                        <div className="bg-white p-12 rounded-[2rem] border border-dashed border-slate-200 text-center">
-                            <Clock className="w-16 h-16 text-slate-200 mx-auto mb-4" />
-                            <h3 className="font-bold text-slate-900 text-xl">Activity Log</h3>
-                            <p className="text-slate-500 mt-2">Recent system interactions will appear here.</p>
-                        </div>
+                    {activeTab === 'activity' && activity && (
+                        <motion.div initial={{ opacity: 0, y: 10 }} animate={{ opacity: 1, y: 0 }} className="space-y-6">
+                            <div className="grid grid-cols-2 md:grid-cols-4 gap-4">
+                                <div className="p-6 bg-white rounded-3xl border border-slate-100 shadow-sm">
+                                    <p className="text-slate-400 text-xs font-bold uppercase tracking-wider mb-2">Attended ({activity.attendance.summary.days}d)</p>
+                                    <h4 className="text-2xl font-bold text-slate-900">{activity.attendance.summary.attended}</h4>
+                                    <p className="text-xs text-slate-500 mt-1">{activity.attendance.summary.late} late</p>
+                                </div>
+                                <div className="p-6 bg-white rounded-3xl border border-slate-100 shadow-sm">
+                                    <p className="text-slate-400 text-xs font-bold uppercase tracking-wider mb-2">Leave Taken</p>
+                                    <h4 className="text-2xl font-bold text-slate-900">{activity.leaves.summary.days_taken}d</h4>
+                                    <p className="text-xs text-slate-500 mt-1">{activity.leaves.summary.pending} pending</p>
+                                </div>
+                                <div className="p-6 bg-white rounded-3xl border border-slate-100 shadow-sm">
+                                    <p className="text-slate-400 text-xs font-bold uppercase tracking-wider mb-2">Avg Rating</p>
+                                    <h4 className="text-2xl font-bold text-slate-900">{activity.reviews.summary.average_rating.toFixed(1)}</h4>
+                                    <p className="text-xs text-slate-500 mt-1">{activity.reviews.summary.completed} reviews</p>
+                                </div>
+                                <div className="p-6 bg-white rounded-3xl border border-slate-100 shadow-sm">
+                                    <p className="text-slate-400 text-xs font-bold uppercase tracking-wider mb-2">Net Pay (YTD)</p>
+                                    <h4 className="text-2xl font-bold text-slate-900">₹{(activity.payslips?.summary.net_this_year || 0).toLocaleString()}</h4>
+                                    <p className="text-xs text-slate-500 mt-1">{activity.payslips?.summary.paid_this_year || 0} payslips</p>
+                                </div>
+                            </div>
+
+                            <div className="bg-white p-8 rounded-[2rem] border border-slate-100 shadow-sm space-y-3">
+                                <h3 className="text-lg font-bold text-slate-900 mb-4">Recent Activity</h3>
+                                {activity.attendance.recent.map(a => (
+                                    <div key={`att-${a.id}`} className="flex justify-between text-sm">
+                                        <span className="flex items-center gap-2 text-slate-700"><Clock className="w-4 h-4 text-indigo-500" />Checked in {new Date(a.check_in.replace(' ', 'T') + 'Z').toLocaleString()}</span>
+                                        <span className="text-slate-500 capitalize">{a.attendance_status}</span>
+                                    </div>
+                                ))}
+                                {activity.leaves.recent.map(l => (
+                                    <div key={`leave-${l.id}`} className="flex justify-between text-sm">
+                                        <span className="flex items-center gap-2 text-slate-700"><Briefcase className="w-4 h-4 text-orange-500" />{l.holiday_status_id[1]} from {new Date(l.date_from).toLocaleDateString()}</span>
+                                        <span className="text-slate-500 capitalize">{l.state}</span>
+                                    </div>
+                                ))}
+                                {activity.reviews.recent.map(r => (
+                                    <div key={`review-${r.id}`} className="flex justify-between text-sm">
+                                        <span className="flex items-center gap-2 text-slate-700"><Award className="w-4 h-4 text-purple-500" />{r.name}</span>
+                                        <span className="text-slate-500 capitalize">{r.state}</span>
+                                    </div>
+                                ))}
+                            </div>
+                        </motion.div>
                     )}
                 </div>
 
@@ -47,6 +47,7 @@ export default function NotificationDropdown({
             case 'leave_rejected':
                 return <X className="w-5 h-5 text-red-500" />;
             case 'review_due':
+            case 'review_update':
                 return <Star className="w-5 h-5 text-orange-500" />;
             case 'attendance_alert':
                 return <Clock className="w-5 h-5 text-amber-500" />;
@@ -0,0 +1,30 @@
+import { getApiToken } from './odoo';
+import type { UserSession } from '../App';
+
+export type CatalogName = 'leave_types' | 'leave_type_rules' | 'departments' | 'employee_directory';
+
+// Last response per catalog; revalidated with If-None-Match so unchanged data comes back as an empty 304
+const cache = new Map<string, { uid: number; etag: string; records: any[] }>();
+
+export const CatalogService = {
+
+    getCatalog: async <T = any>(session: UserSession, name: CatalogName): Promise<T[]> => {
+        const token = await getApiToken(session.uid, session.password);
+        const cached = cache.get(name);
+        const headers: Record<string, string> = { Authorization: `Bearer ${token}` };
+        if (cached && cached.uid === session.uid) {
+            headers['If-None-Match'] = cached.etag;
+        }
+
+        const response = await fetch(`/dayflow/api/catalog/${name}`, { headers, cache: 'no-store' });
+        if (response.status === 304 && cached) {
+            return cached.records;
+        }
+        if (!response.ok) {
+            throw new Error(`Failed to load ${name} (${response.status})`);
+        }
+        const records = await response.json();
+        cache.set(name, { uid: session.uid, etag: response.headers.get('ETag') || '', records });
+        return records;
+    }
+};
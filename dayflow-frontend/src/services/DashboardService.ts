@@ -0,0 +1,104 @@
+import { executeKw } from './odoo';
+import type { UserSession } from '../App';
+
+export interface DashboardData {
+    generated_at: string;
+    headcount: {
+        total: number;
+        by_department: { id: number; name: string; count: number }[];
+    };
+    attendance: {
+        present_today: number;
+        late_today: number;
+        checked_in_now: number;
+        trend: { date: string; count: number }[];
+    };
+    leaves: {
+        pending: number;
+        pending_second_approval: number;
+        on_leave_today: number;
+        my_pending: number;
+        by_type: { id: number; name: string; count: number }[];
+    };
+    // Only returned to HR officers
+    payroll?: {
+        paid_count?: number;
+        total_net?: number;
+        total_basic?: number;
+        average_net?: number;
+    };
+    ratings?: {
+        distribution: Record<'poor' | 'average' | 'good' | 'excellent', number>;
+        top_performers: { employee_id: number; name: string; rating: number }[];
+    };
+}
+
+export interface AnalyticsData {
+    date_from: string;
+    date_to: string;
+    headcount: number;
+    attendance_rate: number;
+    late_count: number;
+    overtime_hours: number;
+    trend: {
+        month: string;
+        headcount: number;
+        attendance_rate: number;
+        late_count: number;
+        late_minutes: number;
+        overtime_hours: number;
+        leave_days: number;
+    }[];
+    departments: {
+        id: number | false;
+        name: string;
+        headcount: number;
+        attendance_rate: number;
+        late_count: number;
+        overtime_hours: number;
+        leave_days: number;
+    }[];
+    leaves_by_type: { id: number; name: string; days: number }[];
+    // Only returned to HR officers
+    payroll?: {
+        payslip_count: number;
+        total_cost: number;
+        average_cost: number;
+    };
+    ratings?: {
+        review_count: number;
+        average_rating: number;
+        top_performers: { employee_id: number; name: string; rating: number }[];
+    };
+}
+
+export const DashboardService = {
+
+    /**
+     * Every dashboard KPI in a single round trip (cached server-side for a minute)
+     */
+    getDashboardData: async (session: UserSession, days: number = 7): Promise<DashboardData> => {
+        return await executeKw(
+            session.uid,
+            session.password,
+            'dayflow.dashboard',
+            'get_dashboard_data',
+            [],
+            { days }
+        );
+    },
+
+    /**
+     * Analytics charts of the last months, read from the precomputed department/month figures
+     */
+    getAnalytics: async (session: UserSession, months: number = 6): Promise<AnalyticsData> => {
+        return await executeKw(
+            session.uid,
+            session.password,
+            'dayflow.analytics.fact',
+            'get_analytics',
+            [],
+            { months }
+        );
+    }
+};
@@ -0,0 +1,39 @@
+import { executeKw } from './odoo';
+import type { UserSession } from '../App';
+
+export type HistoryResource = 'attendance' | 'leave' | 'payslip';
+
+export interface HistoryPage<T> {
+    records: T[];
+    // Opaque cursor for the next page, false on the last page
+    next_cursor: string | false;
+}
+
+export interface HistoryQuery {
+    domain?: any[];
+    fields?: string[];
+    cursor?: string | false;
+    limit?: number;
+}
+
+export const HistoryService = {
+
+    /**
+     * One page of history ordered newest first; pass the previous page's next_cursor to continue
+     */
+    getPage: async <T>(session: UserSession, resource: HistoryResource, query: HistoryQuery = {}): Promise<HistoryPage<T>> => {
+        return executeKw(
+            session.uid,
+            session.password,
+            'dayflow.history',
+            'get_page',
+            [resource],
+            {
+                domain: query.domain || [],
+                fields: query.fields || [],
+                cursor: query.cursor || false,
+                limit: query.limit || 50
+            }
+        );
+    }
+};
@@ -0,0 +1,50 @@
+import { tokenRpc } from './odoo';
+import type { UserSession } from '../App';
+
+export type JobState = 'pending' | 'running' | 'done' | 'failed' | 'cancelled';
+
+export interface JobStatus {
+    id: number;
+    name: string;
+    state: JobState;
+    progress: number;
+    done_count: number;
+    total_count: number;
+    attempts: number;
+    error: string | false;
+    date_started: string | false;
+    date_finished: string | false;
+}
+
+const POLL_INTERVAL = 2000;
+const FINISHED_STATES: JobState[] = ['done', 'failed', 'cancelled'];
+
+export const JobService = {
+
+    getStatus: async (session: UserSession, jobIds: number[]): Promise<JobStatus[]> => {
+        return tokenRpc(session.uid, session.password, '/dayflow/api/jobs', { job_ids: jobIds });
+    },
+
+    cancel: async (session: UserSession, jobId: number): Promise<boolean> => {
+        return tokenRpc(session.uid, session.password, '/dayflow/api/call', {
+            model: 'dayflow.job', method: 'action_cancel', args: [[jobId]], kwargs: {}
+        });
+    },
+
+    /**
+     * Poll a background job until it finishes, reporting each status update
+     */
+    waitFor: async (session: UserSession, jobId: number, onProgress?: (job: JobStatus) => void): Promise<JobStatus> => {
+        while (true) {
+            const [job] = await JobService.getStatus(session, [jobId]);
+            if (!job) {
+                throw new Error(`Job ${jobId} not found`);
+            }
+            onProgress?.(job);
+            if (FINISHED_STATES.includes(job.state)) {
+                return job;
+            }
+            await new Promise(resolve => setTimeout(resolve, POLL_INTERVAL));
+        }
+    }
+};
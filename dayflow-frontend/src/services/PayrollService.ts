@@ -1,4 +1,5 @@
 import { executeKw } from './odoo';
+import { HistoryService, type HistoryPage } from './HistoryService';
 import type { UserSession } from '../App';
 
 export interface Payslip {
@@ -14,19 +15,13 @@ export interface Payslip {
 }
 
 export const PayrollService = {
-    searchPayslips: async (session: UserSession, domain: any[] = []): Promise<Payslip[]> => {
-        return executeKw(
-            session.uid,
-            session.password,
-            'hr.payroll.slip',
-            'search_read',
-            [domain],
-            {
-                fields: ['name', 'employee_id', 'date', 'basic_wage', 'allowances', 'deductions', 'net_wage', 'state'],
-                order: 'date desc',
-                limit: 100
-            }
-        );
+    searchPayslips: async (session: UserSession, domain: any[] = [], cursor: string | false = false): Promise<HistoryPage<Payslip>> => {
+        return HistoryService.getPage<Payslip>(session, 'payslip', {
+            domain,
+            fields: ['name', 'employee_id', 'date', 'basic_wage', 'allowances', 'deductions', 'net_wage', 'state'],
+            cursor,
+            limit: 100
+        });
     },
 
     createPayslip: async (session: UserSession, data: any) => {
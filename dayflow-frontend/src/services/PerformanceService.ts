@@ -5,13 +5,19 @@ export interface PerformanceReview {
     id: number;
     name: string;
     employee_id: [number, string]; // [id, name]
-    start_date: string;
-    end_date: string;
-    state: 'draft' | 'ongoing' | 'finalized';
-    manager_rating: string;
-    manager_feedback: string | false;
+    reviewer_id: [number, string] | false;
+    review_date: string;
+    date_from: string;
+    date_to: string;
+    state: 'draft' | 'submitted' | 'reviewed' | 'acknowledged' | 'cancelled';
+    overall_rating: number;
+    rating_category: 'poor' | 'average' | 'good' | 'excellent';
+    reviewer_comments: string | false;
 }
 
+// The six rating axes of hr.performance.review
+export const RATING_FIELDS = ['quality_of_work', 'productivity', 'communication', 'teamwork', 'initiative', 'punctuality'];
+
 export const PerformanceService = {
 
     searchReviews: async (session: UserSession, domain: any[] = []): Promise<PerformanceReview[]> => {
@@ -22,13 +28,21 @@ export const PerformanceService = {
             'search_read',
             [domain],
             {
-                fields: ['name', 'employee_id', 'start_date', 'end_date', 'state', 'manager_rating', 'manager_feedback'],
-                order: 'start_date desc',
+                fields: ['name', 'employee_id', 'reviewer_id', 'review_date', 'date_from', 'date_to', 'state', 'overall_rating', 'rating_category', 'reviewer_comments'],
+                order: 'review_date desc',
                 limit: 100
             }
         );
     },
 
+    /**
+     * Apply a single star rating to every rating axis ('0' clears them)
+     */
+    uniformRatings: (rating: string): Record<string, string | false> => {
+        const value = rating !== '0' ? rating : false;
+        return Object.fromEntries(RATING_FIELDS.map(field => [field, value]));
+    },
+
     createReview: async (session: UserSession, data: any) => {
         return await executeKw(
             session.uid,
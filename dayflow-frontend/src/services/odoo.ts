@@ -5,8 +5,8 @@
 
 export const DB_NAME = "dayflow_db";
 
-// We will use the native fetch API to talk to Odoo's JSON-RPC endpoint
-export const odooCall = async (method: string, params: any = {}) => {
+// We will use the native fetch API to talk to Odoo's JSON-RPC endpoints
+const rpc = async (url: string, method: string, params: any = {}, headers: Record<string, string> = {}) => {
     const payload = {
         jsonrpc: "2.0",
         method: method,
@@ -15,10 +15,11 @@ export const odooCall = async (method: string, params: any = {}) => {
     };
 
     try {
-        const response = await fetch('/jsonrpc', {
+        const response = await fetch(url, {
             method: 'POST',
             headers: {
                 'Content-Type': 'application/json',
+                ...headers,
             },
             body: JSON.stringify(payload),
         });
@@ -28,7 +29,9 @@ export const odooCall = async (method: string, params: any = {}) => {
         if (data.error) {
             console.error("Odoo Error:", data.error);
             // Handling session expiration or access denied
-            throw new Error(data.error.data?.message || data.error.message);
+            const error = new Error(data.error.data?.message || data.error.message);
+            error.name = data.error.data?.name || error.name;
+            throw error;
         }
 
         return data.result;
@@ -38,6 +41,54 @@ export const odooCall = async (method: string, params: any = {}) => {
     }
 };
 
+export const odooCall = async (method: string, params: any = {}) => {
+    return rpc('/jsonrpc', method, params);
+};
+
+// Short-lived API token: the password hash is checked once per token instead of on every call
+let apiToken: { uid: number; token: string; expiresAt: number } | null = null;
+// Calls started while a token is being requested wait for that request instead of opening their own session
+let pendingToken: { uid: number; promise: Promise<string> } | null = null;
+const TOKEN_REFRESH_MARGIN = 60 * 1000;
+
+export const getApiToken = async (uid: number, password: string): Promise<string> => {
+    if (apiToken && apiToken.uid === uid && apiToken.expiresAt - TOKEN_REFRESH_MARGIN > Date.now()) {
+        return apiToken.token;
+    }
+    if (pendingToken && pendingToken.uid === uid) {
+        return pendingToken.promise;
+    }
+    const request = {
+        uid,
+        promise: (async () => {
+            const result = await rpc('/dayflow/api/session', 'call', { uid, password });
+            apiToken = {
+                uid,
+                token: result.token,
+                expiresAt: new Date(result.expires_at.replace(' ', 'T') + 'Z').getTime(),
+            };
+            return apiToken.token;
+        })(),
+    };
+    pendingToken = request;
+    try {
+        return await request.promise;
+    } finally {
+        if (pendingToken === request) {
+            pendingToken = null;
+        }
+    }
+};
+
+export const clearApiToken = async () => {
+    const token = apiToken?.token;
+    apiToken = null;
+    pendingToken = null;
+    if (token) {
+        await rpc('/dayflow/api/session/revoke', 'call', {}, { Authorization: `Bearer ${token}` }).catch(() => undefined);
+    }
+};
+
 // Authentication Service
 export const login = async (db: string, login: string, password: string) => {
     return odooCall("call", {
@@ -47,6 +98,24 @@ export const login = async (db: string, login: string, password: string) => {
     });
 };
 
+// Token-authenticated call to a Dayflow API route, refreshing the token once if the server rejected it
+export const tokenRpc = async (uid: number, password: string, url: string, params: any) => {
+    const call = async () => {
+        const token = await getApiToken(uid, password);
+        return rpc(url, 'call', params, { Authorization: `Bearer ${token}` });
+    };
+
+    try {
+        return await call();
+    } catch (error) {
+        if (error instanceof Error && error.name === 'odoo.exceptions.AccessDenied' && apiToken) {
+            apiToken = null;
+            return call();
+        }
+        throw error;
+    }
+};
+
 // Generic Model Method Caller (e.g., search_read, create, write)
 export const executeKw = async (
     uid: number,
@@ -56,11 +125,22 @@ export const executeKw = async (
     args: any[] = [],
     kwargs: any = {}
 ) => {
-    return odooCall("call", {
-        service: "object",
-        method: "execute_kw",
-        args: [DB_NAME, uid, password, model, operation, args, kwargs]
-    });
+    return tokenRpc(uid, password, '/dayflow/api/call', { model, method: operation, args, kwargs });
+};
+
+export interface BatchCall {
+    model: string;
+    method: string;
+    args?: any[];
+    kwargs?: any;
+}
+
+// Placeholder for the result of an earlier call in the same batch, e.g. ref('0.0.id') or ref('1.*.id')
+export const ref = (path: string) => ({ $ref: path });
+
+// Several dependent calls in one round trip and one server transaction; returns one result per call
+export const executeBatch = async (uid: number, password: string, calls: BatchCall[]): Promise<any[]> => {
+    return tokenRpc(uid, password, '/dayflow/api/batch', { calls });
 };
 
 // Security: Check if user belongs to a specific group (e.g., 'base.group_user')
@@ -10,6 +10,10 @@ export default defineConfig({
         target: 'http://localhost:8069',
         changeOrigin: true,
       },
+      '/dayflow': {
+        target: 'http://localhost:8069',
+        changeOrigin: true,
+      },
       '/web': {
         target: 'http://localhost:8069',
         changeOrigin: true,
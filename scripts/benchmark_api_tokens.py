@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+API Token Benchmark for Dayflow HRMS
+Compares requests per second of password-based execute_kw calls against
+token-authenticated calls to /dayflow/api/call
+"""
+
+import argparse
+import json
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+ODOO_URL = 'http://localhost:8069'
+ODOO_DB = 'dayflow_db'
+ODOO_USERNAME = 'admin'
+ODOO_PASSWORD = 'admin'
+
+
+def json_rpc(path, params, headers=None):
+    payload = json.dumps({'jsonrpc': '2.0', 'method': 'call', 'params': params, 'id': 1}).encode()
+    req = urllib.request.Request(f'{ODOO_URL}{path}', data=payload, headers={
+        'Content-Type': 'application/json',
+        **(headers or {}),
+    })
+    with urllib.request.urlopen(req) as response:
+        data = json.loads(response.read())
+    if data.get('error'):
+        raise RuntimeError(data['error'].get('data', {}).get('message') or data['error']['message'])
+    return data['result']
+
+
+def password_call(uid):
+    return json_rpc('/jsonrpc', {
+        'service': 'object',
+        'method': 'execute_kw',
+        'args': [ODOO_DB, uid, ODOO_PASSWORD, 'res.users', 'read', [[uid]], {'fields': ['name']}],
+    })
+
+
+def token_call(uid, token):
+    return json_rpc('/dayflow/api/call', {
+        'model': 'res.users',
+        'method': 'read',
+        'args': [[uid]],
+        'kwargs': {'fields': ['name']},
+    }, headers={'Authorization': f'Bearer {token}'})
+
+
+def measure(label, func, requests, concurrency):
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(lambda _i: func(), range(requests)))
+    elapsed = time.perf_counter() - start
+    rate = requests / elapsed
+    print(f"   {label:<10} {requests} requests in {elapsed:.2f}s → {rate:.1f} req/s")
+    return rate
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--requests', type=int, default=500, help='Requests per run (default: 500)')
+    parser.add_argument('--concurrency', type=int, default=4, help='Parallel clients (default: 4)')
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("⏱️  Dayflow API Token Benchmark")
+    print("=" * 60)
+
+    uid = json_rpc('/jsonrpc', {
+        'service': 'common', 'method': 'login', 'args': [ODOO_DB, ODOO_USERNAME, ODOO_PASSWORD],
+    })
+    if not uid:
+        print("❌ Authentication failed!")
+        return
+    session = json_rpc('/dayflow/api/session', {'uid': uid, 'password': ODOO_PASSWORD})
+    token = session['token']
+    print(f"✅ Authenticated as UID {uid}, token valid until {session['expires_at']} UTC\n")
+
+    # Warm up both paths so that the registry and the token cache are loaded
+    password_call(uid)
+    token_call(uid, token)
+
+    before = measure('password', lambda: password_call(uid), args.requests, args.concurrency)
+    after = measure('token', lambda: token_call(uid, token), args.requests, args.concurrency)
+
+    print(f"\n📈 Speedup: {after / before:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -8,11 +8,7 @@ import xmlrpc.client
 from datetime import datetime, timedelta
 import random
 
-# Odoo Connection Settings
-ODOO_URL = 'http://localhost:8069'
-ODOO_DB = 'dayflow_db'  # Updated to match actual database name
-ODOO_USERNAME = 'admin'
-ODOO_PASSWORD = 'admin'
+from odoo_client import OdooClient
 
 # Demo Data Configuration
 EMPLOYEES = [
@@ -30,25 +26,10 @@ EMPLOYEES = [
 
 LEAVE_TYPES = ['Paid Leave', 'Sick Leave', 'Casual Leave']
 
-def connect_odoo():
-    """Connect to Odoo and return common, uid, and models"""
-    common = xmlrpc.client.ServerProxy(f'{ODOO_URL}/xmlrpc/2/common')
-    uid = common.authenticate(ODOO_DB, ODOO_USERNAME, ODOO_PASSWORD, {})
-    models = xmlrpc.client.ServerProxy(f'{ODOO_URL}/xmlrpc/2/object')
-    
-    if not uid:
-        raise Exception("Authentication failed! Check your credentials.")
-    
-    print(f"✓ Connected to Odoo as user ID: {uid}")
-    return common, uid, models
+# Rating axes of hr.performance.review (each '1'-'5')
+RATING_FIELDS = ['quality_of_work', 'productivity', 'communication', 'teamwork', 'initiative', 'punctuality']
 
-def execute_kw(models, uid, model, method, args, kwargs=None):
-    """Execute Odoo method"""
-    if kwargs is None:
-        kwargs = {}
-    return models.execute_kw(ODOO_DB, uid, ODOO_PASSWORD, model, method, args, kwargs)
-
-def create_departments(models, uid):
+def create_departments(client):
     """Create departments if they don't exist"""
     print("\n📁 Creating Departments...")
     departments = {}
@@ -56,56 +37,53 @@ def create_departments(models, uid):
     
     for dept_name in dept_names:
         # Check if department exists
-        existing = execute_kw(models, uid, 'hr.department', 'search_read',
-                            [[['name', '=', dept_name]]], {'fields': ['id'], 'limit': 1})
+        existing = client.search_read('hr.department', [['name', '=', dept_name]], ['id'], limit=1)
         
         if existing:
             dept_id = existing[0]['id']
             print(f"  ✓ Department '{dept_name}' already exists (ID: {dept_id})")
         else:
-            dept_id = execute_kw(models, uid, 'hr.department', 'create', [{
+            dept_id = client.execute('hr.department', 'create', {
                 'name': dept_name,
-            }])
+            })
             print(f"  ✓ Created department '{dept_name}' (ID: {dept_id})")
         
         departments[dept_name] = dept_id
     
     return departments
 
-def create_employees(models, uid, departments):
+def create_employees(client, departments):
     """Create employees"""
     print("\n👥 Creating Employees...")
     employee_ids = []
     
     for emp_data in EMPLOYEES:
         # Check if employee exists
-        existing = execute_kw(models, uid, 'hr.employee', 'search_read',
-                            [[['work_email', '=', emp_data['email']]]],
-                            {'fields': ['id'], 'limit': 1})
+        existing = client.search_read('hr.employee', [['work_email', '=', emp_data['email']]], ['id'], limit=1)
         
         if existing:
             emp_id = existing[0]['id']
             print(f"  ✓ Employee '{emp_data['name']}' already exists (ID: {emp_id})")
         else:
-            emp_id = execute_kw(models, uid, 'hr.employee', 'create', [{
+            emp_id = client.execute('hr.employee', 'create', {
                 'name': emp_data['name'],
                 'work_email': emp_data['email'],
                 'mobile_phone': emp_data['phone'],
                 'job_title': emp_data['job'],
                 'department_id': departments[emp_data['dept']],
-            }])
+            })
             print(f"  ✓ Created employee '{emp_data['name']}' (ID: {emp_id})")
         
         employee_ids.append(emp_id)
     
     return employee_ids
 
-def create_attendance_records(models, uid, employee_ids):
+def create_attendance_records(client, employee_ids):
     """Create attendance records for the last 7 days"""
     print("\n⏰ Creating Attendance Records (Last 7 Days)...")
     
     today = datetime.now()
-    attendance_count = 0
+    attendance_vals = []
     
     for day_offset in range(7):
         date = today - timedelta(days=day_offset)
@@ -131,57 +109,43 @@ def create_attendance_records(models, uid, employee_ids):
                 check_in_str = check_in.strftime('%Y-%m-%d %H:%M:%S')
                 check_out_str = check_out.strftime('%Y-%m-%d %H:%M:%S')
                 
-                try:
-                    execute_kw(models, uid, 'hr.attendance', 'create', [{
-                        'employee_id': emp_id,
-                        'check_in': check_in_str,
-                        'check_out': check_out_str,
-                    }])
-                    attendance_count += 1
-                except Exception as e:
-                    print(f"    ⚠ Error creating attendance: {e}")
+                attendance_vals.append({
+                    'employee_id': emp_id,
+                    'check_in': check_in_str,
+                    'check_out': check_out_str,
+                })
     
-    print(f"  ✓ Created {attendance_count} attendance records")
+    # One multi-create per batch instead of one call per record
+    attendance_ids = client.create('hr.attendance', attendance_vals)
+    print(f"  ✓ Created {len(attendance_ids)} attendance records")
 
-def create_leave_requests(models, uid, employee_ids):
+def create_leave_requests(client, employee_ids):
     """Create leave requests with proper allocations"""
     print("\n🏖️ Creating Leave Requests...")
     
     # Get leave types
-    leave_types = execute_kw(models, uid, 'hr.leave.type', 'search_read',
-                            [[['active', '=', True]]], {'fields': ['id', 'name']})
+    leave_types = client.search_read('hr.leave.type', [['active', '=', True]], ['id', 'name'])
     
     if not leave_types:
         print("  ⚠ No leave types found. Creating default leave types...")
         leave_type_ids = []
         for leave_name in LEAVE_TYPES:
-            lt_id = execute_kw(models, uid, 'hr.leave.type', 'create', [{
+            lt_id = client.execute('hr.leave.type', 'create', {
                 'name': leave_name,
                 'allocation_type': 'fixed',  # Changed to fixed allocation
                 'validity_start': False,
-            }])
+            })
             leave_type_ids.append({'id': lt_id, 'name': leave_name})
         leave_types = leave_type_ids
     
     # Create allocations for all employees (20 days per year)
     print("  Creating leave allocations...")
-    allocation_count = 0
-    for emp_id in employee_ids:
-        for leave_type in leave_types:
-            try:
-                alloc_id = execute_kw(models, uid, 'hr.leave.allocation', 'create', [{
-                    'name': f'{leave_type["name"]} Allocation',
-                    'employee_id': emp_id,
-                    'holiday_status_id': leave_type['id'],
-                    'number_of_days': 20,  # 20 days allocation
-                    'state': 'validate',  # Auto-approve allocation
-                }])
-                allocation_count += 1
-            except Exception as e:
-                # Skip if allocation already exists
-                pass
+    # Server-side upsert: existing allocations are kept, missing ones created and validated
+    summary = client.execute('hr.leave.allocation', 'upsert_allocations', [['id', 'in', employee_ids]],
+                             [leave_type['id'] for leave_type in leave_types], 20)
     
-    print(f"    ✓ Created/verified {allocation_count} leave allocations")
+    print(f"    ✓ Created {summary['created']} leave allocations "
+          f"({summary['updated'] + summary['unchanged']} already existed)")
     
     leave_count = 0
     today = datetime.now()
@@ -197,19 +161,20 @@ def create_leave_requests(models, uid, employee_ids):
             date_to = (date_from + timedelta(days=duration)).replace(hour=16, minute=0, second=0)
             
             try:
-                leave_id = execute_kw(models, uid, 'hr.leave', 'create', [{
+                leave_id = client.execute('hr.leave', 'create', {
                     'employee_id': emp_id,
                     'holiday_status_id': leave_type['id'],
                     'date_from': date_from.strftime('%Y-%m-%d %H:%M:%S'),
                     'date_to': date_to.strftime('%Y-%m-%d %H:%M:%S'),
                     'name': f'{leave_type["name"]} - {duration} days',
-                }])
+                })
                 
                 # Approve the leave
-                execute_kw(models, uid, 'hr.leave', 'action_approve', [[leave_id]])
+                client.execute('hr.leave', 'action_approve', [leave_id])
                 leave_count += 1
-            except Exception as e:
-                pass  # Skip if overlaps or other issues
+            except xmlrpc.client.Fault as e:
+                # e.g. overlaps with an earlier leave of the same employee
+                print(f"    ⚠ Skipped past leave: {e.faultString.splitlines()[-1]}")
     
     # Create some pending leaves (for demo - these will show in notifications)
     print("  Creating pending leave requests...")
@@ -224,28 +189,28 @@ def create_leave_requests(models, uid, employee_ids):
         date_to = (date_from + timedelta(days=duration)).replace(hour=16, minute=0, second=0)
         
         try:
-            leave_id = execute_kw(models, uid, 'hr.leave', 'create', [{
+            leave_id = client.execute('hr.leave', 'create', {
                 'employee_id': emp_id,
                 'holiday_status_id': leave_type['id'],
                 'date_from': date_from.strftime('%Y-%m-%d %H:%M:%S'),
                 'date_to': date_to.strftime('%Y-%m-%d %H:%M:%S'),
                 'name': f'{leave_type["name"]} - {duration} days',
-            }])
+            })
             
             # Submit for approval (set to 'confirm' state)
-            execute_kw(models, uid, 'hr.leave', 'action_confirm', [[leave_id]])
+            client.execute('hr.leave', 'action_confirm', [leave_id])
             pending_count += 1
             leave_count += 1
-        except Exception as e:
-            pass
+        except xmlrpc.client.Fault as e:
+            print(f"    ⚠ Skipped pending leave: {e.faultString.splitlines()[-1]}")
     
     print(f"  ✓ Created {leave_count} leave requests ({pending_count} pending for approval)")
 
-def create_payroll_records(models, uid, employee_ids):
+def create_payroll_records(client, employee_ids):
     """Create payroll records for last 3 months"""
     print("\n💰 Creating Payroll Records (Last 3 Months)...")
     
-    payroll_count = 0
+    payslip_vals = []
     base_salaries = {
         'Senior Developer': 790000,      # ₹7.9 LPA
         'Product Manager': 875000,       # ₹8.75 LPA
@@ -291,24 +256,21 @@ def create_payroll_records(models, uid, employee_ids):
             # gross_wage = basic_wage + total_allowances
             # net_wage = gross_wage - total_deductions
             
-            try:
-                execute_kw(models, uid, 'hr.payroll.slip', 'create', [{
-                    'name': f'Payslip - {emp_data["name"]} - {month_name}',
-                    'employee_id': emp_id,
-                    'date': payslip_date.strftime('%Y-%m-%d'),
-                    'basic_wage': round(basic_wage, 2),
-                    'allowances': round(total_allowances, 2),
-                    'deductions': round(total_deductions, 2),
-                    # net_wage is computed automatically
-                    'state': 'paid' if month_offset > 0 else 'draft',  # Current month is draft
-                }])
-                payroll_count += 1
-            except Exception as e:
-                print(f"    ⚠ Error creating payslip: {e}")
+            payslip_vals.append({
+                'name': f'Payslip - {emp_data["name"]} - {month_name}',
+                'employee_id': emp_id,
+                'date': payslip_date.strftime('%Y-%m-%d'),
+                'basic_wage': round(basic_wage, 2),
+                'allowances': round(total_allowances, 2),
+                'deductions': round(total_deductions, 2),
+                # net_wage is computed automatically
+                'state': 'paid' if month_offset > 0 else 'draft',  # Current month is draft
+            })
     
-    print(f"  ✓ Created {payroll_count} payslips (3 months × {len(employee_ids)} employees)")
+    payslip_ids = client.create('hr.payroll.slip', payslip_vals)
+    print(f"  ✓ Created {len(payslip_ids)} payslips (3 months × {len(employee_ids)} employees)")
 
-def create_performance_reviews(models, uid, employee_ids):
+def create_performance_reviews(client, employee_ids):
     """Create performance reviews with realistic feedback"""
     print("\n⭐ Creating Performance Reviews...")
     
@@ -368,15 +330,16 @@ def create_performance_reviews(models, uid, employee_ids):
         end_date = today.strftime('%Y-%m-%d')
         
         try:
-            execute_kw(models, uid, 'hr.performance.review', 'create', [{
+            client.execute('hr.performance.review', 'create', {
                 'name': f'Q4 2025 Performance Review - {emp_data["name"]}',
                 'employee_id': emp_id,
-                'start_date': start_date,
-                'end_date': end_date,
-                'manager_rating': str(rating),
-                'manager_feedback': feedback,
-                'state': 'finalized',
-            }])
+                'date_from': start_date,
+                'date_to': end_date,
+                'review_date': end_date,
+                **{field: str(rating) for field in RATING_FIELDS},
+                'reviewer_comments': feedback,
+                'state': 'acknowledged',
+            })
             review_count += 1
             print(f"    ✓ Created review for {emp_data['name']} (Rating: {rating}/5)")
         except Exception as e:
@@ -392,18 +355,17 @@ def create_performance_reviews(models, uid, employee_ids):
         end_date = (today + timedelta(days=90)).strftime('%Y-%m-%d')
         
         try:
-            execute_kw(models, uid, 'hr.performance.review', 'create', [{
+            client.execute('hr.performance.review', 'create', {
                 'name': f'Q1 2026 Performance Review - {emp_data["name"]}',
                 'employee_id': emp_id,
-                'start_date': start_date,
-                'end_date': end_date,
-                'manager_rating': '0',  # Not rated yet
-                'manager_feedback': 'Review in progress...',
-                'state': 'ongoing',
-            }])
+                'date_from': start_date,
+                'date_to': end_date,
+                'reviewer_comments': 'Review in progress...',
+                'state': 'draft',  # Not rated yet
+            })
             review_count += 1
-        except Exception as e:
-            pass
+        except xmlrpc.client.Fault as e:
+            print(f"    ⚠ Error creating ongoing review for {emp_data['name']}: {e.faultString.splitlines()[-1]}")
     
     print(f"\n  ✓ Created {review_count} performance reviews (finalized + ongoing)")
 
@@ -415,25 +377,27 @@ def main():
     
     try:
         # Connect to Odoo
-        common, uid, models = connect_odoo()
+        client = OdooClient()
+        client.connect()
+        print(f"✓ Connected to Odoo as user ID: {client.uid}")
         
         # Create departments
-        departments = create_departments(models, uid)
+        departments = create_departments(client)
         
         # Create employees
-        employee_ids = create_employees(models, uid, departments)
+        employee_ids = create_employees(client, departments)
         
         # Create attendance records
-        create_attendance_records(models, uid, employee_ids)
+        create_attendance_records(client, employee_ids)
         
         # Create leave requests
-        create_leave_requests(models, uid, employee_ids)
+        create_leave_requests(client, employee_ids)
         
         # Create payroll records
-        create_payroll_records(models, uid, employee_ids)
+        create_payroll_records(client, employee_ids)
         
         # Create performance reviews
-        create_performance_reviews(models, uid, employee_ids)
+        create_performance_reviews(client, employee_ids)
         
         print("\n" + "=" * 60)
         print("✅ Demo Data Generation Complete!")
@@ -445,6 +409,8 @@ def main():
         print(f"  • Leave requests: Past + Pending")
         print(f"  • Payslips: Current month")
         print(f"  • Performance reviews: Q4 2025")
+        client.close()
+        client.print_stats()
         print(f"\n🎉 Your demo is ready!")
         
     except Exception as e:
@@ -0,0 +1,408 @@
+#!/usr/bin/env python3
+"""
+Synthetic Load Data Generator for Dayflow HRMS
+Generates a reproducible company of any size (departments, employees, attendance,
+leaves, payslips and performance reviews over several years) for benchmarks and
+load tests. Every employee's history is derived from (seed, employee number), so the
+same seed always yields the same data, whatever the number of workers.
+
+Records are written with multi-record creates, several batches in flight on a
+thread pool. Any failed batch stops the run with its error.
+
+With --with-users N, the first N employees also get a login (their work e-mail,
+password LOAD_USER_PASSWORD) so that load_test.py can act as each of them.
+
+Example:
+    python3 generate_load_data.py --employees 50000 --years 3 --seed 42 --workers 8 --with-users 500
+"""
+
+import argparse
+import calendar
+import math
+import random
+from collections import defaultdict
+from datetime import date, datetime, time as dt_time, timedelta
+from zoneinfo import ZoneInfo
+
+from odoo_client import OdooClient
+
+# name, share of the headcount, [(job title, annual base salary, weight)]
+DEPARTMENTS = [
+    ('Engineering', 0.34, [('Software Engineer', 900000, 6), ('Senior Software Engineer', 1500000, 3),
+                           ('QA Engineer', 650000, 2), ('DevOps Engineer', 1100000, 1)]),
+    ('Customer Support', 0.16, [('Support Agent', 420000, 8), ('Support Team Lead', 700000, 1)]),
+    ('Sales', 0.15, [('Account Executive', 600000, 5), ('Sales Manager', 1200000, 1)]),
+    ('Operations', 0.08, [('Operations Analyst', 550000, 4), ('Operations Manager', 1000000, 1)]),
+    ('Marketing', 0.07, [('Marketing Specialist', 580000, 4), ('Marketing Lead', 950000, 1)]),
+    ('Product', 0.06, [('Product Manager', 1300000, 3), ('Product Analyst', 750000, 2)]),
+    ('Finance', 0.05, [('Accountant', 560000, 4), ('Finance Manager', 1150000, 1)]),
+    ('Design', 0.05, [('UX Designer', 800000, 3), ('Visual Designer', 650000, 2)]),
+    ('Human Resources', 0.04, [('HR Generalist', 520000, 3), ('HR Manager', 980000, 1)]),
+]
+
+FIRST_NAMES = [
+    'Aarav', 'Aditi', 'Ananya', 'Arjun', 'Ava', 'Daniel', 'David', 'Diya', 'Emily', 'Ethan',
+    'Fatima', 'Grace', 'Hiro', 'Ishaan', 'James', 'Kabir', 'Kavya', 'Leila', 'Liam', 'Maya',
+    'Meera', 'Michael', 'Mohammed', 'Nisha', 'Noah', 'Olivia', 'Omar', 'Priya', 'Rahul', 'Riya',
+    'Rohan', 'Sara', 'Sofia', 'Tanvi', 'Vikram', 'Wei', 'Yusuf', 'Zara',
+]
+LAST_NAMES = [
+    'Anderson', 'Bhatt', 'Chen', 'Desai', 'Fernandes', 'Gandhi', 'Garcia', 'Gupta', 'Iyer',
+    'Johnson', 'Joshi', 'Khan', 'Kim', 'Kumar', 'Lee', 'Martinez', 'Mehta', 'Nair', 'Patel',
+    'Rao', 'Reddy', 'Rodriguez', 'Shah', 'Sharma', 'Singh', 'Taylor', 'Verma', 'Wilson',
+]
+
+# Rating axes of hr.performance.review (each '1'-'5')
+RATING_FIELDS = ['quality_of_work', 'productivity', 'communication', 'teamwork', 'initiative', 'punctuality']
+
+# Leave type name fragment -> (leave blocks per year, mean extra days per block)
+LEAVE_PATTERNS = {
+    'paid': (2.5, 2.0),
+    'sick': (2.0, 0.6),
+    'casual': (3.0, 0.2),
+}
+DEFAULT_LEAVE_PATTERN = (1.0, 1.0)
+
+# Password of the logins created with --with-users
+LOAD_USER_PASSWORD = 'loadtest'
+# Password hashing dominates user creation: small batches keep every worker busy
+USER_BATCH_SIZE = 50
+
+# Creates run without chatter: no tracking values, creation notes or followers
+CREATE_CONTEXT = {
+    'tracking_disable': True,
+    'mail_create_nolog': True,
+    'mail_create_nosubscribe': True,
+    'mail_notrack': True,
+    'leave_fast_create': True,
+    # Historical punches and requests must not notify managers
+    'dayflow_skip_notifications': True,
+}
+
+def weighted_choice(rng, items, weights):
+    return rng.choices(items, weights=weights)[0]
+
+
+def poisson(rng, lam):
+    """Knuth's algorithm; fine for the small rates used here"""
+    limit, k, p = math.exp(-lam), 0, rng.random()
+    while p > limit:
+        k += 1
+        p *= rng.random()
+    return k
+
+
+def workdays(start, end):
+    day = start
+    while day <= end:
+        if day.weekday() < 5:
+            yield day
+        day += timedelta(days=1)
+
+
+def employee_profile(seed, number, date_from):
+    """Everything about employee ``number`` that later phases need, derived from the seed only"""
+    rng = random.Random(f'{seed}:employee:{number}')
+    department = weighted_choice(rng, DEPARTMENTS, [share for _name, share, _jobs in DEPARTMENTS])
+    job, base_salary, _weight = weighted_choice(rng, department[2], [weight for *_job, weight in department[2]])
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    # Most of the company predates the generated window, some join during it
+    hired_days_before = int(rng.expovariate(1 / 900)) - (rng.random() < 0.15) * rng.randint(0, 700)
+    return {
+        'name': f'{first} {last}',
+        'email': f'{first}.{last}.{number}@seed{seed}.dayflow.test'.lower(),
+        'department': department[0],
+        'job': job,
+        'annual_salary': base_salary * rng.lognormvariate(0, 0.12),
+        'hire_date': date_from - timedelta(days=hired_days_before),
+        # Individual habits: most people are rarely late or absent, a few often are
+        'late_rate': rng.betavariate(2, 18),
+        'absence_rate': rng.betavariate(1.5, 60),
+        'overtime_rate': rng.betavariate(2, 8),
+        'performance': min(max(rng.gauss(3.4, 0.6), 1.0), 5.0),
+    }
+
+
+def plan_leaves(seed, number, profile, leave_types, date_from, date_to, today):
+    """Non-overlapping leave blocks of one employee: [(leave type, first day, last day, state)]"""
+    rng = random.Random(f'{seed}:leave:{number}')
+    taken, leaves = set(), []
+    start = max(date_from, profile['hire_date'])
+    if start > date_to:
+        return leaves
+    for year in range(start.year, date_to.year + 1):
+        year_days = list(workdays(max(start, date(year, 1, 1)), min(date_to, date(year, 12, 31))))
+        if not year_days:
+            continue
+        for leave_type in leave_types:
+            blocks_per_year, extra_days = leave_type['pattern']
+            for _block in range(poisson(rng, blocks_per_year * len(year_days) / 261)):
+                first = rng.choice(year_days)
+                days = [day for day in workdays(first, first + timedelta(days=13))][:1 + poisson(rng, extra_days)]
+                if taken.intersection(days):
+                    continue
+                taken.update(days)
+                if days[0] > today:
+                    state = 'confirm'
+                else:
+                    state = 'refuse' if rng.random() < 0.05 else 'validate'
+                leaves.append((leave_type, days[0], days[-1], state))
+    return leaves
+
+
+def plan_attendance(seed, number, profile, leave_days, date_from, date_to, tz):
+    """(check_in, check_out) in UTC for each workday the employee came in"""
+    rng = random.Random(f'{seed}:attendance:{number}')
+    punches = []
+    for day in workdays(max(date_from, profile['hire_date']), date_to):
+        if day in leave_days or rng.random() < profile['absence_rate']:
+            continue
+        minutes = rng.gauss(-12, 8)  # relative to 09:00
+        if rng.random() < profile['late_rate']:
+            minutes = 16 + rng.expovariate(1 / 25)
+        check_in = datetime.combine(day, dt_time(9)) + timedelta(minutes=minutes)
+        worked = 8.5 * 60 + rng.gauss(0, 15)
+        if rng.random() < profile['overtime_rate']:
+            worked += rng.expovariate(1 / 75)
+        check_out = check_in + timedelta(minutes=worked)
+        punches.append(tuple(
+            moment.replace(tzinfo=tz).astimezone(ZoneInfo('UTC')).strftime('%Y-%m-%d %H:%M:%S')
+            for moment in (check_in, check_out)))
+    return punches
+
+
+def quarters(date_from, date_to):
+    start = date(date_from.year, 3 * ((date_from.month - 1) // 3) + 1, 1)
+    while start <= date_to:
+        end = (start + timedelta(days=95)).replace(day=1) - timedelta(days=1)
+        yield start, end
+        start = end + timedelta(days=1)
+
+
+def months(date_from, date_to):
+    start = date_from.replace(day=1)
+    while start <= date_to:
+        yield start, start.replace(day=calendar.monthrange(start.year, start.month)[1])
+        start = (start + timedelta(days=32)).replace(day=1)
+
+
+def ensure_departments(client):
+    names = [name for name, _share, _jobs in DEPARTMENTS]
+    existing = {d['name']: d['id'] for d in client.search_read('hr.department', [['name', 'in', names]], ['name'])}
+    missing = [name for name in names if name not in existing]
+    if missing:
+        existing.update(zip(missing, client.create('hr.department', [{'name': name} for name in missing])))
+    return existing
+
+
+def get_leave_types(client):
+    leave_types = client.search_read('hr.leave.type', [['active', '=', True]],
+                                     ['name', 'requires_allocation'], order='sequence, id')
+    if not leave_types:
+        raise RuntimeError('No active leave types: run fix_leave_types.py first')
+    for leave_type in leave_types:
+        leave_type['pattern'] = next((pattern for fragment, pattern in LEAVE_PATTERNS.items()
+                                      if fragment in leave_type['name'].lower()), DEFAULT_LEAVE_PATTERN)
+    return leave_types
+
+
+def model_installed(client, model):
+    return bool(client.execute('ir.model', 'search_count', [['model', '=', model]]))
+
+
+def create_employees(client, args, departments, date_from):
+    print(f"\n👥 Creating {args.employees:,} employees...")
+    profiles = [employee_profile(args.seed, number, date_from) for number in range(args.employees)]
+    employee_ids = client.create('hr.employee', [{
+        'name': profile['name'],
+        'work_email': profile['email'],
+        'job_title': profile['job'],
+        'department_id': departments[profile['department']],
+    } for profile in profiles], context=CREATE_CONTEXT)
+
+    # The first employee of each department heads it and manages its other members
+    members = defaultdict(list)
+    for employee_id, profile in zip(employee_ids, profiles):
+        members[profile['department']].append(employee_id)
+    for department, ids in members.items():
+        client.write('hr.department', [departments[department]], {'manager_id': ids[0]})
+        client.write('hr.employee', ids[1:], {'parent_id': ids[0]}, context=CREATE_CONTEXT)
+    return list(zip(employee_ids, profiles))
+
+
+def create_users(client, employees, count):
+    """A login for each of the first ``count`` employees, linked to its employee"""
+    employees = employees[:count]
+    print(f"\n🔐 Creating {len(employees):,} user logins...")
+    client.create('res.users', [{
+        'name': profile['name'],
+        'login': profile['email'],
+        'password': LOAD_USER_PASSWORD,
+        'employee_ids': [(4, employee_id)],
+    } for employee_id, profile in employees], context=dict(CREATE_CONTEXT, no_reset_password=True),
+        batch_size=USER_BATCH_SIZE)
+
+
+def create_allocations(client, employees, leave_types, date_from, date_to):
+    allocated_types = [lt for lt in leave_types if lt['requires_allocation'] == 'yes']
+    if not allocated_types:
+        return
+    print("\n📋 Creating leave allocations...")
+
+    def validate(ids, _batch):
+        client.execute('hr.leave.allocation', 'action_validate', ids, context=CREATE_CONTEXT)
+
+    vals_list = []
+    for employee_id, profile in employees:
+        for year in range(max(date_from, profile['hire_date']).year, date_to.year + 1):
+            vals_list.extend({
+                'name': f'{leave_type["name"]} {year}',
+                'employee_id': employee_id,
+                'holiday_status_id': leave_type['id'],
+                'number_of_days': 30,
+                'date_from': f'{year}-01-01',
+                'date_to': f'{year}-12-31',
+            } for leave_type in allocated_types)
+    client.create('hr.leave.allocation', vals_list, context=CREATE_CONTEXT, then=validate)
+
+
+def apply_leave_states(client, ids, batch, states):
+    """Leaves are created as requests; move each batch to its planned state in at most two calls"""
+    by_state = defaultdict(list)
+    for leave_id, vals in zip(ids, batch):
+        by_state[states[vals['employee_id'], vals['request_date_from']]].append(leave_id)
+    if by_state['validate']:
+        client.execute('hr.leave', 'action_validate', by_state['validate'], context=CREATE_CONTEXT)
+    if by_state['refuse']:
+        client.execute('hr.leave', 'action_refuse', by_state['refuse'], context=CREATE_CONTEXT)
+
+
+def create_history(client, args, employees, leave_types, date_from, date_to):
+    """Leaves, attendance, payslips and reviews, a group of employees at a time to bound memory"""
+    print("\n⏰ Creating leaves, attendance, payslips and reviews...")
+    today = date.today()
+    tz = ZoneInfo(args.tz)
+    with_payslips = model_installed(client, 'hr.payroll.slip')
+    if not with_payslips:
+        print("   ⏭️  dayflow_payroll is not installed: skipping payslips")
+    # Leaves are planned a little past the window so that some requests are still pending
+    leave_horizon = date_to + timedelta(days=60)
+    # ~250 workdays per employee and year: a group fills a few dozen attendance batches
+    group_size = max(1, args.batch_size // 50)
+
+    for start in range(0, len(employees), group_size):
+        leaves, leave_states, attendances, payslips, reviews = [], {}, [], [], []
+        for number, (employee_id, profile) in enumerate(employees[start:start + group_size], start):
+            leave_days = set()
+            for leave_type, first, last, state in plan_leaves(
+                    args.seed, number, profile, leave_types, date_from, leave_horizon, today):
+                leave_days.update(workdays(first, last))
+                leave_states[employee_id, str(first)] = state
+                leaves.append({
+                    'employee_id': employee_id,
+                    'holiday_status_id': leave_type['id'],
+                    'request_date_from': str(first),
+                    'request_date_to': str(last),
+                    'name': f'{leave_type["name"]} - {profile["name"]}',
+                    'leave_reason': leave_type['name'],
+                })
+            attendances.extend({'employee_id': employee_id, 'check_in': check_in, 'check_out': check_out}
+                               for check_in, check_out in plan_attendance(
+                                   args.seed, number, profile, leave_days, date_from, date_to, tz))
+            if with_payslips:
+                payslips.extend(plan_payslips(employee_id, profile, date_from, date_to, today))
+            reviews.extend(plan_reviews(args.seed, number, employee_id, profile, date_from, date_to, today))
+
+        # Queued without waiting: the next group is planned while these batches are written
+        client.create('hr.leave', leaves, context=CREATE_CONTEXT, wait=False,
+                      then=lambda ids, batch, states=leave_states: apply_leave_states(client, ids, batch, states))
+        client.create('hr.attendance', attendances, context=CREATE_CONTEXT, wait=False)
+        if payslips:
+            client.create('hr.payroll.slip', payslips, context=CREATE_CONTEXT, wait=False)
+        client.create('hr.performance.review', reviews, context=CREATE_CONTEXT, wait=False)
+        print(f"   … {min(start + group_size, len(employees)):,}/{len(employees):,} employees queued")
+    client.drain()
+
+
+def plan_payslips(employee_id, profile, date_from, date_to, today):
+    slips = []
+    for first, last in months(max(date_from, profile['hire_date']), date_to):
+        # 5% raise per year since the start of the window
+        basic = profile['annual_salary'] / 12 * 1.05 ** ((first - date_from).days // 365)
+        slips.append({
+            'name': f'Payslip - {profile["name"]} - {first:%B %Y}',
+            'employee_id': employee_id,
+            'date': str(last),
+            'basic_wage': round(basic, 2),
+            'allowances': round(basic * 0.55, 2),
+            'deductions': round(basic * 0.17 + 200, 2),
+            'state': 'paid' if last < today else 'draft',
+        })
+    return slips
+
+
+def plan_reviews(seed, number, employee_id, profile, date_from, date_to, today):
+    rng = random.Random(f'{seed}:review:{number}')
+    reviews = []
+    for first, last in quarters(max(date_from, profile['hire_date']), date_to):
+        vals = {
+            'name': f'Q{(first.month - 1) // 3 + 1} {first.year} Performance Review - {profile["name"]}',
+            'employee_id': employee_id,
+            'review_period': 'quarterly',
+            'date_from': str(first),
+            'date_to': str(last),
+            'review_date': str(min(last, today)),
+            'state': 'draft',
+        }
+        if last < today:
+            vals.update({field: str(min(max(round(rng.gauss(profile['performance'], 0.7)), 1), 5))
+                         for field in RATING_FIELDS}, state='acknowledged')
+        reviews.append(vals)
+    return reviews
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--employees', type=int, default=1000)
+    parser.add_argument('--years', type=float, default=1, help='history length, ending yesterday')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--workers', type=int, default=4, help='parallel RPC connections')
+    parser.add_argument('--batch-size', type=int, default=2000, help='records per create call')
+    parser.add_argument('--tz', default='Asia/Kolkata', help='timezone of the generated punch times')
+    parser.add_argument('--with-users', type=int, default=0, metavar='N',
+                        help=f'give the first N employees a login (password "{LOAD_USER_PASSWORD}") for load_test.py')
+    args = parser.parse_args()
+
+    date_to = date.today() - timedelta(days=1)
+    date_from = date_to - timedelta(days=round(365 * args.years) - 1)
+
+    print("=" * 60)
+    print("🏭 Dayflow HRMS - Synthetic Load Data Generator")
+    print("=" * 60)
+    print(f"   {args.employees:,} employees, {date_from} → {date_to}, seed {args.seed}, "
+          f"{args.workers} workers × {args.batch_size} records")
+
+    client = OdooClient(workers=args.workers, batch_size=args.batch_size)
+    client.connect()
+
+    # Employee e-mails carry the seed: refuse to generate the same data set twice
+    if client.execute('hr.employee', 'search_count', [['work_email', '=like', f'%@seed{args.seed}.dayflow.test']]):
+        raise SystemExit(f"❌ Data for seed {args.seed} already exists; use another --seed or a fresh database.")
+
+    try:
+        departments = ensure_departments(client)
+        leave_types = get_leave_types(client)
+        employees = create_employees(client, args, departments, date_from)
+        if args.with_users:
+            create_users(client, employees, args.with_users)
+        create_allocations(client, employees, leave_types, date_from, date_to)
+        create_history(client, args, employees, leave_types, date_from, date_to)
+    finally:
+        client.close()
+        client.print_stats()
+
+    print("\n✅ Load data generation complete!")
+
+
+if __name__ == '__main__':
+    main()
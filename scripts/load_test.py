@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+Load Test for Dayflow HRMS
+Replays what the React frontend does, with many virtual users against a local Odoo:
+
+- token session (/dayflow/api/session), as on login
+- dashboard load, every --dashboard-every seconds
+- check-in at the start of the run, check-out at the end
+- leave requests, on average one per --leave-every seconds
+- notification polling every --poll-every seconds (30s in the frontend)
+
+Each virtual user is a thread with its own keep-alive HTTP connection, logged in as its
+own employee's user (generate_load_data.py --with-users). With --as-admin, every virtual
+user goes through the admin login instead: per-user caches and the single admin feed make
+those latencies optimistic, and the report says so. Reports throughput, errors and
+p50/p95/p99 latency per endpoint.
+
+Example:
+    python generate_load_data.py --employees 1000 --seed 42 --with-users 200
+    python load_test.py --users 200 --duration 600 --ramp-up 60 --seed 42 --cleanup
+"""
+
+import argparse
+import http.client
+import json
+import random
+import threading
+import time
+from collections import defaultdict
+from datetime import date, datetime, timedelta, timezone
+from urllib.parse import urlsplit
+
+from generate_load_data import LOAD_USER_PASSWORD
+from odoo_client import ODOO_DB, ODOO_PASSWORD, ODOO_URL, ODOO_USERNAME, OdooClient
+
+LEAVE_NAME = 'Load test'
+ENDPOINTS = ['session', 'dashboard', 'check_in', 'leave_request', 'notifications', 'check_out']
+
+
+class OdooError(Exception):
+    """The server answered with a JSON-RPC error"""
+
+
+class Recorder:
+    """Latencies and errors per endpoint, shared by every virtual user"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(lambda: defaultdict(int))
+
+    def record(self, endpoint, seconds, error=None):
+        with self.lock:
+            if error is None:
+                self.latencies[endpoint].append(seconds)
+            else:
+                self.errors[endpoint][error] += 1
+
+    def summary(self, elapsed):
+        rows = {}
+        for endpoint in ENDPOINTS:
+            latencies = sorted(self.latencies[endpoint])
+            errors = sum(self.errors[endpoint].values())
+            if not latencies and not errors:
+                continue
+            rows[endpoint] = {
+                'requests': len(latencies) + errors,
+                'errors': errors,
+                'throughput': (len(latencies) + errors) / elapsed,
+                'p50': percentile(latencies, 50),
+                'p95': percentile(latencies, 95),
+                'p99': percentile(latencies, 99),
+                'max': latencies[-1] if latencies else None,
+            }
+        return rows
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of sorted ``values``, in milliseconds"""
+    if not values:
+        return None
+    return 1000 * values[max(0, -(-len(values) * pct // 100) - 1)]
+
+
+class VirtualUser(threading.Thread):
+
+    def __init__(self, number, employee_id, uid, password, args, recorder, stop):
+        super().__init__(name=f'vu-{number}', daemon=True)
+        self.number = number
+        self.employee_id = employee_id
+        self.uid = uid
+        self.password = password
+        self.args = args
+        self.recorder = recorder
+        self.stop = stop
+        self.rng = random.Random(f'{args.seed}:vu:{number}')
+        url = urlsplit(args.url)
+        connection_class = http.client.HTTPSConnection if url.scheme == 'https' else http.client.HTTPConnection
+        self.connection = connection_class(url.netloc, timeout=args.timeout)
+        self.token = None
+        self.attendance_id = None
+        # Leave requests go far enough in the future not to collide with the load data set
+        self.next_leave_day = date.today() + timedelta(days=120 + self.rng.randint(0, 6))
+        self.leave_ids = []
+
+    # HTTP
+
+    def post(self, endpoint, path, params):
+        headers = {'Content-Type': 'application/json'}
+        if self.token:
+            headers['Authorization'] = f'Bearer {self.token}'
+        payload = json.dumps({'jsonrpc': '2.0', 'method': 'call', 'params': params, 'id': self.number})
+        started = time.perf_counter()
+        try:
+            self.connection.request('POST', path, body=payload, headers=headers)
+            response = self.connection.getresponse()
+            body = response.read()
+            if response.status != 200:
+                raise OdooError(f'HTTP {response.status}')
+            data = json.loads(body)
+            if data.get('error'):
+                error = data['error']
+                raise OdooError(error.get('data', {}).get('name') or error['message'])
+        except OdooError as e:
+            self.recorder.record(endpoint, time.perf_counter() - started, str(e))
+            return None
+        except (OSError, http.client.HTTPException) as e:
+            self.connection.close()
+            self.recorder.record(endpoint, time.perf_counter() - started, type(e).__name__)
+            return None
+        self.recorder.record(endpoint, time.perf_counter() - started)
+        return data['result']
+
+    def call(self, endpoint, model, method, args=(), kwargs=None):
+        return self.post(endpoint, '/dayflow/api/call', {
+            'model': model, 'method': method, 'args': list(args), 'kwargs': kwargs or {},
+        })
+
+    # Frontend actions
+
+    def login(self):
+        session = self.post('session', '/dayflow/api/session', {'uid': self.uid, 'password': self.password})
+        self.token = session and session['token']
+        return bool(self.token)
+
+    def dashboard(self):
+        self.call('dashboard', 'dayflow.dashboard', 'get_dashboard_data', kwargs={'days': 7})
+
+    def check_in(self):
+        self.attendance_id = self.call('check_in', 'hr.attendance', 'create', [{
+            'employee_id': self.employee_id,
+            'check_in': datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S'),
+        }])
+
+    def check_out(self):
+        if self.attendance_id:
+            self.call('check_out', 'hr.attendance', 'write', [[self.attendance_id], {
+                'check_out': datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S'),
+            }])
+
+    def leave_request(self):
+        day = self.next_leave_day
+        while day.weekday() >= 5:
+            day += timedelta(days=1)
+        self.next_leave_day = day + timedelta(days=self.rng.randint(7, 21))
+        leave_id = self.call('leave_request', 'hr.leave', 'create', [{
+            'employee_id': self.employee_id,
+            'holiday_status_id': self.args.leave_type_id,
+            'date_from': f'{day} 07:00:00',
+            'date_to': f'{day} 16:00:00',
+            'name': LEAVE_NAME,
+        }])
+        if leave_id:
+            self.leave_ids.append(leave_id)
+
+    def poll_notifications(self, cursor):
+        feed = self.call('notifications', 'dayflow.notification', 'get_feed', kwargs={'since': cursor})
+        return feed['cursor'] if feed else cursor
+
+    def run(self):
+        if not self.login():
+            return
+        self.dashboard()
+        self.check_in()
+        cursor = self.poll_notifications(0)
+        now = time.monotonic()
+        # Spread the periodic calls so that users started together do not poll in lockstep
+        next_poll = now + self.rng.uniform(0, self.args.poll_every)
+        next_dashboard = now + self.rng.uniform(0, self.args.dashboard_every)
+        next_leave = now + self.rng.expovariate(1 / self.args.leave_every)
+        while not self.stop.is_set():
+            now = time.monotonic()
+            if now >= next_poll:
+                cursor = self.poll_notifications(cursor)
+                next_poll += self.args.poll_every
+            if now >= next_dashboard:
+                self.dashboard()
+                next_dashboard += self.args.dashboard_every
+            if now >= next_leave:
+                self.leave_request()
+                next_leave += self.rng.expovariate(1 / self.args.leave_every)
+            self.stop.wait(max(0.0, min(next_poll, next_dashboard, next_leave) - time.monotonic()))
+        self.check_out()
+        self.connection.close()
+
+
+def pick_employees(client, args):
+    """(employee id, user id) of employees with no open attendance, from the load data set of
+    ``--seed`` if given; only employees with their own login unless ``--as-admin``"""
+    domain = [['work_email', '=like', f'%@seed{args.seed}.dayflow.test']] if args.seed is not None else []
+    if not args.as_admin:
+        domain.append(['user_id', '!=', False])
+    checked_in = {attendance['employee_id'][0] for attendance in client.search_read(
+        'hr.attendance', [['check_out', '=', False]], ['employee_id'])}
+    employees = [(employee['id'], employee['user_id'] and employee['user_id'][0])
+                 for employee in client.search_read('hr.employee', domain, ['user_id'], order='id')
+                 if employee['id'] not in checked_in]
+    return employees[:args.users]
+
+
+def print_report(rows, elapsed, users, shared_login):
+    print(f"\n📊 {users} virtual users, {elapsed:.0f}s")
+    if shared_login:
+        print("   ⚠ Every virtual user shared the admin login: per-user caches (dashboard) were hot and")
+        print("     one notification feed was polled, so these latencies are optimistic")
+    print(f"   {'Endpoint':<16} {'Requests':>9} {'Errors':>7} {'Req/s':>8} {'p50 ms':>8} {'p95 ms':>8} "
+          f"{'p99 ms':>8} {'Max ms':>8}")
+
+    def fmt(value):
+        return f"{value:>8.0f}" if value is not None else f"{'-':>8}"
+
+    for endpoint, row in rows.items():
+        print(f"   {endpoint:<16} {row['requests']:>9,} {row['errors']:>7,} {row['throughput']:>8.1f} "
+              f"{fmt(row['p50'])} {fmt(row['p95'])} {fmt(row['p99'])} {fmt(row['max'])}")
+    total = sum(row['requests'] for row in rows.values())
+    print(f"   {'Total':<16} {total:>9,} {sum(row['errors'] for row in rows.values()):>7,} {total / elapsed:>8.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--url', default=ODOO_URL, help=f'Odoo URL (default: {ODOO_URL})')
+    parser.add_argument('--password', default=ODOO_PASSWORD, help='Admin password')
+    parser.add_argument('--user-password', default=LOAD_USER_PASSWORD,
+                        help=f'Password of the employee logins (default: {LOAD_USER_PASSWORD})')
+    parser.add_argument('--as-admin', action='store_true',
+                        help='Run every virtual user through the admin login (employees without logins)')
+    parser.add_argument('--users', type=int, default=50, help='Virtual users (default: 50)')
+    parser.add_argument('--duration', type=int, default=300, help='Seconds of steady load (default: 300)')
+    parser.add_argument('--ramp-up', type=int, default=30, help='Seconds to start every user (default: 30)')
+    parser.add_argument('--poll-every', type=float, default=30, help='Notification polling period (default: 30)')
+    parser.add_argument('--dashboard-every', type=float, default=120, help='Dashboard reload period (default: 120)')
+    parser.add_argument('--leave-every', type=float, default=300, help='Mean seconds between leave requests (default: 300)')
+    parser.add_argument('--seed', type=int, help='Only use employees of this generate_load_data.py seed')
+    parser.add_argument('--timeout', type=float, default=60, help='HTTP timeout in seconds (default: 60)')
+    parser.add_argument('--output', help='Also write the results as JSON to this file')
+    parser.add_argument('--cleanup', action='store_true', help='Delete the attendances and leaves created by the run')
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("🔥 Dayflow HRMS Load Test")
+    print("=" * 60)
+
+    client = OdooClient(url=args.url, db=ODOO_DB, username=ODOO_USERNAME, password=args.password)
+    try:
+        uid = client.connect()
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        return
+
+    employees = pick_employees(client, args)
+    if not employees:
+        print("❌ No employee with a login is free to check in: run generate_load_data.py --with-users, "
+              "or pass --as-admin")
+        return
+    if len(employees) < args.users:
+        print(f"⚠ Only {len(employees)} employees are free to check in, running with that many users")
+    leave_types = client.search_read('hr.leave.type', [['requires_allocation', '=', 'no']], ['id', 'name'], limit=1) \
+        or client.search_read('hr.leave.type', [], ['id', 'name'], limit=1)
+    args.leave_type_id = leave_types[0]['id']
+    print(f"✓ {len(employees)} virtual users, leave type '{leave_types[0]['name']}'\n")
+
+    recorder = Recorder()
+    stop = threading.Event()
+    if args.as_admin:
+        logins = [(employee_id, uid, args.password) for employee_id, _user_id in employees]
+    else:
+        logins = [(employee_id, user_id, args.user_password) for employee_id, user_id in employees]
+    users = [VirtualUser(number, employee_id, user_id, password, args, recorder, stop)
+             for number, (employee_id, user_id, password) in enumerate(logins)]
+    print(f"🚀 Ramping up over {args.ramp_up}s, then {args.duration}s of load...")
+    started = time.monotonic()
+    for user in users:
+        user.start()
+        stop.wait(args.ramp_up / max(len(users), 1))
+    try:
+        stop.wait(args.duration)
+    except KeyboardInterrupt:
+        print("\n⏹  Interrupted, stopping the virtual users...")
+    stop.set()
+    for user in users:
+        user.join()
+    elapsed = time.monotonic() - started
+
+    rows = recorder.summary(elapsed)
+    print_report(rows, elapsed, len(users), args.as_admin)
+    for endpoint, errors in recorder.errors.items():
+        for message, count in sorted(errors.items(), key=lambda item: -item[1])[:3]:
+            print(f"   ⚠ {endpoint}: {count} × {message}")
+    if args.output:
+        with open(args.output, 'w') as output:
+            json.dump({'users': len(users), 'shared_login': args.as_admin, 'elapsed': elapsed,
+                       'endpoints': rows}, output, indent=2)
+        print(f"\n💾 Results written to {args.output}")
+
+    if args.cleanup:
+        attendance_ids = [user.attendance_id for user in users if user.attendance_id]
+        leave_ids = [leave_id for user in users for leave_id in user.leave_ids]
+        client.unlink('hr.attendance', attendance_ids)
+        if leave_ids:
+            client.execute('hr.leave', 'purge_leaves', [['id', 'in', leave_ids]])
+        print(f"\n🧹 Deleted {len(attendance_ids)} attendances and {len(leave_ids)} leave requests")
+    client.close()
+
+
+if __name__ == '__main__':
+    main()
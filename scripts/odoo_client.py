@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Shared XML-RPC client for the Dayflow maintenance scripts
+
+- One connection per thread, kept alive between calls
+- create / write / unlink split into batches that run on a thread pool
+- Retry with exponential backoff on dropped connections and concurrency errors
+- Per (model, method) timing stats, printed with print_stats()
+
+Example:
+    from odoo_client import OdooClient
+
+    with OdooClient(workers=8) as client:
+        ids = client.create('hr.attendance', vals_list)
+        client.write('hr.attendance', ids, {'remarks': 'Imported'})
+"""
+
+import http.client
+import random
+import threading
+import time
+import xmlrpc.client
+from collections import defaultdict
+from concurrent.futures import ALL_COMPLETED, FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+ODOO_URL = 'http://localhost:8069'
+ODOO_DB = 'dayflow_db'
+ODOO_USERNAME = 'admin'
+ODOO_PASSWORD = 'admin'
+
+# Server errors worth retrying: the transaction was rolled back, nothing was written
+RETRYABLE_FAULTS = ('could not serialize access', 'concurrent update', 'deadlock detected')
+
+
+class OdooClient:
+    """Pooled, batching XML-RPC client (thread-safe)"""
+
+    def __init__(self, url=ODOO_URL, db=ODOO_DB, username=ODOO_USERNAME, password=ODOO_PASSWORD,
+                 workers=4, batch_size=500, retries=3, backoff=0.5):
+        self.url = url
+        self.db = db
+        self.username = username
+        self.password = password
+        self.batch_size = batch_size
+        self.retries = retries
+        self.backoff = backoff
+        self.uid = None
+        self.workers = workers
+        self.pool = ThreadPoolExecutor(max_workers=workers)
+        # At most two batches queued per worker, so huge inputs are not all in memory as requests
+        self.max_pending = workers * 2
+        self.pending = set()
+        self.local = threading.local()
+        self.stats_lock = threading.Lock()
+        self.stats = defaultdict(lambda: {'calls': 0, 'records': 0, 'seconds': 0.0, 'max': 0.0, 'retries': 0})
+        self.started = time.perf_counter()
+
+    def __enter__(self):
+        self.connect()
+        return self
+
+    def __exit__(self, *exc):
+        self.close(wait=exc[0] is None)
+
+    def connect(self):
+        common = xmlrpc.client.ServerProxy(f'{self.url}/xmlrpc/2/common')
+        self.uid = common.authenticate(self.db, self.username, self.password, {})
+        if not self.uid:
+            raise RuntimeError('Authentication failed! Check your credentials.')
+        return self.uid
+
+    def close(self, wait=True):
+        try:
+            if wait:
+                self.drain()
+        finally:
+            self.pool.shutdown(wait=wait, cancel_futures=not wait)
+
+    # Calls
+
+    def _proxy(self):
+        # ServerProxy is not thread-safe; its transport keeps the HTTP/1.1 connection open
+        if not hasattr(self.local, 'models'):
+            self.local.models = xmlrpc.client.ServerProxy(f'{self.url}/xmlrpc/2/object', allow_none=True)
+        return self.local.models
+
+    def _retryable(self, error, idempotent):
+        if isinstance(error, xmlrpc.client.Fault):
+            return any(message in error.faultString for message in RETRYABLE_FAULTS)
+        if isinstance(error, xmlrpc.client.ProtocolError):
+            return error.errcode in (502, 503, 504)
+        # The connection dropped: the call may or may not have run on the server
+        return idempotent and isinstance(error, (ConnectionError, http.client.HTTPException, OSError))
+
+    def execute(self, model, method, *args, idempotent=True, records=0, **kwargs):
+        """execute_kw with retries; ``idempotent=False`` calls are only retried when the server rolled back"""
+        for attempt in range(self.retries + 1):
+            started = time.perf_counter()
+            try:
+                result = self._proxy().execute_kw(self.db, self.uid, self.password, model, method, list(args), kwargs)
+            except Exception as error:
+                if attempt == self.retries or not self._retryable(error, idempotent):
+                    raise
+                self.local.__dict__.pop('models', None)
+                self._record(model, method, 0, time.perf_counter() - started, retry=True)
+                time.sleep(self.backoff * 2 ** attempt * random.uniform(0.5, 1.5))
+                continue
+            self._record(model, method, records, time.perf_counter() - started)
+            return result
+
+    def search_read(self, model, domain=None, fields=None, **kwargs):
+        return self.execute(model, 'search_read', domain or [], fields=fields or [], **kwargs)
+
+    def search(self, model, domain=None, **kwargs):
+        return self.execute(model, 'search', domain or [], **kwargs)
+
+    # Batched writes
+
+    def submit(self, function, *args, **kwargs):
+        """Run ``function`` on the pool; blocks while too many calls are queued"""
+        while len(self.pending) >= self.max_pending:
+            self._wait(FIRST_COMPLETED)
+        future = self.pool.submit(function, *args, **kwargs)
+        self.pending.add(future)
+        return future
+
+    def drain(self):
+        """Wait for every submitted call; re-raises the first error"""
+        if self.pending:
+            self._wait(ALL_COMPLETED)
+
+    def _wait(self, return_when):
+        done, self.pending = wait(self.pending, return_when=return_when)
+        for future in done:
+            future.result()
+
+    def map(self, function, iterable):
+        """Like the builtin map, on the thread pool"""
+        return [future.result() for future in [self.submit(function, item) for item in iterable]]
+
+    def batches(self, items, batch_size=None):
+        size = batch_size or self.batch_size
+        return [items[start:start + size] for start in range(0, len(items), size)]
+
+    def _create_batch(self, model, batch, context, then):
+        ids = self.execute(model, 'create', batch, idempotent=False, records=len(batch), context=context or {})
+        if then:
+            then(ids, batch)
+        return ids
+
+    def create(self, model, vals_list, context=None, then=None, batch_size=None, wait=True):
+        """Multi-create ``vals_list``; ``then(ids, batch)`` runs on the worker after each batch.
+
+        Returns the ids in input order, or the batch futures with ``wait=False``.
+        """
+        futures = [self.submit(self._create_batch, model, batch, context, then)
+                   for batch in self.batches(vals_list, batch_size)]
+        if not wait:
+            return futures
+        return [record_id for future in futures for record_id in future.result()]
+
+    def write(self, model, ids, vals, context=None, batch_size=None, wait=True):
+        futures = [self.submit(self.execute, model, 'write', batch, vals, records=len(batch), context=context or {})
+                   for batch in self.batches(list(ids), batch_size)]
+        if wait:
+            for future in futures:
+                future.result()
+        return futures
+
+    def unlink(self, model, ids, context=None, batch_size=None, wait=True):
+        futures = [self.submit(self.execute, model, 'unlink', batch, records=len(batch), context=context or {})
+                   for batch in self.batches(list(ids), batch_size)]
+        if wait:
+            for future in futures:
+                future.result()
+        return futures
+
+    # Stats
+
+    def _record(self, model, method, records, seconds, retry=False):
+        with self.stats_lock:
+            stat = self.stats[model, method]
+            stat['calls'] += 1
+            stat['records'] += records
+            stat['seconds'] += seconds
+            stat['max'] = max(stat['max'], seconds)
+            stat['retries'] += retry
+
+    def print_stats(self):
+        elapsed = time.perf_counter() - self.started
+        print(f"\n📊 {'Call':<40} {'Calls':>7} {'Avg ms':>8} {'Max ms':>8} {'Retries':>7} {'Records':>11} {'Rec/s':>8}")
+        for (model, method), stat in sorted(self.stats.items(), key=lambda item: -item[1]['seconds']):
+            rate = f"{stat['records'] / stat['seconds']:>8,.0f}" if stat['records'] and stat['seconds'] else f"{'':>8}"
+            print(f"   {model + '.' + method:<40} {stat['calls']:>7,} {1000 * stat['seconds'] / stat['calls']:>8.1f} "
+                  f"{1000 * stat['max']:>8.1f} {stat['retries']:>7} {stat['records']:>11,} {rate}")
+        total = sum(stat['records'] for stat in self.stats.values())
+        print(f"   {'Wall clock':<40} {elapsed:>7.1f}s{'':>26}{total:>11,} {total / elapsed if elapsed else 0:>8,.0f}")